@@ -7,7 +7,10 @@ Jump King 遊戲設定檔案
 # 視窗設定
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 900
-FPS = 60
+FPS = 60  # 物理固定更新頻率（每秒更新次數）
+RENDER_FPS = 144  # 畫面更新上限，0 表示不限制
+MAX_FRAME_TIME = 0.25  # 單幀最多補算的時間（秒），機器太慢時寧可掉幀
+RENDER_INTERPOLATION = True  # 在兩次物理更新之間插值繪製玩家與相機
 
 # 顏色定義
 WHITE = (255, 255, 255)
@@ -30,6 +33,20 @@ JUMP_CHARGE_RATE = 0.3
 MAX_JUMP_POWER = 20
 MIN_JUMP_POWER = 5
 
+# 第11關掉落陷阱
+FALL_TRAP_ZONES = [
+    (90, 160),  # 第一個危險區域
+    (240, 310),  # 第二個危險區域
+    (490, 560),  # 第三個危險區域
+    (740, 810),  # 第四個危險區域
+]
+FALL_TRAP_CHANCE = 0.15  # 15%機率
+
+# 碰撞設定
+COLLISION_CELL_SIZE = 100  # 平台空間網格的格子大小（像素）
+SWEPT_COLLISION = True  # 連續碰撞檢測，避免高速穿過薄平台
+DEATH_ZONE_TALL_HEIGHT = 200  # 高於此值的死亡區域（例如邊界牆）不放進排序索引
+
 # 遊戲狀態
 MENU = 0
 PLAYING = 1
@@ -39,6 +56,17 @@ VICTORY = 4
 
 # 關卡設定
 TOTAL_LEVELS = 11
+LEVEL_HOT_RELOAD = False  # 開發模式：修改關卡檔案後遊戲中直接重新載入（保留玩家位置）
+LEVEL_RELOAD_INTERVAL = 0.5  # 檢查關卡檔案的間隔（秒）
+
+# 繪製設定
+STATIC_LEVEL_LAYER = True  # 牆壁、平台與死亡區域進入關卡時先畫成圖塊，每幀只貼上圖塊
+LEVEL_LAYER_TILE_HEIGHT = SCREEN_HEIGHT  # 圖塊高度，畫面最多跨兩個圖塊
+LEVEL_LAYER_MAX_TILES = 8  # 快取的圖塊數量上限，超過時移除離畫面最遠的
+# 全屏縮放方式："nearest" 最近點縮放、"integer" 只用整數倍放大（像素銳利，四周留黑邊）、
+# "smooth" 平滑縮放
+FULLSCREEN_SCALE_MODE = "nearest"
+TEXT_CACHE_SIZE = 256  # 文字快取的 Surface 數量上限，超過時移除最久沒用到的
 
 # 檔案路徑
 SAVE_FILE = "jumpking_save.json"
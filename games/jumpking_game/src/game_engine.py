@@ -6,6 +6,8 @@ Jump King 遊戲引擎
 import pygame
 import sys
 import os
+import math
+import time
 
 # 添加必要的路徑
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -37,6 +39,11 @@ class Game:
         self.ui_scale_y = 1.0
         self.ui_scale = 1.0
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # 全屏時的虛擬畫布與螢幕上的縮放目的地，只在切換全屏時重建
+        self.virtual_screen = None
+        self.scaled_screen = None
+        self.letterbox_rects = []  # 畫布周圍的黑邊
+        self.smooth_scale = False
         pygame.display.set_caption("Jump King - 十一關挑戰")
         self.clock = pygame.time.Clock()
         self.running = True
@@ -51,6 +58,9 @@ class Game:
         self.ui_manager = UIManager()
         self.renderer = Renderer(SCREEN_WIDTH, SCREEN_HEIGHT)
         self.player = None
+        self.compiled_level = None  # 目前關卡的編譯結果
+        self.next_level_reload_check = 0  # 開發模式下次檢查關卡檔案的時間
+        self.render_alpha = 1.0  # 目前畫面位於兩次物理更新之間的比例
 
         # 選單狀態
         self.menu_selection = 0
@@ -65,10 +75,13 @@ class Game:
             self.screen_width = info.current_w
             self.screen_height = info.current_h
             self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            # 以實際取得的全屏大小為準（可能與桌面解析度不同）
+            self.screen_width, self.screen_height = self.screen.get_size()
             # 計算UI縮放比例
             self.ui_scale_x = self.screen_width / SCREEN_WIDTH
             self.ui_scale_y = self.screen_height / SCREEN_HEIGHT
             self.ui_scale = min(self.ui_scale_x, self.ui_scale_y)
+            self.build_fullscreen_canvas()
         else:
             self.screen_width = SCREEN_WIDTH
             self.screen_height = SCREEN_HEIGHT
@@ -76,11 +89,57 @@ class Game:
             self.ui_scale_x = 1.0
             self.ui_scale_y = 1.0
             self.ui_scale = 1.0
+            self.virtual_screen = None
+            self.scaled_screen = None
+            self.letterbox_rects = []
 
         # 重新載入字體
         self.ui_manager.load_fonts()
         pygame.display.set_caption("Jump King - 十一關挑戰")
 
+    def build_fullscreen_canvas(self):
+        """
+        建立全屏用的虛擬畫布，以及螢幕上置中的縮放目的地（螢幕的子表面）
+        畫布與螢幕像素格式相同，每幀直接縮放進螢幕，不再配置新的 Surface
+        整數倍模式把縮放比例降到整數（螢幕比畫布小時仍然縮小）
+        """
+        if FULLSCREEN_SCALE_MODE == "integer" and self.ui_scale >= 1:
+            self.ui_scale = math.floor(self.ui_scale)
+        scaled_width = int(SCREEN_WIDTH * self.ui_scale)
+        scaled_height = int(SCREEN_HEIGHT * self.ui_scale)
+        offset_x = (self.screen_width - scaled_width) // 2
+        offset_y = (self.screen_height - scaled_height) // 2
+        scaled_rect = pygame.Rect(offset_x, offset_y, scaled_width, scaled_height)
+
+        self.virtual_screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.scaled_screen = self.screen.subsurface(scaled_rect)
+        # 平滑縮放只支援 24／32 位元的表面
+        self.smooth_scale = (
+            FULLSCREEN_SCALE_MODE == "smooth" and self.screen.get_bitsize() in (24, 32)
+        )
+
+        screen_rect = self.screen.get_rect()
+        self.letterbox_rects = [
+            rect
+            for rect in (
+                pygame.Rect(0, 0, screen_rect.width, scaled_rect.top),
+                pygame.Rect(
+                    0,
+                    scaled_rect.bottom,
+                    screen_rect.width,
+                    screen_rect.height - scaled_rect.bottom,
+                ),
+                pygame.Rect(0, scaled_rect.top, scaled_rect.left, scaled_height),
+                pygame.Rect(
+                    scaled_rect.right,
+                    scaled_rect.top,
+                    screen_rect.width - scaled_rect.right,
+                    scaled_height,
+                ),
+            )
+            if rect.width > 0 and rect.height > 0
+        ]
+
     def start_level(self, level_num):
         """開始指定關卡"""
         level_data = self.level_manager.get_level(level_num)
@@ -92,12 +151,18 @@ class Game:
         start_x, start_y = level_data["start_pos"]
         self.player = Player(start_x, start_y)
 
+        # 關卡載入時取得編譯後的關卡（含平台空間網格與死亡區域索引）
+        self.compiled_level = self.level_manager.get_compiled_level(level_num)
+
         # 確保玩家正確地站在起始平台上
         self.player.on_ground = True
         self.player.vel_x = 0
         self.player.vel_y = 0
 
-        self.renderer.camera_y = 0
+        self.renderer.reset_camera()
+        if STATIC_LEVEL_LAYER:
+            # 進入關卡時先畫好靜態圖層
+            self.renderer.get_level_layer(self.compiled_level)
         self.state = PLAYING
 
         # 初始化關卡統計
@@ -126,6 +191,9 @@ class Game:
         self.state = VICTORY
         print(f"完成第{self.current_level}關！死亡次數: {deaths}")
 
+        # 顯示勝利畫面的同時在背景建立下一關
+        self.level_manager.preload_level(self.current_level + 1)
+
     def handle_menu_events(self, event):
         """處理主選單事件"""
         if event.type == pygame.KEYDOWN:
@@ -158,9 +226,11 @@ class Game:
 
     def handle_playing_events(self, event):
         """處理遊戲中的事件"""
+        # pygame 事件沒有時間戳記，以處理事件的時間作為按下/放開 SPACE 的時間
+        now = time.perf_counter()
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE:
-                self.player.start_jump_charge()
+                self.player.start_jump_charge(now)
             elif event.key == pygame.K_r:
                 # 重置玩家位置
                 self.player.reset_position()
@@ -175,11 +245,11 @@ class Game:
                 # 決定跳躍方向
                 keys = pygame.key.get_pressed()
                 if keys[pygame.K_LEFT]:
-                    self.player.execute_jump("left")
+                    self.player.execute_jump("left", now)
                 elif keys[pygame.K_RIGHT]:
-                    self.player.execute_jump("right")
+                    self.player.execute_jump("right", now)
                 else:
-                    self.player.execute_jump("up")
+                    self.player.execute_jump("up", now)
 
     def handle_events(self):
         """處理事件"""
@@ -219,24 +289,52 @@ class Game:
                 elif self.state == PLAYING:
                     self.handle_playing_events(event)
 
+    def check_level_reload(self):
+        """開發模式：定期檢查關卡檔案，目前的關卡有修改時換上新的關卡"""
+        now = time.perf_counter()
+        if now < self.next_level_reload_check:
+            return
+        self.next_level_reload_check = now + LEVEL_RELOAD_INTERVAL
+
+        changed = self.level_manager.reload_changed_levels()
+        if self.current_level not in changed:
+            return
+        level_data = self.level_manager.get_level(self.current_level)
+        if not level_data:
+            print(f"第{self.current_level}關的檔案已被刪除，保留原本的關卡")
+            return
+
+        # 碰撞索引、目標平台等都隨新的 CompiledLevel 重建，玩家留在原地，只更新重生點
+        self.compiled_level = self.level_manager.get_compiled_level(self.current_level)
+        self.player.start_x, self.player.start_y = level_data["start_pos"]
+        elapsed = (time.perf_counter() - now) * 1000
+        print(f"已重新載入第{self.current_level}關（{elapsed:.1f} ms）")
+
     def update_playing(self):
         """更新遊戲中的邏輯"""
         if not self.player:
             return
 
-        # 更新跳躍蓄力
+        if LEVEL_HOT_RELOAD:
+            self.check_level_reload()
+
+        # 更新跳躍蓄力（只影響蓄力條顯示，實際力量在放開 SPACE 時依按住的時間計算）
         keys = pygame.key.get_pressed()
         if keys[pygame.K_SPACE]:
-            self.player.update_jump_charge()
+            self.player.update_jump_charge(time.perf_counter())
 
         # 獲取當前關卡資料
-        level_data = self.level_manager.get_level(self.current_level)
-        if not level_data:
+        level = self.compiled_level
+        if not level:
             return
 
         # 更新玩家
         result = self.player.update(
-            level_data["platforms"], level_data["death_zones"], self.current_level
+            level.platforms,
+            level.death_zones,
+            self.current_level,
+            level.platform_grid,
+            level.death_zone_index,
         )
 
         # 檢查死亡
@@ -253,8 +351,11 @@ class Game:
             )
             self.save_manager.save_progress()
 
+        # 更新相機
+        self.renderer.update_camera(self.player)
+
         # 檢查是否完成關卡
-        if self.renderer.check_goal_completion(self.player, level_data):
+        if self.renderer.check_goal_completion(self.player, level):
             self.complete_level()
 
     def update(self):
@@ -266,9 +367,8 @@ class Game:
         """繪製畫面"""
         if self.fullscreen:
             # 全屏模式下，先繪製到虛擬畫布
-            virtual_screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.draw_content(virtual_screen)
-            self.scale_and_blit_virtual_screen(virtual_screen)
+            self.draw_content(self.virtual_screen)
+            self.scale_and_blit_virtual_screen()
         else:
             # 視窗模式直接繪製
             self.draw_content(self.screen)
@@ -291,9 +391,13 @@ class Game:
             )
         elif self.state == PLAYING:
             level_data = self.level_manager.get_level(self.current_level)
-            if level_data and self.player:
+            if level_data and self.compiled_level and self.player:
                 self.renderer.draw_game_scene(
-                    screen, level_data, self.player, self.current_level
+                    screen,
+                    self.compiled_level,
+                    self.player,
+                    self.current_level,
+                    self.render_alpha,
                 )
                 self.ui_manager.draw_playing_ui(
                     screen, self.current_level, level_data, self.player
@@ -304,32 +408,44 @@ class Game:
                 screen, self.current_level, level_data, self.player
             )
 
-    def scale_and_blit_virtual_screen(self, virtual_screen):
-        """縮放虛擬畫布並繪製到實際螢幕"""
-        # 縮放並居中顯示虛擬畫布
-        scaled_surface = pygame.transform.scale(
-            virtual_screen,
-            (int(SCREEN_WIDTH * self.ui_scale), int(SCREEN_HEIGHT * self.ui_scale)),
-        )
-
-        # 計算居中位置
-        offset_x = (self.screen_width - SCREEN_WIDTH * self.ui_scale) // 2
-        offset_y = (self.screen_height - SCREEN_HEIGHT * self.ui_scale) // 2
-
-        # 清除螢幕並繪製縮放後的畫面
-        self.screen.fill(BLACK)
-        self.screen.blit(scaled_surface, (offset_x, offset_y))
+    def scale_and_blit_virtual_screen(self):
+        """把虛擬畫布直接縮放到螢幕上預先配置的置中區域"""
+        for rect in self.letterbox_rects:
+            self.screen.fill(BLACK, rect)
+        target = self.scaled_screen
+        if self.smooth_scale:
+            pygame.transform.smoothscale(self.virtual_screen, target.get_size(), target)
+        else:
+            # 整數倍模式的縮放比例是整數，最近點縮放就是把每個像素放大成方塊
+            pygame.transform.scale(self.virtual_screen, target.get_size(), target)
 
     def run(self):
-        """主遊戲循環"""
+        """主遊戲循環：物理以固定頻率更新，畫面依機器能力繪製"""
         print("Jump King 遊戲啟動")
         print(f"已解鎖關卡: {self.save_manager.unlocked_levels}/{TOTAL_LEVELS}")
 
+        physics_step = 1.0 / FPS
+        accumulator = 0.0
+        last_time = time.perf_counter()
+
         while self.running:
+            now = time.perf_counter()
+            # 慢的幀靠多跑幾次物理補回來；卡頓過久才丟棄時間，避免越補越慢
+            accumulator += min(now - last_time, MAX_FRAME_TIME)
+            last_time = now
+
             self.handle_events()
-            self.update()
+
+            # 依累積的時間補跑固定步長的物理更新
+            while accumulator >= physics_step:
+                self.update()
+                accumulator -= physics_step
+
+            self.render_alpha = (
+                accumulator / physics_step if RENDER_INTERPOLATION else 1.0
+            )
             self.draw()
-            self.clock.tick(FPS)
+            self.clock.tick(RENDER_FPS)
 
         print("遊戲結束")
         self.save_manager.save_progress()
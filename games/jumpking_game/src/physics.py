@@ -0,0 +1,486 @@
+#!/usr/bin/env python3
+"""
+Jump King 物理核心
+不依賴 pygame 與 Game 實例的玩家物理
+遊戲中的 Player 與關卡工具、測試共用同一份邏輯，結果完全一致
+"""
+import math
+import random
+from collections import namedtuple
+
+from game_config import (
+    SCREEN_WIDTH,
+    FPS,
+    GRAVITY,
+    MAX_FALL_SPEED,
+    JUMP_CHARGE_RATE,
+    MAX_JUMP_POWER,
+    MIN_JUMP_POWER,
+    PLAYER_WIDTH,
+    PLAYER_HEIGHT,
+    SWEPT_COLLISION,
+    FALL_TRAP_ZONES,
+    FALL_TRAP_CHANCE,
+)
+from spatial_grid import PlatformGrid, DeathZoneIndex, RectRangeIndex
+
+
+# 關卡中的平台或死亡區域，右邊與底部在編譯時預先算好
+LevelRect = namedtuple("LevelRect", ("x", "y", "width", "height", "right", "bottom"))
+
+
+def compile_rect(rect_data):
+    """把關卡資料中的 {"x", "y", "width", "height"} 字典轉成 LevelRect"""
+    x = rect_data["x"]
+    y = rect_data["y"]
+    width = rect_data["width"]
+    height = rect_data["height"]
+    return LevelRect(x, y, width, height, x + width, y + height)
+
+
+def level_bounds(rects):
+    """涵蓋所有矩形的範圍，沒有矩形時回傳 None"""
+    if not rects:
+        return None
+    left = min(rect.x for rect in rects)
+    top = min(rect.y for rect in rects)
+    right = max(rect.right for rect in rects)
+    bottom = max(rect.bottom for rect in rects)
+    return LevelRect(left, top, right - left, bottom - top, right, bottom)
+
+
+class PlayerState:
+    """無畫面模擬用的玩家狀態，欄位名稱與 Player 相同"""
+
+    __slots__ = (
+        "x",
+        "y",
+        "vel_x",
+        "vel_y",
+        "on_ground",
+        "jump_charging",
+        "jump_power",
+        "facing_right",
+        "start_x",
+        "start_y",
+        "death_count",
+        "jump_charge_ticks",
+    )
+
+    width = PLAYER_WIDTH
+    height = PLAYER_HEIGHT
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.vel_x = 0
+        self.vel_y = 0
+        self.on_ground = True
+        self.jump_charging = False
+        self.jump_power = 0
+        self.facing_right = True
+        self.start_x = x
+        self.start_y = y
+        self.death_count = 0
+        self.jump_charge_ticks = 0  # 已蓄力的時間（以物理更新次數計，可以是小數）
+
+    def copy(self):
+        """複製狀態，方便從同一點分支模擬"""
+        state = PlayerState.__new__(PlayerState)
+        for name in PlayerState.__slots__:
+            setattr(state, name, getattr(self, name))
+        return state
+
+
+class PlayerInput:
+    """一次物理更新的按鍵輸入"""
+
+    __slots__ = ("charge_start", "charge_held", "jump_direction")
+
+    def __init__(self, charge_start=False, charge_held=False, jump_direction=None):
+        self.charge_start = charge_start  # 本次按下 SPACE
+        self.charge_held = charge_held  # SPACE 維持按住
+        self.jump_direction = jump_direction  # 放開 SPACE 時的方向，None 表示沒放開
+
+
+class CompiledLevel:
+    """
+    編譯後的關卡：載入時把平台與死亡區域的字典轉成不可變的 LevelRect，
+    並預先算好目標平台、關卡範圍與碰撞索引，每幀的熱路徑只讀這份資料
+    """
+
+    __slots__ = (
+        "number",
+        "platforms",
+        "death_zones",
+        "goal_y",
+        "goal_platforms",
+        "bounds",
+        "platform_grid",
+        "death_zone_index",
+        "platform_view_index",
+        "death_zone_view_index",
+    )
+
+    def __init__(self, level_data, number=None):
+        self.number = number
+        self.platforms = tuple(compile_rect(p) for p in level_data["platforms"])
+        self.death_zones = tuple(compile_rect(z) for z in level_data["death_zones"])
+        self.goal_y = level_data["goal_y"]
+        # 與目標判定相同的條件：頂部在 goal_y 以上的平台
+        self.goal_platforms = tuple(
+            platform for platform in self.platforms if platform.y <= self.goal_y
+        )
+        self.bounds = level_bounds(self.platforms + self.death_zones)
+        self.platform_grid = PlatformGrid(self.platforms)
+        self.death_zone_index = DeathZoneIndex(self.death_zones)
+        self.platform_view_index = RectRangeIndex(self.platforms)
+        self.death_zone_view_index = RectRangeIndex(self.death_zones)
+
+
+def reset_position(state):
+    """重置玩家位置到關卡起點"""
+    state.x = state.start_x
+    state.y = state.start_y
+    state.vel_x = 0
+    state.vel_y = 0
+    state.on_ground = True
+    state.jump_charging = False
+    state.jump_power = 0
+    state.jump_charge_ticks = 0
+    state.death_count += 1
+
+
+def start_jump_charge(state):
+    """開始跳躍蓄力"""
+    state.jump_charging = True
+    set_jump_charge(state, 0)
+
+
+def jump_power_for_ticks(charge_ticks):
+    """蓄力 charge_ticks 次物理更新的時間（可以是小數）後的跳躍力量"""
+    return min(MIN_JUMP_POWER + JUMP_CHARGE_RATE * charge_ticks, MAX_JUMP_POWER)
+
+
+def set_jump_charge(state, charge_ticks):
+    """依已蓄力的時間設定跳躍力量，力量只取決於蓄力時間，與經過了幾幀無關"""
+    state.jump_charge_ticks = charge_ticks
+    state.jump_power = jump_power_for_ticks(charge_ticks)
+
+
+def update_jump_charge(state):
+    """固定步長的蓄力：多蓄一次物理更新的時間（無畫面模擬與工具使用）"""
+    if state.jump_charging:
+        set_jump_charge(state, state.jump_charge_ticks + 1)
+
+
+def charge_for_duration(state, seconds):
+    """依按下 SPACE 後實際經過的秒數設定蓄力，結果與幀率和卡頓無關"""
+    if state.jump_charging:
+        set_jump_charge(state, seconds * FPS)
+
+
+def execute_jump(state, direction):
+    """執行跳躍，真的跳起來時回傳 True"""
+    if state.jump_charging and state.on_ground:
+        # 計算跳躍向量
+        angle = 0
+        if direction == "left":
+            angle = 120  # 左上
+            state.facing_right = False
+        elif direction == "right":
+            angle = 60  # 右上
+            state.facing_right = True
+        else:  # 直接向上
+            angle = 90
+
+        # 轉換為弧度
+        angle_rad = math.radians(angle)
+
+        # 應用跳躍力
+        jump_force = state.jump_power * 1.2
+        state.vel_x = math.cos(angle_rad) * jump_force
+        state.vel_y = math.sin(angle_rad) * -jump_force
+
+        # 重置跳躍狀態
+        state.jump_charging = False
+        state.jump_power = 0
+        state.jump_charge_ticks = 0
+        state.on_ground = False
+        return True
+
+    # 即使無法跳躍也要重置蓄力狀態
+    if state.jump_charging:
+        state.jump_charging = False
+        state.jump_power = 0
+        state.jump_charge_ticks = 0
+    return False
+
+
+def check_screen_boundaries(state):
+    """檢查屏幕邊界並處理反彈"""
+    wall_width = 10
+
+    # 左邊界
+    if state.x <= wall_width:
+        state.x = wall_width
+        if state.vel_x < 0:
+            state.vel_x = -state.vel_x * 0.7
+
+    # 右邊界
+    if state.x + state.width >= SCREEN_WIDTH - wall_width:
+        state.x = SCREEN_WIDTH - wall_width - state.width
+        if state.vel_x > 0:
+            state.vel_x = -state.vel_x * 0.7
+
+
+def sweep_axis(start, size, delta, platform_start, platform_end):
+    """計算單一軸上開始與結束重疊的時間（0 為本幀起點，1 為終點）"""
+    if delta > 0:
+        entry_time = (platform_start - (start + size)) / delta
+        exit_time = (platform_end - start) / delta
+        return entry_time, exit_time
+    if delta < 0:
+        entry_time = (platform_end - start) / delta
+        exit_time = (platform_start - (start + size)) / delta
+        return entry_time, exit_time
+    if start < platform_end and start + size > platform_start:
+        return float("-inf"), float("inf")
+    return None
+
+
+def query_swept_platforms(state, platforms, start_x, start_y, platform_grid=None):
+    """取得本幀掃過範圍附近的平台，連續碰撞與重疊檢查共用這份列表"""
+    if not platform_grid:
+        return platforms
+
+    # 多留 1 像素，涵蓋重疊檢查時座標取整造成的誤差
+    return platform_grid.query(
+        min(start_x, state.x) - 1,
+        min(start_y, state.y) - 1,
+        abs(state.x - start_x) + state.width + 2,
+        abs(state.y - start_y) + state.height + 2,
+    )
+
+
+def sweep_platform_collision(state, platforms, start_x, start_y, platform_grid=None):
+    """連續碰撞檢測：沿本幀位移找出最早落到的平台，避免高速下墜穿過薄平台"""
+    delta_x = state.x - start_x
+    delta_y = state.y - start_y
+    # 只處理往下落的情況；往上跳與側面碰撞維持一般碰撞的手感
+    # （一般碰撞允許從平台邊緣往上穿過平台，關卡設計依賴這個特性）
+    if delta_y <= 0:
+        return
+
+    # 本幀掃過的範圍
+    nearby_platforms = query_swept_platforms(
+        state, platforms, start_x, start_y, platform_grid
+    )
+
+    first_time = None
+    first_platform = None
+    for platform in nearby_platforms:
+        x_times = sweep_axis(start_x, state.width, delta_x, platform.x, platform.right)
+        y_times = sweep_axis(
+            start_y, state.height, delta_y, platform.y, platform.bottom
+        )
+        if x_times is None or y_times is None:
+            continue
+
+        entry_time = max(x_times[0], y_times[0])
+        exit_time = min(x_times[1], y_times[1])
+        # 起點已重疊或本幀碰不到的平台交給一般碰撞處理
+        if entry_time < 0 or entry_time > 1 or entry_time >= exit_time:
+            continue
+
+        # 從側面撞上交給一般碰撞處理（水平速度不足以穿過平台）
+        if x_times[0] > y_times[0]:
+            continue
+
+        if first_time is None or entry_time < first_time:
+            first_time = entry_time
+            first_platform = platform
+
+    if first_platform is None:
+        return
+
+    # 從上方落下：停在撞擊當下的位置（平台頂部），水平位移只算到撞擊為止，
+    # 確保玩家落在這個平台上，接著的一般碰撞會把它判定為地面
+    state.x = start_x + delta_x * first_time
+    state.y = first_platform.y - state.height
+    state.vel_y = 0
+
+
+def check_platform_collision(
+    state, platforms, platform_grid=None, nearby_platforms=None
+):
+    """
+    檢查平台碰撞並更新是否在地面上
+    nearby_platforms 可傳入已查好、涵蓋玩家目前位置的平台列表
+    """
+    # 與 pygame.Rect 相同，重疊判斷使用截斷成整數的玩家座標
+    rect_x = int(state.x)
+    rect_y = int(state.y)
+    width = state.width
+    height = state.height
+    ground_detected = False
+
+    # 有空間網格時只檢查玩家附近的平台
+    if nearby_platforms is None:
+        nearby_platforms = platforms
+        if platform_grid:
+            nearby_platforms = platform_grid.query(rect_x, rect_y, width, height)
+
+    for platform_x, platform_y, _, _, platform_right, platform_bottom in (
+        nearby_platforms
+    ):
+        if (
+            rect_x < platform_right
+            and rect_x + width > platform_x
+            and rect_y < platform_bottom
+            and rect_y + height > platform_y
+        ):
+            # 計算重疊
+            overlap_left = (state.x + width) - platform_x
+            overlap_right = platform_right - state.x
+            overlap_top = (state.y + height) - platform_y
+            overlap_bottom = platform_bottom - state.y
+
+            # 找出最小重疊方向
+            min_overlap = min(overlap_left, overlap_right, overlap_top, overlap_bottom)
+
+            if min_overlap == overlap_top and state.vel_y >= 0:
+                # 從上方落下
+                state.y = platform_y - height
+                state.vel_y = 0
+                ground_detected = True
+            elif min_overlap == overlap_bottom and state.vel_y <= 0:
+                # 從下方撞擊
+                state.y = platform_bottom
+                state.vel_y = 0
+            elif min_overlap == overlap_left and state.vel_x >= 0:
+                # 從左側撞擊平台
+                state.x = platform_x - width
+                state.vel_x = -state.vel_x * 0.6
+            elif min_overlap == overlap_right and state.vel_x <= 0:
+                # 從右側撞擊平台
+                state.x = platform_right
+                state.vel_x = -state.vel_x * 0.6
+
+    # 詳細地面檢測
+    if not ground_detected:
+        nearby_platforms = platforms
+        if platform_grid:
+            # 只需要頂部落在玩家腳底 ±3 像素內的平台
+            nearby_platforms = platform_grid.query(
+                state.x, state.y + height - 3, width, 6
+            )
+
+        for platform in nearby_platforms:
+            # 檢查水平重疊
+            if state.x < platform.right and state.x + width > platform.x:
+                # 檢查垂直接觸
+                platform_top = platform.y
+                player_bottom = state.y + height
+                if abs(player_bottom - platform_top) <= 3 and state.vel_y >= -0.5:
+                    ground_detected = True
+                    state.y = platform_top - height
+                    state.vel_y = 0
+                    break
+
+    state.on_ground = ground_detected
+
+
+def update_player(
+    state,
+    platforms,
+    death_zones=None,
+    level_num=None,
+    platform_grid=None,
+    death_zone_index=None,
+    rng=random,
+):
+    """推進一次物理更新，回傳 "death"、"fall_trap" 或 None"""
+    # 處理重力
+    if not state.on_ground:
+        state.vel_y += GRAVITY
+        if state.vel_y > MAX_FALL_SPEED:
+            state.vel_y = MAX_FALL_SPEED
+
+    # 更新位置
+    start_x, start_y = state.x, state.y
+    state.x += state.vel_x
+    state.y += state.vel_y
+
+    # 檢查屏幕邊界並反彈
+    check_screen_boundaries(state)
+
+    # 特殊處理第11關的掉落機制
+    if level_num == 11 and state.y > 400:
+        if state.vel_y > 10:  # 高速墜落時
+            for min_x, max_x in FALL_TRAP_ZONES:
+                if min_x <= state.x + state.width / 2 <= max_x:
+                    if rng.random() < FALL_TRAP_CHANCE:
+                        # 直接掉到底部
+                        state.y = 500
+                        state.vel_y = 0
+                        reset_position(state)
+                        return "fall_trap"
+
+    # 本幀掃過範圍附近的平台
+    nearby_platforms = query_swept_platforms(
+        state, platforms, start_x, start_y, platform_grid
+    )
+
+    # 連續碰撞檢測：停在本幀最先撞到的平台上
+    # （在掉落陷阱之後，陷阱判斷的是撞擊前的墜落速度，與原本的順序相同）
+    if SWEPT_COLLISION:
+        sweep_platform_collision(state, nearby_platforms, start_x, start_y)
+
+    # 檢查死亡區域（有索引時只檢查垂直範圍可能重疊的區域）
+    if death_zone_index is not None:
+        if death_zone_index.overlaps(state.x, state.y, state.width, state.height):
+            return "death"
+    elif death_zones:
+        for zone in death_zones:
+            if (
+                state.x < zone.right
+                and state.x + state.width > zone.x
+                and state.y < zone.bottom
+                and state.y + state.height > zone.y
+            ):
+                return "death"
+
+    # 檢查平台碰撞（連續碰撞只會把玩家停在掃過範圍內，附近平台列表仍然適用）
+    check_platform_collision(state, platforms, platform_grid, nearby_platforms)
+
+    # 減少水平速度（摩擦力）
+    if state.on_ground:
+        state.vel_x *= 0.8
+    else:
+        state.vel_x *= 0.95
+
+    return None
+
+
+def step(state, player_input, level, rng=random):
+    """
+    無畫面的單步模擬，順序與 Game 相同：
+    先處理按下/放開 SPACE，再更新蓄力，最後推進物理
+    """
+    if player_input.charge_start:
+        start_jump_charge(state)
+    if player_input.jump_direction:
+        execute_jump(state, player_input.jump_direction)
+    if player_input.charge_held:
+        update_jump_charge(state)
+
+    return update_player(
+        state,
+        level.platforms,
+        level.death_zones,
+        level.number,
+        level.platform_grid,
+        level.death_zone_index,
+        rng,
+    )
@@ -4,53 +4,131 @@ Jump King 渲染器
 處理遊戲的視覺效果和繪製
 """
 import pygame
+import math
 import time
 from game_config import *
 
 
+class StaticLevelLayer:
+    """
+    關卡的靜態圖層：背景、牆壁、平台與死亡區域預先畫在與畫面同寬的圖塊上，
+    每幀依相機位置貼上一兩個圖塊，繪製成本與平台數量無關
+    """
+
+    def __init__(
+        self,
+        level,
+        tile_height=LEVEL_LAYER_TILE_HEIGHT,
+        max_tiles=LEVEL_LAYER_MAX_TILES,
+    ):
+        self.level = level
+        self.tile_height = tile_height
+        self.max_tiles = max_tiles
+        self.tiles = {}  # 圖塊編號 -> Surface，第 n 塊涵蓋 y 範圍 [n * 高度, (n + 1) * 高度)
+        self.goal_platforms = set(level.goal_platforms)
+        self.prerender()
+
+    def tile_range(self, top, bottom):
+        """y 範圍 [top, bottom) 涵蓋的第一個與最後一個圖塊編號"""
+        height = self.tile_height
+        return math.floor(top / height), math.floor((bottom - 1) / height)
+
+    def prerender(self):
+        """先畫好涵蓋整個關卡的圖塊（需要太多圖塊的關卡改為畫面經過時才畫）"""
+        bounds = self.level.bounds
+        if bounds is None:
+            return
+        first, last = self.tile_range(bounds.y, bounds.bottom)
+        if last - first + 1 > self.max_tiles:
+            return
+        for index in range(first, last + 1):
+            self.tile(index)
+
+    def tile(self, index):
+        surface = self.tiles.get(index)
+        if surface is None:
+            surface = self.render_tile(index)
+            self.tiles[index] = surface
+        return surface
+
+    def render_tile(self, index):
+        """依原本逐一繪製的順序畫出一個圖塊：背景、牆壁、平台、死亡區域"""
+        top = index * self.tile_height
+        bottom = top + self.tile_height
+        surface = pygame.Surface((SCREEN_WIDTH, self.tile_height))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()  # 與畫面相同的像素格式，貼上時不必轉換
+        surface.fill(DARK_BLUE)
+
+        draw_rect = pygame.draw.rect
+        wall_width = 10
+        draw_rect(surface, GRAY, (0, 0, wall_width, self.tile_height))
+        draw_rect(
+            surface,
+            GRAY,
+            (SCREEN_WIDTH - wall_width, 0, wall_width, self.tile_height),
+        )
+
+        level = self.level
+        for platform in level.platform_view_index.query(top, bottom):
+            x, y, width, height, _, _ = platform
+            color = YELLOW if platform in self.goal_platforms else BROWN
+            draw_rect(surface, color, (x, y - top, width, height))
+        death_zones = level.death_zone_view_index.query(top, bottom)
+        for x, y, width, height, _, _ in death_zones:
+            draw_rect(surface, RED, (x, y - top, width, height))
+        return surface
+
+    def draw(self, screen, camera_y):
+        """貼上畫面範圍內的圖塊"""
+        first, last = self.tile_range(camera_y, camera_y + screen.get_height())
+        for index in range(first, last + 1):
+            screen.blit(self.tile(index), (0, index * self.tile_height - camera_y))
+
+        # 相機移到關卡範圍外時，移除離畫面最遠的圖塊
+        extra = len(self.tiles) - self.max_tiles
+        if extra > 0:
+            farthest = sorted(self.tiles, key=lambda index: -abs(index - first))
+            for index in farthest[:extra]:
+                del self.tiles[index]
+
+
 class Renderer:
     def __init__(self, screen_width, screen_height):
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.camera_y = 0
+        self.prev_camera_y = 0  # 上一次物理更新的相機位置
+        self.render_camera_y = 0  # 本次繪製使用的插值相機位置
+        self.level_layer = None  # 目前關卡預先畫好的靜態圖層
+
+    def reset_camera(self):
+        """重置相機到關卡起點"""
+        self.camera_y = 0
+        self.prev_camera_y = 0
+        self.render_camera_y = 0
 
     def update_camera(self, player):
-        """更新相機位置"""
+        """更新相機位置（每次物理更新呼叫一次）"""
+        self.prev_camera_y = self.camera_y
         if player:
             target_y = player.y - SCREEN_HEIGHT // 2
             self.camera_y += (target_y - self.camera_y) * 0.1
 
     def draw_platforms(self, screen, platforms, goal_y):
         """繪製平台"""
-        for platform in platforms:
-            color = BROWN
-            if platform["y"] <= goal_y:  # 目標平台
-                color = YELLOW
-
-            pygame.draw.rect(
-                screen,
-                color,
-                (
-                    platform["x"],
-                    platform["y"] - self.camera_y,
-                    platform["width"],
-                    platform["height"],
-                ),
-            )
+        camera_y = self.render_camera_y
+        draw_rect = pygame.draw.rect
+        for x, y, width, height, _, _ in platforms:
+            color = YELLOW if y <= goal_y else BROWN  # 目標平台為黃色
+            draw_rect(screen, color, (x, y - camera_y, width, height))
 
     def draw_death_zones(self, screen, death_zones):
         """繪製死亡區域"""
-        for zone in death_zones:
-            pygame.draw.rect(
-                screen,
-                RED,
-                (
-                    zone["x"],
-                    zone["y"] - self.camera_y,
-                    zone["width"],
-                    zone["height"],
-                ),
-            )
+        camera_y = self.render_camera_y
+        draw_rect = pygame.draw.rect
+        for x, y, width, height, _, _ in death_zones:
+            draw_rect(screen, RED, (x, y - camera_y, width, height))
 
     def draw_level11_effects(self, screen):
         """繪製第11關特殊視覺效果"""
@@ -69,7 +147,13 @@ class Renderer:
             warning_surface = pygame.Surface((max_x - min_x, height))
             warning_surface.set_alpha(alpha)
             warning_surface.fill(ORANGE)
-            screen.blit(warning_surface, (min_x, y - self.camera_y))
+            screen.blit(warning_surface, (min_x, y - self.render_camera_y))
+
+    def get_level_layer(self, level):
+        """關卡的靜態圖層，換關或熱重載換了編譯結果時重新建立"""
+        if self.level_layer is None or self.level_layer.level is not level:
+            self.level_layer = StaticLevelLayer(level)
+        return self.level_layer
 
     def draw_screen_boundaries(self, screen):
         """繪製屏幕邊界牆壁"""
@@ -81,49 +165,63 @@ class Renderer:
             screen, GRAY, (SCREEN_WIDTH - wall_width, 0, wall_width, SCREEN_HEIGHT)
         )
 
-    def draw_game_scene(self, screen, level_data, player, current_level):
-        """繪製遊戲場景"""
-        screen.fill(DARK_BLUE)
-
-        # 繪製屏幕邊界
-        self.draw_screen_boundaries(screen)
-
-        # 繪製平台
-        self.draw_platforms(screen, level_data["platforms"], level_data["goal_y"])
+    def draw_game_scene(self, screen, level, player, current_level, alpha=1.0):
+        """
+        繪製遊戲場景
+        level 為編譯後的關卡，alpha 為畫面位於兩次物理更新之間的比例
+        """
+        self.render_camera_y = self.prev_camera_y + (
+            self.camera_y - self.prev_camera_y
+        ) * alpha
+
+        if STATIC_LEVEL_LAYER:
+            # 背景、牆壁、平台與死亡區域都在預先畫好的圖塊中
+            self.get_level_layer(level).draw(screen, self.render_camera_y)
+        else:
+            screen.fill(DARK_BLUE)
+
+            # 繪製屏幕邊界
+            self.draw_screen_boundaries(screen)
+
+            # 只繪製與畫面垂直範圍重疊的平台與死亡區域
+            view_top = self.render_camera_y
+            view_bottom = view_top + SCREEN_HEIGHT
+
+            # 繪製平台
+            self.draw_platforms(
+                screen,
+                level.platform_view_index.query(view_top, view_bottom),
+                level.goal_y,
+            )
 
-        # 繪製死亡區域
-        self.draw_death_zones(screen, level_data["death_zones"])
+            # 繪製死亡區域
+            self.draw_death_zones(
+                screen, level.death_zone_view_index.query(view_top, view_bottom)
+            )
 
         # 第11關特殊效果
         if current_level == 11:
             self.draw_level11_effects(screen)
 
-        # 更新相機
-        self.update_camera(player)
-
         # 繪製玩家
         if player:
-            player.draw(screen, self.camera_y)
+            player.draw(screen, self.render_camera_y, alpha)
 
-    def check_goal_completion(self, player, level_data):
-        """檢查玩家是否踩在目標平台上"""
+    def check_goal_completion(self, player, level):
+        """檢查玩家是否踩在目標平台上（目標平台在編譯關卡時已篩選好）"""
         if not player or not player.on_ground:
             return False
 
-        # 找到目標平台
-        goal_platforms = []
-        for platform in level_data["platforms"]:
-            if platform["y"] <= level_data["goal_y"]:
-                goal_platforms.append(platform)
+        player_left = player.x
+        player_right = player.x + player.width
+        player_bottom = player.y + player.height
 
-        # 檢查玩家是否踩在任何目標平台上
-        for platform in goal_platforms:
-            # 檢查玩家底部是否接觸平台頂部
+        # 檢查玩家底部是否接觸任何目標平台的頂部
+        for platform in level.goal_platforms:
             if (
-                player.x < platform["x"] + platform["width"]
-                and player.x + player.width > platform["x"]
-                and abs((player.y + player.height) - platform["y"]) <= 3
-                and player.on_ground
+                player_left < platform.right
+                and player_right > platform.x
+                and abs(player_bottom - platform.y) <= 3
             ):
                 return True
 
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Jump King 碰撞空間索引
+平台空間網格：關卡載入時把平台分配到固定大小的格子，碰撞檢測只需檢查玩家附近的平台
+死亡區域索引：依頂部 y 排序，只檢查垂直範圍可能重疊的區域
+繪製用的矩形索引：依頂部 y 排序，只取出與畫面範圍重疊的平台與死亡區域
+"""
+from bisect import bisect_left, bisect_right
+
+from game_config import COLLISION_CELL_SIZE, DEATH_ZONE_TALL_HEIGHT
+
+
+class PlatformGrid:
+    def __init__(self, platforms, cell_size=COLLISION_CELL_SIZE):
+        self.platforms = platforms
+        self.cell_size = cell_size
+        self.cells = {}
+
+        for index, platform in enumerate(platforms):
+            for cell in self.cells_in_rect(
+                platform.x, platform.y, platform.width, platform.height
+            ):
+                self.cells.setdefault(cell, []).append(index)
+
+    def cells_in_rect(self, x, y, width, height):
+        """列出矩形覆蓋到的所有格子"""
+        size = self.cell_size
+        min_col = int(x // size)
+        max_col = int((x + width) // size)
+        min_row = int(y // size)
+        max_row = int((y + height) // size)
+
+        for col in range(min_col, max_col + 1):
+            for row in range(min_row, max_row + 1):
+                yield col, row
+
+    def query(self, x, y, width, height):
+        """取得可能與矩形重疊的平台，順序與原始平台列表相同"""
+        size = self.cell_size
+        min_col = int(x // size)
+        max_col = int((x + width) // size)
+        min_row = int(y // size)
+        max_row = int((y + height) // size)
+        cells = self.cells
+
+        # 大多數格子是空的：只找到一格有平台時直接用該格的列表（已依原始順序排列）
+        first_bucket = None
+        indices = None
+        for col in range(min_col, max_col + 1):
+            for row in range(min_row, max_row + 1):
+                bucket = cells.get((col, row))
+                if not bucket:
+                    continue
+                if first_bucket is None:
+                    first_bucket = bucket
+                elif indices is None:
+                    indices = set(first_bucket)
+                    indices.update(bucket)
+                else:
+                    indices.update(bucket)
+
+        if first_bucket is None:
+            return []
+
+        # 保持原始順序，碰撞處理的先後才會與逐一檢查完全一致
+        platforms = self.platforms
+        if indices is None:
+            return [platforms[index] for index in first_bucket]
+        return [platforms[index] for index in sorted(indices)]
+
+
+class DeathZoneIndex:
+    """死亡區域區間索引：依頂部 y 排序，只檢查垂直範圍可能重疊的區域"""
+
+    def __init__(self, death_zones, tall_height=DEATH_ZONE_TALL_HEIGHT):
+        self.tall_zones = []  # 很高的區域（例如邊界牆）每次直接檢查
+        zones = []
+        for zone in death_zones:
+            bounds = (zone.x, zone.right, zone.y, zone.bottom)
+            if zone.height > tall_height:
+                self.tall_zones.append(bounds)
+            else:
+                zones.append(bounds)
+
+        zones.sort(key=lambda bounds: bounds[2])
+        self.zones = zones
+        self.tops = [bounds[2] for bounds in zones]
+        self.max_height = max((bottom - top for _, _, top, bottom in zones), default=0)
+
+    def query(self, y, height):
+        """取得垂直範圍可能與 y 到 y + height 重疊的區域（不含很高的區域）"""
+        low = bisect_right(self.tops, y - self.max_height)
+        high = bisect_left(self.tops, y + height)
+        return self.zones[low:high]
+
+    def overlaps(self, x, y, width, height):
+        """矩形是否碰到任何死亡區域"""
+        for left, right, top, bottom in self.tall_zones:
+            if x < right and x + width > left and y < bottom and y + height > top:
+                return True
+        for left, right, top, bottom in self.query(y, height):
+            if x < right and x + width > left and y < bottom and y + height > top:
+                return True
+        return False
+
+
+class RectRangeIndex:
+    """
+    繪製用的矩形索引：依頂部 y 排序，用二分搜尋找出與畫面垂直範圍重疊的矩形，
+    只畫畫面內的物件；很高的矩形（例如邊界牆）每次直接檢查
+    """
+
+    def __init__(self, rects, tall_height=DEATH_ZONE_TALL_HEIGHT):
+        self.rects = rects
+        self.tall_indices = []
+        entries = []
+        for index, rect in enumerate(rects):
+            if rect.height > tall_height:
+                self.tall_indices.append(index)
+            else:
+                entries.append((rect.y, index))
+
+        entries.sort()
+        self.tops = [top for top, _ in entries]
+        self.indices = [index for _, index in entries]
+        self.max_height = max(
+            (rects[index].height for index in self.indices), default=0
+        )
+
+    def query(self, top, bottom):
+        """與 y 範圍 [top, bottom) 重疊的矩形，順序與原始列表相同（重疊時的繪製先後不變）"""
+        rects = self.rects
+        low = bisect_right(self.tops, top - self.max_height)
+        high = bisect_left(self.tops, bottom)
+        indices = [
+            index for index in self.indices[low:high] if rects[index].bottom > top
+        ]
+        for index in self.tall_indices:
+            if rects[index].y < bottom and rects[index].bottom > top:
+                indices.append(index)
+        indices.sort()
+        return [rects[index] for index in indices]
@@ -5,11 +5,96 @@ Jump King UI管理器
 """
 import pygame
 import os
+from collections import OrderedDict
 from game_config import *
 
 
+class TextCache:
+    """
+    font.render 結果的 LRU 快取，以 (字體, 文字, 反鋸齒, 顏色, 背景色) 為鍵
+    標題、操作說明等固定文字只在第一次繪製時光柵化，之後每幀直接取用同一個 Surface；
+    數字會變的文字（高度、死亡次數）才會重新光柵化，超過上限時移除最久沒用到的
+    回傳的 Surface 是共用的，呼叫端不可以修改它（set_alpha、fill 等）
+    """
+
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        """與 font.render 相同的參數，命中快取時不重新光柵化"""
+        key = (
+            font,
+            text,
+            antialias,
+            tuple(color),
+            None if background is None else tuple(background),
+        )
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """重新載入字體後舊字體的文字用不到了"""
+        self.surfaces.clear()
+
+    def stats(self):
+        """回傳 (命中次數, 未命中次數, 目前快取數量)"""
+        return self.hits, self.misses, len(self.surfaces)
+
+
+class GlyphAtlas:
+    """
+    逐字的字形圖集：每個 (字體, 反鋸齒, 顏色) 的每個字元只光柵化一次
+    數值一直在變的 HUD 文字（死亡次數、高度、蓄力、音量）用快取的字形逐字貼上，
+    每幀成本只與字數有關，數值怎麼變都不會重新光柵化
+    逐字排列以整數像素前進、不做字距微調，寬度可能與 font.render 差一兩個像素
+    """
+
+    def __init__(self):
+        self.glyphs = {}  # (字體, 反鋸齒, 顏色) -> {字元: (Surface, 寬度)}
+        self.misses = 0  # 光柵化過的字形數量
+
+    def draw(self, screen, font, text, antialias, color, pos):
+        """把 text 的左上角畫在 pos，回傳涵蓋的 Rect"""
+        key = (font, antialias, tuple(color))
+        glyphs = self.glyphs.get(key)
+        if glyphs is None:
+            glyphs = self.glyphs[key] = {}
+
+        x, y = pos
+        blits = []
+        for char in text:
+            glyph = glyphs.get(char)
+            if glyph is None:
+                self.misses += 1
+                surface = font.render(char, antialias, color)
+                glyph = glyphs[char] = (surface, surface.get_width())
+            blits.append((glyph[0], (x, y)))
+            x += glyph[1]
+        screen.blits(blits, False)
+        return pygame.Rect(pos[0], y, x - pos[0], font.get_height())
+
+    def clear(self):
+        """重新載入字體後舊字體的字形用不到了"""
+        self.glyphs.clear()
+
+
 class UIManager:
     def __init__(self):
+        self.text_cache = TextCache()  # 所有文字繪製共用的快取
+        self.glyph_atlas = GlyphAtlas()  # 數值一直在變的 HUD 文字逐字貼上
         self.load_fonts()
 
     def load_fonts(self):
@@ -33,17 +118,22 @@ class UIManager:
             self.font_small = pygame.font.Font(None, FONT_SMALL_SIZE)
             print("使用系統預設字體")
 
+        self.text_cache.clear()
+        self.glyph_atlas.clear()
+
     def draw_menu(self, screen, menu_selection, unlocked_levels):
         """繪製主選單"""
         screen.fill(DARK_BLUE)
 
         # 標題
-        title = self.font_large.render("Jump King - 十一關挑戰", True, YELLOW)
+        title = self.text_cache.render(
+            self.font_large, "Jump King - 十一關挑戰", True, YELLOW
+        )
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 150))
         screen.blit(title, title_rect)
 
         # 副標題
-        subtitle = self.font_medium.render("考驗你的耐心與技巧", True, WHITE)
+        subtitle = self.text_cache.render(self.font_medium, "考驗你的耐心與技巧", True, WHITE)
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, 200))
         screen.blit(subtitle, subtitle_rect)
 
@@ -51,20 +141,20 @@ class UIManager:
         menu_options = ["開始遊戲", "繼續遊戲", "退出遊戲"]
         for i, option in enumerate(menu_options):
             color = YELLOW if i == menu_selection else WHITE
-            text = self.font_medium.render(option, True, color)
+            text = self.text_cache.render(self.font_medium, option, True, color)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 300 + i * 50))
             screen.blit(text, text_rect)
 
         # 進度資訊
         progress_text = f"已解鎖關卡: {unlocked_levels}/{TOTAL_LEVELS}"
-        progress = self.font_small.render(progress_text, True, GREEN)
+        progress = self.text_cache.render(self.font_small, progress_text, True, GREEN)
         progress_rect = progress.get_rect(center=(SCREEN_WIDTH // 2, 500))
         screen.blit(progress, progress_rect)
 
         # 操作說明
         controls = ["↑↓ 選擇", "Enter 確認", "ESC 退出", "F11 切換全屏"]
         for i, control in enumerate(controls):
-            text = self.font_small.render(control, True, GRAY)
+            text = self.text_cache.render(self.font_small, control, True, GRAY)
             screen.blit(text, (50, 500 + i * 25))
 
     def draw_level_select(
@@ -79,7 +169,7 @@ class UIManager:
         screen.fill(DARK_BLUE)
 
         # 標題
-        title = self.font_large.render("選擇關卡", True, YELLOW)
+        title = self.text_cache.render(self.font_large, "選擇關卡", True, YELLOW)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 100))
         screen.blit(title, title_rect)
 
@@ -130,20 +220,26 @@ class UIManager:
             pygame.draw.rect(screen, color, (x, y, 100, 80))
 
             # 關卡編號
-            level_text = self.font_medium.render(f"第{level}關", True, text_color)
+            level_text = self.text_cache.render(
+                self.font_medium, f"第{level}關", True, text_color
+            )
             level_rect = level_text.get_rect(center=(x + 50, y + 20))
             screen.blit(level_text, level_rect)
 
             # 關卡名稱
             level_data = level_manager.get_level(level)
             if level_data:
-                name_text = self.font_small.render(level_data["name"], True, text_color)
+                name_text = self.text_cache.render(
+                    self.font_small, level_data["name"], True, text_color
+                )
                 name_rect = name_text.get_rect(center=(x + 50, y + 40))
                 screen.blit(name_text, name_rect)
 
             # 狀態
             for i, line in enumerate(status.split("\n")):
-                status_text = self.font_small.render(line, True, text_color)
+                status_text = self.text_cache.render(
+                    self.font_small, line, True, text_color
+                )
                 status_rect = status_text.get_rect(center=(x + 50, y + 55 + i * 12))
                 screen.blit(status_text, status_rect)
 
@@ -154,8 +250,11 @@ class UIManager:
                 detail_y = 450
 
                 # 關卡名稱
-                name = self.font_medium.render(
-                    f"第{level_select_selection}關: {level_data['name']}", True, YELLOW
+                name = self.text_cache.render(
+                    self.font_medium,
+                    f"第{level_select_selection}關: {level_data['name']}",
+                    True,
+                    YELLOW,
                 )
                 name_rect = name.get_rect(center=(SCREEN_WIDTH // 2, detail_y))
                 screen.blit(name, name_rect)
@@ -164,14 +263,18 @@ class UIManager:
                 target_text = f"挑戰目標: {level_data['target_deaths']}次死亡內完成"
                 if level_select_selection == 11:
                     target_text = f"超級挑戰: {level_data['target_deaths']}次死亡內完成"
-                target = self.font_small.render(target_text, True, WHITE)
+                target = self.text_cache.render(
+                    self.font_small, target_text, True, WHITE
+                )
                 target_rect = target.get_rect(center=(SCREEN_WIDTH // 2, detail_y + 30))
                 screen.blit(target, target_rect)
 
                 # 第11關特殊警告
                 if level_select_selection == 11:
                     warning_text = "⚠️ 注意：此關卡包含隨機掉落陷阱！"
-                    warning = self.font_small.render(warning_text, True, RED)
+                    warning = self.text_cache.render(
+                        self.font_small, warning_text, True, RED
+                    )
                     warning_rect = warning.get_rect(
                         center=(SCREEN_WIDTH // 2, detail_y + 55)
                     )
@@ -180,32 +283,34 @@ class UIManager:
         # 操作說明
         controls = ["← → 選擇關卡", "Enter 開始", "ESC 返回", "F11 切換全屏"]
         for i, control in enumerate(controls):
-            text = self.font_small.render(control, True, GRAY)
+            text = self.text_cache.render(self.font_small, control, True, GRAY)
             screen.blit(text, (50, 550 + i * 20))
 
     def draw_playing_ui(self, screen, current_level, level_data, player):
         """繪製遊戲中的UI"""
         # 關卡資訊
         level_text = f"第{current_level}關: {level_data['name']}"
-        text = self.font_medium.render(level_text, True, YELLOW)
+        text = self.text_cache.render(self.font_medium, level_text, True, YELLOW)
         screen.blit(text, (10, 10))
 
         # 死亡次數
         deaths_text = f"死亡次數: {player.death_count}"
-        text = self.font_small.render(deaths_text, True, WHITE)
-        screen.blit(text, (10, 45))
+        self.glyph_atlas.draw(
+            screen, self.font_small, deaths_text, True, WHITE, (10, 45)
+        )
 
         # 目標
         target_text = f"目標: {level_data['target_deaths']}次內完成"
         color = GREEN if player.death_count <= level_data["target_deaths"] else RED
-        text = self.font_small.render(target_text, True, color)
+        text = self.text_cache.render(self.font_small, target_text, True, color)
         screen.blit(text, (10, 70))
 
         # 高度
         height = max(0, int((level_data["start_pos"][1] - player.y) / 10))
         height_text = f"高度: {height}m"
-        text = self.font_small.render(height_text, True, WHITE)
-        screen.blit(text, (SCREEN_WIDTH - 150, 10))
+        self.glyph_atlas.draw(
+            screen, self.font_small, height_text, True, WHITE, (SCREEN_WIDTH - 150, 10)
+        )
 
         # 控制說明
         controls = [
@@ -223,27 +328,33 @@ class UIManager:
             controls.extend(["⚠️ 小心！某些區域", "高速墜落會觸發", "掉落陷阱！"])
 
         for i, control in enumerate(controls):
-            text = self.font_small.render(control, True, WHITE)
+            text = self.text_cache.render(self.font_small, control, True, WHITE)
             screen.blit(text, (10, SCREEN_HEIGHT - 140 + i * 20))
 
         # 玩家狀態
         status_text = f"在地面: {'是' if player.on_ground else '否'}"
         color = GREEN if player.on_ground else RED
-        text = self.font_small.render(status_text, True, color)
+        text = self.text_cache.render(self.font_small, status_text, True, color)
         screen.blit(text, (SCREEN_WIDTH - 150, 35))
 
         # 蓄力狀態
         if player.jump_charging:
             charge_text = f"蓄力: {player.jump_power:.1f}"
-            text = self.font_small.render(charge_text, True, YELLOW)
-            screen.blit(text, (SCREEN_WIDTH - 150, 60))
+            self.glyph_atlas.draw(
+                screen,
+                self.font_small,
+                charge_text,
+                True,
+                YELLOW,
+                (SCREEN_WIDTH - 150, 60),
+            )
 
     def draw_victory(self, screen, current_level, level_data, player):
         """繪製勝利畫面"""
         screen.fill(DARK_BLUE)
 
         # 勝利訊息
-        title = self.font_large.render("恭喜過關！", True, YELLOW)
+        title = self.text_cache.render(self.font_large, "恭喜過關！", True, YELLOW)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 200))
         screen.blit(title, title_rect)
 
@@ -253,24 +364,26 @@ class UIManager:
             target = level_data["target_deaths"]
 
             stats_text = f"第{current_level}關: {level_data['name']}"
-            text = self.font_medium.render(stats_text, True, WHITE)
+            text = self.text_cache.render(self.font_medium, stats_text, True, WHITE)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 280))
             screen.blit(text, text_rect)
 
             deaths_text = f"死亡次數: {deaths}"
             color = GREEN if deaths <= target else RED
-            text = self.font_medium.render(deaths_text, True, color)
+            text = self.text_cache.render(self.font_medium, deaths_text, True, color)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 320))
             screen.blit(text, text_rect)
 
             target_text = f"目標: {target}次"
-            text = self.font_medium.render(target_text, True, WHITE)
+            text = self.text_cache.render(self.font_medium, target_text, True, WHITE)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 360))
             screen.blit(text, text_rect)
 
             if deaths <= target:
                 perfect_text = "挑戰成功！"
-                text = self.font_medium.render(perfect_text, True, GREEN)
+                text = self.text_cache.render(
+                    self.font_medium, perfect_text, True, GREEN
+                )
                 text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 400))
                 screen.blit(text, text_rect)
 
@@ -280,17 +393,17 @@ class UIManager:
         else:
             continue_text = "你已完成所有關卡！"
 
-        text = self.font_small.render(continue_text, True, WHITE)
+        text = self.text_cache.render(self.font_small, continue_text, True, WHITE)
         text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 480))
         screen.blit(text, text_rect)
 
         back_text = "ESC 返回主選單"
-        text = self.font_small.render(back_text, True, WHITE)
+        text = self.text_cache.render(self.font_small, back_text, True, WHITE)
         text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 510))
         screen.blit(text, text_rect)
 
         # F11全屏快捷鍵說明
         fullscreen_text = "F11 切換全屏"
-        text = self.font_small.render(fullscreen_text, True, GRAY)
+        text = self.text_cache.render(self.font_small, fullscreen_text, True, GRAY)
         text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 540))
         screen.blit(text, text_rect)
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Jump King 難度估計（蒙地卡羅）
+用行程池對每一關模擬大量「像人一樣會失誤」的完整挑戰：
+- 每次跳躍想用的蓄力幀數加上常態分布的誤差（放開 SPACE 太早或太晚）
+- 有一定機率按錯方向
+每次挑戰從起點開始，碰到死亡區域就回到起點並記一次死亡，直到站上目標平台，
+統計過關所需死亡次數的分布，依百分位數建議 target_deaths。
+
+跳躍結果直接查可達圖（真實物理，快取在 data/graph_cache），不必重新模擬；
+玩家在每個停留位置選擇「蓄力稍有誤差也最可能更接近目標」的跳躍。
+第11關的隨機掉落陷阱不在可達圖中，估計值會偏低。
+
+用法: python difficulty_estimator.py [關卡編號...] [--attempts 2000] [--charge-noise 2]
+      [--direction-error 0.03] [--percentile 90] [--seed 0] [--workers 數量]
+（--levels-dir ../../../jumpking/levels 可以估計單檔版本的關卡）
+"""
+import sys
+import os
+import math
+import time
+import random
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from jump_simulator import JUMP_DIRECTIONS, LANDED
+from reachability_graph import load_reachability_graph, level_hash
+
+# 模擬設定
+DEFAULT_ATTEMPTS = 2000  # 每關模擬的完整挑戰次數
+CHARGE_NOISE = 2.0  # 蓄力幀數誤差的標準差（幀）
+DIRECTION_ERROR = 0.03  # 按錯方向的機率
+MAX_JUMPS_PER_ATTEMPT = 5000  # 超過這麼多次跳躍仍未過關視為放棄
+ATTEMPTS_PER_TASK = 250  # 每個工作任務模擬的挑戰次數
+TARGET_PERCENTILE = 90  # 建議的 target_deaths：此百分比的挑戰能在這個死亡次數內過關
+# 建議值的下限：死亡次數超過 target_deaths 就結束挑戰，0 代表第一次死亡就失敗
+MIN_TARGET_DEATHS = 1
+REPORT_PERCENTILES = (10, 25, 50, 75, 90, 95)
+
+_policies = {}  # 工作行程內依 (關卡雜湊, 誤差設定) 快取的策略
+
+
+def charge_weights(charge_noise):
+    """蓄力誤差 -> 機率，常態分布取到三個標準差並正規化"""
+    if charge_noise <= 0:
+        return {0: 1.0}
+    spread = math.ceil(charge_noise * 3)
+    weights = {
+        offset: math.exp(-0.5 * (offset / charge_noise) ** 2)
+        for offset in range(-spread, spread + 1)
+    }
+    total = sum(weights.values())
+    return {offset: weight / total for offset, weight in weights.items()}
+
+
+class DifficultyModel:
+    """
+    關卡可達圖上的馬可夫鏈：停留位置是狀態，每個 (方向, 蓄力幀數) 查表得到結果
+    distance 是每個停留位置到目標平台最少的跳躍次數（到不了為 None）
+    """
+
+    def __init__(self, graph, charge_noise):
+        self.graph = graph
+        self.outcomes = []  # 狀態 -> {(方向, 蓄力幀數): (結果, 落地狀態)}
+        self.max_charge = 0
+        for jumps in graph.transitions:
+            table = {}
+            for direction, charge_frames, outcome, target, *_ in jumps:
+                table[(direction, charge_frames)] = (outcome, target)
+                self.max_charge = max(self.max_charge, charge_frames)
+            self.outcomes.append(table)
+        self.goal_states = {
+            index
+            for index, state in enumerate(graph.states)
+            if state["platform"] in graph.goal_platforms
+        }
+        self.distance = self.goal_distances()
+        self.policy = self.build_policy(charge_weights(charge_noise))
+
+    def goal_distances(self):
+        """從目標狀態沿著落地的跳躍反向廣度優先搜尋"""
+        predecessors = [[] for _ in self.graph.states]
+        for state, table in enumerate(self.outcomes):
+            for outcome, target in table.values():
+                if outcome == LANDED:
+                    predecessors[target].append(state)
+
+        distance = [None] * len(self.graph.states)
+        queue = deque(self.goal_states)
+        for state in self.goal_states:
+            distance[state] = 0
+        while queue:
+            state = queue.popleft()
+            for previous in predecessors[state]:
+                if distance[previous] is None:
+                    distance[previous] = distance[state] + 1
+                    queue.append(previous)
+        return distance
+
+    def build_policy(self, weights):
+        """
+        每個停留位置想要的跳躍：蓄力有誤差時最可能落到更接近目標的位置，
+        機率相同選落點離目標較近的；沒有任何進展的跳躍時為 None
+        """
+        policy = []
+        for state, table in enumerate(self.outcomes):
+            distance = self.distance[state]
+            best = None
+            best_key = None
+            for (direction, charge_frames), (outcome, target) in table.items():
+                if outcome != LANDED or not self.makes_progress(distance, target):
+                    continue
+                success = 0.0
+                for offset, weight in weights.items():
+                    noisy = self.clamp_charge(charge_frames + offset)
+                    other_outcome, other_target = table[(direction, noisy)]
+                    if other_outcome == LANDED and self.makes_progress(
+                        distance, other_target
+                    ):
+                        success += weight
+                key = (success, -self.distance[target])
+                if best_key is None or key > best_key:
+                    best = (direction, charge_frames)
+                    best_key = key
+            policy.append(best)
+        return policy
+
+    def makes_progress(self, distance, target):
+        target_distance = self.distance[target]
+        if target_distance is None:
+            return False
+        return distance is None or target_distance < distance
+
+    def clamp_charge(self, charge_frames):
+        return min(max(charge_frames, 0), self.max_charge)
+
+    def attempt(self, rng, charge_noise, direction_error):
+        """
+        模擬一次完整挑戰，回傳過關前的死亡次數；
+        超過 MAX_JUMPS_PER_ATTEMPT 次跳躍仍未過關，或起點根本到不了目標時回傳 None
+        """
+        if not self.graph.states or self.distance[0] is None:
+            return None
+        deaths = 0
+        state = 0
+        for _ in range(MAX_JUMPS_PER_ATTEMPT):
+            if state in self.goal_states:
+                return deaths
+            intended = self.policy[state]
+            if intended is None:
+                # 沒有路可以往上，只能跳進陷阱或掉下去重來
+                intended = (rng.choice(JUMP_DIRECTIONS), rng.randint(0, self.max_charge))
+            direction, charge_frames = intended
+            if rng.random() < direction_error:
+                direction = rng.choice([d for d in JUMP_DIRECTIONS if d != direction])
+            charge_frames = self.clamp_charge(
+                round(charge_frames + rng.gauss(0, charge_noise))
+            )
+            outcome, target = self.outcomes[state][(direction, charge_frames)]
+            if outcome == LANDED:
+                state = target
+            else:
+                # 死亡、掉出關卡或停不下來都回到起點重新開始
+                deaths += 1
+                state = 0
+        return None
+
+
+def load_model(level_data, charge_noise):
+    """工作行程中取得關卡的模型，同一行程的後續任務直接使用快取"""
+    key = (level_hash(level_data), charge_noise)
+    if key not in _policies:
+        graph = load_reachability_graph(level_data)
+        _policies[key] = DifficultyModel(graph, charge_noise)
+    return _policies[key]
+
+
+def simulate_attempts(level_num, level_data, count, seed, charge_noise, direction_error):
+    """工作行程：模擬 count 次挑戰，回傳 (關卡編號, [死亡次數或 None])"""
+    model = load_model(level_data, charge_noise)
+    rng = random.Random(seed)
+    return level_num, [
+        model.attempt(rng, charge_noise, direction_error) for _ in range(count)
+    ]
+
+
+def estimate_levels(
+    levels,
+    attempts=DEFAULT_ATTEMPTS,
+    charge_noise=CHARGE_NOISE,
+    direction_error=DIRECTION_ERROR,
+    seed=0,
+    workers=None,
+):
+    """
+    用行程池模擬所有關卡，回傳 {關卡編號: [每次挑戰的死亡次數或 None]}
+    每個任務的亂數種子只由 seed、關卡編號與任務順序決定，結果與行程數量無關
+    """
+    results = {level_num: [] for level_num in levels}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # 先讓每關的可達圖各由一個行程建立並寫入快取，避免多個行程重複建立
+        list(executor.map(load_reachability_graph, levels.values()))
+
+        futures = []
+        for level_num, level_data in sorted(levels.items()):
+            for task, first in enumerate(range(0, attempts, ATTEMPTS_PER_TASK)):
+                futures.append(
+                    executor.submit(
+                        simulate_attempts,
+                        level_num,
+                        level_data,
+                        min(ATTEMPTS_PER_TASK, attempts - first),
+                        f"{seed}-{level_num}-{task}",
+                        charge_noise,
+                        direction_error,
+                    )
+                )
+        for future in futures:
+            level_num, deaths = future.result()
+            results[level_num].extend(deaths)
+    return results
+
+
+def percentile(sorted_values, percent):
+    """最近排名法的百分位數"""
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def summarize(deaths, target_deaths, target_percentile=TARGET_PERCENTILE):
+    """
+    死亡次數分布的摘要；放棄的挑戰視為無限多次死亡
+    建議值是 target_percentile% 的挑戰能在此死亡次數內過關（至少 MIN_TARGET_DEATHS），
+    超過 100 - target_percentile% 的挑戰都放棄時為 None
+    """
+    cleared = sorted(d for d in deaths if d is not None)
+    ranked = cleared + [math.inf] * (len(deaths) - len(cleared))
+    summary = {
+        "attempts": len(deaths),
+        "cleared": len(cleared),
+        "mean": sum(cleared) / len(cleared) if cleared else None,
+        "percentiles": {p: percentile(ranked, p) for p in REPORT_PERCENTILES},
+        "within_target": sum(d <= target_deaths for d in cleared) / len(deaths),
+    }
+    suggested = percentile(ranked, target_percentile)
+    if suggested == math.inf:
+        summary["suggested"] = None
+    else:
+        summary["suggested"] = max(suggested, MIN_TARGET_DEATHS)
+    return summary
+
+
+def format_count(value):
+    return "∞" if value == math.inf else str(value)
+
+
+def main(argv=None):
+    from level_loader import LEVELS_DIR
+    from level_manager import LevelManager
+
+    parser = argparse.ArgumentParser(description="蒙地卡羅估計每關過關所需死亡次數")
+    parser.add_argument("levels", nargs="*", type=int, help="關卡編號（預設全部）")
+    parser.add_argument("--levels-dir", default=LEVELS_DIR, help="關卡目錄")
+    parser.add_argument(
+        "--attempts", type=int, default=DEFAULT_ATTEMPTS, help="每關模擬的挑戰次數"
+    )
+    parser.add_argument(
+        "--charge-noise", type=float, default=CHARGE_NOISE, help="蓄力誤差標準差（幀）"
+    )
+    parser.add_argument(
+        "--direction-error", type=float, default=DIRECTION_ERROR, help="按錯方向的機率"
+    )
+    parser.add_argument(
+        "--percentile",
+        type=float,
+        default=TARGET_PERCENTILE,
+        help="建議值讓多少百分比的挑戰能過關",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="亂數種子")
+    parser.add_argument("--workers", type=int, default=None, help="行程數量")
+    args = parser.parse_args(argv)
+
+    level_manager = LevelManager(levels_dir=os.path.abspath(args.levels_dir))
+    level_numbers = args.levels or sorted(level_manager.levels)
+    missing = [num for num in level_numbers if level_manager.get_level(num) is None]
+    if missing:
+        parser.error(f"找不到關卡: {missing}")
+    # 無限關卡的分段在遊戲中即時生成，關卡資料本身無法到達目標
+    levels = {
+        num: level_manager.get_level(num)
+        for num in level_numbers
+        if not level_manager.get_level(num).get("infinite")
+    }
+
+    start_time = time.perf_counter()
+    results = estimate_levels(
+        levels,
+        args.attempts,
+        args.charge_noise,
+        args.direction_error,
+        args.seed,
+        args.workers,
+    )
+    elapsed = time.perf_counter() - start_time
+
+    percentile_names = " ".join(f"p{p:<3}" for p in REPORT_PERCENTILES)
+    print(
+        f"蓄力誤差 σ={args.charge_noise:g} 幀，按錯方向 {args.direction_error:.0%}，"
+        f"每關 {args.attempts} 次挑戰"
+    )
+    print(f"關卡 過關率  平均  {percentile_names} 目前目標(達成率) → 建議")
+    for level_num in sorted(levels):
+        level_data = levels[level_num]
+        summary = summarize(
+            results[level_num], level_data["target_deaths"], args.percentile
+        )
+        mean = "-" if summary["mean"] is None else f"{summary['mean']:.1f}"
+        percentiles = " ".join(
+            f"{format_count(value):<4}" for value in summary["percentiles"].values()
+        )
+        suggested = "-" if summary["suggested"] is None else summary["suggested"]
+        print(
+            f"{level_num:>4} {summary['cleared'] / summary['attempts']:>6.0%} {mean:>5}  "
+            f"{percentiles} {level_data['target_deaths']:>4}({summary['within_target']:>4.0%})"
+            f" → {suggested}"
+        )
+    print(f"共 {elapsed:.1f} 秒")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
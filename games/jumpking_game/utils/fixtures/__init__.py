@@ -0,0 +1,45 @@
+"""
+離線工具測試用的小關卡與共用輔助函式
+level_01 跳兩三次就能到達目標平台；level_02 的目標平台太高，怎麼跳都到不了
+"""
+import os
+import io
+import shutil
+import tempfile
+import contextlib
+
+import reachability_graph
+
+FIXTURE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@contextlib.contextmanager
+def fixture_levels():
+    """
+    把測試關卡複製到暫存目錄（讀取時會在關卡目錄寫入快取），回傳關卡目錄
+    期間的可達圖也快取在暫存目錄，不會寫進 data/graph_cache
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        levels_dir = os.path.join(tmp_dir, "levels")
+        shutil.copytree(
+            FIXTURE_DIR,
+            levels_dir,
+            ignore=shutil.ignore_patterns("*.py", "__pycache__"),
+        )
+        cache_dir = reachability_graph.GRAPH_CACHE_DIR
+        reachability_graph.GRAPH_CACHE_DIR = os.path.join(tmp_dir, "graph_cache")
+        try:
+            yield levels_dir
+        finally:
+            reachability_graph.GRAPH_CACHE_DIR = cache_dir
+
+
+def run_tool(main, argv):
+    """執行工具的 main(argv)，回傳 (結束代碼, 輸出)；參數錯誤時為 argparse 的結束代碼"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        try:
+            code = main(argv)
+        except SystemExit as e:
+            code = e.code
+    return code, output.getvalue()
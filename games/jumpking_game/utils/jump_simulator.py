@@ -0,0 +1,601 @@
+#!/usr/bin/env python3
+"""
+Jump King 批次跳躍模擬器
+把所有可能的跳躍（每個蓄力幀數 × 三個方向）放進 NumPy 陣列一起逐幀推進，
+物理步驟與 src/physics.py 完全相同，用來快速回答「從這裡能跳到哪裡」
+"""
+import sys
+import os
+import math
+import time
+import argparse
+
+import numpy as np
+
+# 添加 src 與 levels 目錄到路徑
+current_dir = os.path.dirname(os.path.abspath(__file__))
+game_dir = os.path.dirname(current_dir)
+sys.path.insert(0, os.path.join(game_dir, "src"))
+sys.path.insert(0, os.path.join(game_dir, "levels"))
+
+import physics
+from game_config import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    GRAVITY,
+    MAX_FALL_SPEED,
+    MAX_JUMP_POWER,
+    PLAYER_WIDTH,
+    PLAYER_HEIGHT,
+)
+
+# 跳躍方向，與 execute_jump 的參數相同
+JUMP_DIRECTIONS = ("left", "up", "right")
+JUMP_ANGLES = {"left": 120, "up": 90, "right": 60}
+
+# 模擬結果
+LANDED = 0  # 落地並停穩
+DEATH = 1  # 碰到死亡區域
+FELL = 2  # 掉出關卡範圍
+TIMEOUT = 3  # 超過模擬幀數仍未停穩
+
+OUTCOME_NAMES = {LANDED: "落地", DEATH: "死亡", FELL: "掉出關卡", TIMEOUT: "逾時"}
+
+SETTLE_SPEED = 0.01  # 在地面上且水平速度低於此值視為停穩
+MAX_SIMULATION_FRAMES = 600  # 單次跳躍最多模擬的幀數（約10秒）
+
+
+def jump_power_levels():
+    """
+    列出按住 SPACE 每多一幀所得到的跳躍力量
+    與 update_jump_charge 一樣用 physics.jump_power_for_ticks 計算，浮點誤差也完全相同
+    """
+    powers = [physics.jump_power_for_ticks(0)]
+    while powers[-1] < MAX_JUMP_POWER:
+        powers.append(physics.jump_power_for_ticks(len(powers)))
+    return powers
+
+
+def jump_candidates(charge_step=1):
+    """
+    所有候選跳躍：回傳方向、蓄力幀數與跳躍力量三個列表
+    charge_step 大於 1 時每隔幾個蓄力幀數才取一個（最大力量一定保留），用來快速粗略搜尋
+    """
+    directions = []
+    charge_frames = []
+    powers = []
+    levels = jump_power_levels()
+    for direction in JUMP_DIRECTIONS:
+        for frames, power in enumerate(levels):
+            if frames % charge_step and frames != len(levels) - 1:
+                continue
+            directions.append(direction)
+            charge_frames.append(frames)
+            powers.append(power)
+    return directions, charge_frames, powers
+
+
+class JumpSimulator:
+    """針對單一關卡的批次跳躍模擬，平台資料在建立時轉成陣列"""
+
+    def __init__(self, level_data, max_frames=MAX_SIMULATION_FRAMES, charge_step=1):
+        self.level_data = level_data
+        self.max_frames = max_frames
+
+        # 陣列直接取自編譯後的關卡，右邊與底部不必重新計算
+        self.level = physics.CompiledLevel(level_data)
+        platforms = self.level.platforms
+        self.platform_x = np.array([p.x for p in platforms], dtype=float)
+        self.platform_y = np.array([p.y for p in platforms], dtype=float)
+        self.platform_width = np.array([p.width for p in platforms], dtype=float)
+        self.platform_height = np.array([p.height for p in platforms], dtype=float)
+        self.platform_right = np.array([p.right for p in platforms], dtype=float)
+        self.platform_bottom = np.array([p.bottom for p in platforms], dtype=float)
+
+        death_zones = self.level.death_zones
+        self.zone_x = np.array([z.x for z in death_zones], dtype=float)
+        self.zone_y = np.array([z.y for z in death_zones], dtype=float)
+        self.zone_right = np.array([z.right for z in death_zones], dtype=float)
+        self.zone_bottom = np.array([z.bottom for z in death_zones], dtype=float)
+
+        # 依頂部排序的索引：每一列只需要比對頂部在附近的矩形（見 rects_in_range）
+        self.platform_order = np.argsort(self.platform_y, kind="stable")
+        self.platform_tops = self.platform_y[self.platform_order]
+        self.max_platform_height = self.platform_height.max(initial=0)
+        self.zone_order = np.argsort(self.zone_y, kind="stable")
+        self.zone_tops = self.zone_y[self.zone_order]
+        self.max_zone_height = (self.zone_bottom - self.zone_y).max(initial=0)
+
+        # 低於所有平台與死亡區域一個畫面高度就不可能再回來
+        self.fall_limit = self.level.bounds.bottom + SCREEN_HEIGHT
+
+        self.directions, self.charge_frames, self.powers = jump_candidates(
+            charge_step
+        )
+
+    def settle(self, x, y, vel_x=0, on_ground=True):
+        """
+        不按任何鍵，用 physics.update_player 推進到玩家在地面上停穩
+        回傳停穩時的 (x, y, vel_x, 平台索引, 幀數)，死亡或逾時回傳 None
+        """
+        level = self.level
+
+        state = physics.PlayerState(x, y)
+        state.vel_x = vel_x
+        state.on_ground = on_ground
+        for frame in range(1, self.max_frames + 1):
+            if physics.update_player(
+                state, level.platforms, level.death_zones, None, level.platform_grid
+            ):
+                return None
+            if state.on_ground and abs(state.vel_x) < SETTLE_SPEED:
+                platform = self.standing_platform(state.x, state.y)
+                return state.x, state.y, state.vel_x, platform, frame
+            if state.y > self.fall_limit:
+                return None
+        return None
+
+    def standing_platform(self, x, y):
+        """找出玩家腳下的平台索引（與地面檢測相同的條件），沒有則回傳 -1"""
+        touching = (
+            (x < self.platform_right)
+            & (x + PLAYER_WIDTH > self.platform_x)
+            & (np.abs(y + PLAYER_HEIGHT - self.platform_y) <= 3)
+        )
+        if not touching.any():
+            return -1
+        return int(touching.argmax())
+
+    def simulate(self, start_x, start_y, start_vel_x=0):
+        """
+        從停在 (start_x, start_y) 的位置同時模擬所有候選跳躍
+        每個候選先在地面上按住 SPACE 蓄力對應的幀數，再放開跳躍，
+        與遊戲逐幀的順序相同（停穩後殘留的微小水平速度由 start_vel_x 傳入）
+        回傳各候選的方向、蓄力幀數、結果、落地平台索引、停穩位置與花費幀數
+        """
+        return self.simulate_many([(start_x, start_y, start_vel_x)])[0]
+
+    def simulate_many(self, starts):
+        """
+        一次模擬多個起點 [(x, y, vel_x), ...] 的所有候選跳躍
+        全部放進同一組陣列推進，起點越多每幀的固定開銷越划算
+        回傳與 starts 順序相同的結果列表（格式同 simulate）
+        """
+        candidate_count = len(self.powers)
+        count = candidate_count * len(starts)
+        powers = np.array(self.powers, dtype=float)
+        candidate_frames = np.array(self.charge_frames)
+
+        # 與 execute_jump 相同的初速計算（用 math 才能與遊戲的浮點結果一致）
+        cos_values = np.empty(candidate_count)
+        sin_values = np.empty(candidate_count)
+        for index, direction in enumerate(self.directions):
+            angle_rad = math.radians(JUMP_ANGLES[direction])
+            cos_values[index] = math.cos(angle_rad)
+            sin_values[index] = math.sin(angle_rad)
+        jump_force = powers * 1.2
+        jump_vel_x = np.tile(cos_values * jump_force, len(starts))
+        jump_vel_y = np.tile(sin_values * -jump_force, len(starts))
+        charge_frames = np.tile(candidate_frames, len(starts))
+
+        # 放開 SPACE 之前同一個起點的所有候選都一樣站在原地蓄力，
+        # 每個起點只推進一列（waiting），放開的那一幀才複製成各候選的列
+        starts = np.array(starts, dtype=float).reshape(-1, 3)
+        start_of = np.repeat(np.arange(len(starts)), candidate_count)
+        releases = {
+            frames: np.flatnonzero(charge_frames == frames)
+            for frames in np.unique(candidate_frames)
+        }
+        last_release = int(candidate_frames.max()) if candidate_count else -1
+        waiting = np.arange(len(starts)) if candidate_count else np.arange(0)
+        wait_x, wait_y, wait_vel_x = starts[:, 0], starts[:, 1], starts[:, 2]
+        wait_vel_y = np.zeros(len(starts))
+        wait_ground = np.ones(len(starts), dtype=bool)
+        wait_support = np.full(len(starts), -1)
+
+        # 已經放開、進行中的候選（完成後從陣列移除）
+        ids = np.arange(0)
+        x = np.empty(0)
+        y = np.empty(0)
+        vel_x = np.empty(0)
+        vel_y = np.empty(0)
+        on_ground = np.zeros(0, dtype=bool)
+        support = np.full(0, -1)
+
+        outcome = np.full(count, TIMEOUT)
+        platform = np.full(count, -1)
+        final_x = np.full(count, np.nan)
+        final_y = np.full(count, np.nan)
+        final_vel_x = np.full(count, np.nan)
+        frames = np.full(count, self.max_frames)
+
+        for frame in range(1, self.max_frames + 1):
+            # 放開 SPACE：先執行跳躍，同一幀再更新物理
+            releasing = releases.get(frame - 1)
+            if releasing is not None and len(waiting):
+                releasing = releasing[np.isin(start_of[releasing], waiting)]
+                source = np.searchsorted(waiting, start_of[releasing])
+                jumping = wait_ground[source]
+                released_vel_x = np.where(
+                    jumping, jump_vel_x[releasing], wait_vel_x[source]
+                )
+                released_vel_y = np.where(
+                    jumping, jump_vel_y[releasing], wait_vel_y[source]
+                )
+                ids = np.concatenate([ids, releasing])
+                x = np.concatenate([x, wait_x[source]])
+                y = np.concatenate([y, wait_y[source]])
+                vel_x = np.concatenate([vel_x, released_vel_x])
+                vel_y = np.concatenate([vel_y, released_vel_y])
+                on_ground = np.concatenate([on_ground, np.zeros(len(source), bool)])
+                support = np.concatenate([support, wait_support[source]])
+            if frame - 1 >= last_release and len(waiting):
+                # 所有候選都已放開
+                waiting = waiting[:0]
+                wait_x, wait_y = wait_x[:0], wait_y[:0]
+                wait_vel_x, wait_vel_y = wait_vel_x[:0], wait_vel_y[:0]
+                wait_ground, wait_support = wait_ground[:0], wait_support[:0]
+
+            # 蓄力中的列接在後面一起推進
+            active = len(ids)
+            x, y, vel_x, vel_y, on_ground, support, dead = self.step(
+                np.concatenate([x, wait_x]),
+                np.concatenate([y, wait_y]),
+                np.concatenate([vel_x, wait_vel_x]),
+                np.concatenate([vel_y, wait_vel_y]),
+                np.concatenate([on_ground, wait_ground]),
+                np.concatenate([support, wait_support]),
+            )
+            fell = (y > self.fall_limit) & ~dead
+
+            if len(waiting):
+                wait_x, wait_y = x[active:], y[active:]
+                wait_vel_x, wait_vel_y = vel_x[active:], vel_y[active:]
+                wait_ground, wait_support = on_ground[active:], support[active:]
+                # 蓄力途中死亡或掉出關卡：還沒放開的候選都在這一幀結束
+                wait_done = dead[active:] | fell[active:]
+                if wait_done.any():
+                    unreleased = np.flatnonzero(
+                        np.isin(start_of, waiting[wait_done]) & (charge_frames >= frame)
+                    )
+                    source = np.searchsorted(waiting, start_of[unreleased])
+                    outcome[unreleased] = np.where(dead[active:][source], DEATH, FELL)
+                    final_x[unreleased] = wait_x[source]
+                    final_y[unreleased] = wait_y[source]
+                    final_vel_x[unreleased] = wait_vel_x[source]
+                    frames[unreleased] = frame
+
+                    keep = ~wait_done
+                    waiting = waiting[keep]
+                    wait_x, wait_y = wait_x[keep], wait_y[keep]
+                    wait_vel_x, wait_vel_y = wait_vel_x[keep], wait_vel_y[keep]
+                    wait_ground, wait_support = wait_ground[keep], wait_support[keep]
+
+            x, y, vel_x, vel_y = x[:active], y[:active], vel_x[:active], vel_y[:active]
+            on_ground, support = on_ground[:active], support[:active]
+            dead, fell = dead[:active], fell[:active]
+
+            landed = on_ground & (np.abs(vel_x) < SETTLE_SPEED) & ~dead
+            done = dead | landed | fell
+            if done.any():
+                finished = ids[done]
+                outcome[ids[dead]] = DEATH
+                outcome[ids[fell]] = FELL
+                outcome[ids[landed]] = LANDED
+                platform[ids[landed]] = support[landed]
+                final_x[finished] = x[done]
+                final_y[finished] = y[done]
+                final_vel_x[finished] = vel_x[done]
+                frames[finished] = frame
+
+                keep = ~done
+                ids = ids[keep]
+                x, y = x[keep], y[keep]
+                vel_x, vel_y = vel_x[keep], vel_y[keep]
+                on_ground, support = on_ground[keep], support[keep]
+            if len(ids) == 0 and len(waiting) == 0:
+                break
+
+        results = []
+        for start in range(len(starts)):
+            rows = slice(start * candidate_count, (start + 1) * candidate_count)
+            results.append(
+                {
+                    "direction": list(self.directions),
+                    "charge_frames": candidate_frames,
+                    "jump_power": powers,
+                    "outcome": outcome[rows],
+                    "platform": platform[rows],
+                    "x": final_x[rows],
+                    "y": final_y[rows],
+                    "vel_x": final_vel_x[rows],
+                    "frames": frames[rows],
+                }
+            )
+        return results
+
+    def step(self, x, y, vel_x, vel_y, on_ground, support):
+        """所有候選推進一次物理更新，對應 physics.update_player（不含隨機掉落陷阱）"""
+        width = PLAYER_WIDTH
+        height = PLAYER_HEIGHT
+        platform_x = self.platform_x
+        platform_y = self.platform_y
+        platform_right = self.platform_right
+        platform_bottom = self.platform_bottom
+
+        # 處理重力
+        vel_y = np.where(on_ground, vel_y, np.minimum(vel_y + GRAVITY, MAX_FALL_SPEED))
+
+        # 更新位置
+        start_x, start_y = x, y
+        x = x + vel_x
+        y = y + vel_y
+
+        # 檢查屏幕邊界並反彈
+        wall_width = 10
+        hit_left = x <= wall_width
+        x = np.where(hit_left, wall_width, x)
+        vel_x = np.where(hit_left & (vel_x < 0), -vel_x * 0.7, vel_x)
+        hit_right = x + width >= SCREEN_WIDTH - wall_width
+        x = np.where(hit_right, SCREEN_WIDTH - wall_width - width, x)
+        vel_x = np.where(hit_right & (vel_x > 0), -vel_x * 0.7, vel_x)
+
+        # 連續碰撞檢測：停在本幀最先撞到的平台上
+        if physics.SWEPT_COLLISION and len(platform_x):
+            x, y, vel_x, vel_y = self.sweep(x, y, vel_x, vel_y, start_x, start_y)
+
+        # 檢查死亡區域（先用頂部範圍篩選，多留 1 像素避免浮點誤差，再精確比對）
+        rows, zones = rects_in_range(
+            self.zone_tops,
+            self.zone_order,
+            y - self.max_zone_height - 1,
+            y + height + 1,
+        )
+        touching = (
+            (x[rows] < self.zone_right[zones])
+            & (x[rows] + width > self.zone_x[zones])
+            & (y[rows] < self.zone_bottom[zones])
+            & (y[rows] + height > self.zone_y[zones])
+        )
+        dead = np.zeros(len(x), dtype=bool)
+        dead[rows[touching]] = True
+
+        # 檢查平台碰撞：與 pygame.Rect 相同使用截斷成整數的座標判斷重疊
+        rect_x = np.trunc(x)
+        rect_y = np.trunc(y)
+        rows, columns = rects_in_range(
+            self.platform_tops,
+            self.platform_order,
+            rect_y - self.max_platform_height - 1,
+            rect_y + height + 1,
+        )
+        overlapping = (
+            (rect_x[rows] < platform_right[columns])
+            & (rect_x[rows] + width > platform_x[columns])
+            & (rect_y[rows] < platform_bottom[columns])
+            & (rect_y[rows] + height > platform_y[columns])
+            & ~dead[rows]
+        )
+        hit_rows, hit_columns = rows[overlapping], columns[overlapping]
+        ground_detected = np.zeros(len(x), dtype=bool)
+        support = support.copy()
+
+        # 依平台原始順序逐一處理，結果才會與逐一檢查完全一致；
+        # 每個平台只計算與它重疊的列
+        hit_platforms = np.unique(hit_columns)
+        if len(hit_platforms):
+            x, y, vel_x, vel_y = x.copy(), y.copy(), vel_x.copy(), vel_y.copy()
+        for index in hit_platforms:
+            rows = hit_rows[hit_columns == index]
+            hit_x, hit_y = x[rows], y[rows]
+            hit_vel_x, hit_vel_y = vel_x[rows], vel_y[rows]
+            overlap_left = (hit_x + width) - platform_x[index]
+            overlap_right = platform_right[index] - hit_x
+            overlap_top = (hit_y + height) - platform_y[index]
+            overlap_bottom = platform_bottom[index] - hit_y
+            min_overlap = np.minimum(
+                np.minimum(overlap_left, overlap_right),
+                np.minimum(overlap_top, overlap_bottom),
+            )
+
+            from_top = (min_overlap == overlap_top) & (hit_vel_y >= 0)
+            hit = ~from_top
+            from_bottom = hit & (min_overlap == overlap_bottom) & (hit_vel_y <= 0)
+            hit &= ~from_bottom
+            from_left = hit & (min_overlap == overlap_left) & (hit_vel_x >= 0)
+            hit &= ~from_left
+            from_right = hit & (min_overlap == overlap_right) & (hit_vel_x <= 0)
+
+            hit_y = np.where(from_top, platform_y[index] - height, hit_y)
+            y[rows] = np.where(from_bottom, platform_bottom[index], hit_y)
+            vel_y[rows] = np.where(from_top | from_bottom, 0, hit_vel_y)
+            hit_x = np.where(from_left, platform_x[index] - width, hit_x)
+            x[rows] = np.where(from_right, platform_right[index], hit_x)
+            vel_x[rows] = np.where(from_left | from_right, -hit_vel_x * 0.6, hit_vel_x)
+            ground_detected[rows] |= from_top
+            support[rows[from_top]] = index
+
+        # 詳細地面檢測：找出第一個頂部落在玩家腳底 ±3 像素內的平台
+        probing = ~ground_detected & ~dead & (vel_y >= -0.5)
+        if probing.any() and len(platform_x):
+            probe_rows = np.flatnonzero(probing)
+            feet = y[probe_rows] + height
+            rows, columns = rects_in_range(
+                self.platform_tops, self.platform_order, feet - 4, feet + 4
+            )
+            probe_x = x[probe_rows[rows]]
+            touching = (
+                (probe_x < platform_right[columns])
+                & (probe_x + width > platform_x[columns])
+                & (np.abs(feet[rows] - platform_y[columns]) <= 3)
+            )
+            rows, columns = probe_rows[rows[touching]], columns[touching]
+            if len(rows):
+                # 每一列取原始順序最前面的平台
+                order = np.lexsort((columns, rows))
+                rows, columns = rows[order], columns[order]
+                first = np.ones(len(rows), dtype=bool)
+                first[1:] = rows[1:] != rows[:-1]
+                rows, columns = rows[first], columns[first]
+                y = y.copy()
+                vel_y = vel_y.copy()
+                y[rows] = platform_y[columns] - height
+                vel_y[rows] = 0
+                ground_detected[rows] = True
+                support[rows] = columns
+
+        # 減少水平速度（摩擦力）
+        vel_x = np.where(ground_detected, vel_x * 0.8, vel_x * 0.95)
+
+        return x, y, vel_x, vel_y, ground_detected, support, dead
+
+    def sweep(self, x, y, vel_x, vel_y, start_x, start_y):
+        """連續碰撞檢測，對應 physics.sweep_platform_collision"""
+        width = PLAYER_WIDTH
+        height = PLAYER_HEIGHT
+
+        # 只處理往下落、而且腳底在本幀越過平台頂部的組合（多留 1 像素避免浮點誤差）
+        falling = np.flatnonzero(y > start_y)
+        rows, columns = rects_in_range(
+            self.platform_tops,
+            self.platform_order,
+            start_y[falling] + height - 1,
+            y[falling] + height + 1,
+        )
+        rows = falling[rows]
+        if len(rows) == 0:
+            return x, y, vel_x, vel_y
+
+        delta_x = x[rows] - start_x[rows]
+        delta_y = y[rows] - start_y[rows]
+        x_entry, x_exit, x_valid = sweep_axis(
+            start_x[rows],
+            width,
+            delta_x,
+            self.platform_x[columns],
+            self.platform_right[columns],
+        )
+        y_entry, y_exit, y_valid = sweep_axis(
+            start_y[rows],
+            height,
+            delta_y,
+            self.platform_y[columns],
+            self.platform_bottom[columns],
+        )
+
+        entry_time = np.maximum(x_entry, y_entry)
+        exit_time = np.minimum(x_exit, y_exit)
+        # 起點已重疊、本幀碰不到或從側面撞上的平台交給一般碰撞處理
+        valid = (
+            x_valid
+            & y_valid
+            & (entry_time >= 0)
+            & (entry_time <= 1)
+            & (entry_time < exit_time)
+            & (y_entry >= x_entry)
+        )
+        if not valid.any():
+            return x, y, vel_x, vel_y
+
+        # 每個候選取最早撞到的平台，同時撞到時取原始順序較前的平台
+        rows, columns, entry_time = rows[valid], columns[valid], entry_time[valid]
+        order = np.lexsort((columns, entry_time, rows))
+        rows, columns = rows[order], columns[order]
+        entry_time = entry_time[order]
+        first = np.ones(len(rows), dtype=bool)
+        first[1:] = rows[1:] != rows[:-1]
+        rows, columns, entry_time = rows[first], columns[first], entry_time[first]
+
+        # 從上方落下：停在撞擊當下的位置（平台頂部），水平位移只算到撞擊為止
+        x = x.copy()
+        y = y.copy()
+        vel_y = vel_y.copy()
+        x[rows] = start_x[rows] + (x[rows] - start_x[rows]) * entry_time
+        y[rows] = self.platform_y[columns] - height
+        vel_y[rows] = 0
+        return x, y, vel_x, vel_y
+
+
+def rects_in_range(tops, order, low, high):
+    """
+    tops 是依頂部排序的矩形頂部，order 是對應的原始索引
+    回傳每一列頂部在 [low, high] 之間的所有 (列, 矩形索引) 組合
+    """
+    first = np.searchsorted(tops, low, side="left")
+    last = np.searchsorted(tops, high, side="right")
+    counts = last - first
+    rows = np.repeat(np.arange(len(counts)), counts)
+    offsets = np.repeat(first - (np.cumsum(counts) - counts), counts)
+    return rows, order[offsets + np.arange(len(rows))]
+
+
+def sweep_axis(start, size, delta, platform_start, platform_end):
+    """
+    physics.sweep_axis 的陣列版本
+    回傳開始重疊時間、結束重疊時間，以及該軸是否可能重疊
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        near = np.where(delta > 0, platform_start - (start + size), platform_end - start)
+        far = np.where(delta > 0, platform_end - start, platform_start - (start + size))
+        entry_time = near / delta
+        exit_time = far / delta
+
+    # 這一軸沒有移動時，只看是否已經重疊
+    still = delta == 0
+    overlapping = (start < platform_end) & (start + size > platform_start)
+    entry_time = np.where(still, -np.inf, entry_time)
+    exit_time = np.where(still, np.inf, exit_time)
+    valid = ~still | overlapping
+    return entry_time, exit_time, valid
+
+
+def print_landings(level_num, level_data, start_x=None, start_y=None):
+    """印出從起點出發的所有跳躍結果"""
+    if start_x is None:
+        start_x, start_y = level_data["start_pos"]
+
+    simulator = JumpSimulator(level_data)
+    rest = simulator.settle(start_x, start_y)
+    if rest is None:
+        print(f"第{level_num}關 ({start_x}, {start_y}) 無法站穩")
+        return
+    start_x, start_y, start_vel_x = rest[:3]
+
+    start_time = time.perf_counter()
+    result = simulator.simulate(start_x, start_y, start_vel_x)
+    elapsed = (time.perf_counter() - start_time) * 1000
+
+    print(f"第{level_num}關 從 ({start_x:.1f}, {start_y:.1f}) 出發")
+    print(f"模擬 {len(result['outcome'])} 種跳躍，耗時 {elapsed:.1f} ms")
+    print("=" * 30)
+    for index, direction in enumerate(result["direction"]):
+        outcome = result["outcome"][index]
+        text = OUTCOME_NAMES[outcome]
+        if outcome == LANDED:
+            text += f" 平台{result['platform'][index]}"
+            text += f" ({result['x'][index]:.1f}, {result['y'][index]:.1f})"
+        print(
+            f"{direction:>5} 蓄力{result['charge_frames'][index]:2d}幀"
+            f" 力度{result['jump_power'][index]:5.2f}: {text}"
+        )
+
+
+def main(argv=None):
+    from level_loader import LEVELS_DIR
+    from level_manager import LevelManager
+
+    parser = argparse.ArgumentParser(description="印出從關卡起點出發的所有跳躍結果")
+    parser.add_argument("level", nargs="?", type=int, default=1, help="關卡編號（預設 1）")
+    parser.add_argument("--levels-dir", default=LEVELS_DIR, help="關卡目錄")
+    args = parser.parse_args(argv)
+
+    level_manager = LevelManager(levels_dir=os.path.abspath(args.levels_dir))
+    level_data = level_manager.get_level(args.level)
+    if level_data is None:
+        parser.error(f"找不到第{args.level}關")
+    print_landings(args.level, level_data)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Jump King 關卡生成農場
+隨機提出關卡（LevelManager 的關卡格式，起點平台下方是深淵），用真實物理
+（批次跳躍模擬器）從起點廣度優先搜尋，能到達目標平台才收進關卡庫，保證每一關都有解。
+用行程池同時驗證，輸出的目錄可以直接給 LevelManager(levels_dir=...) 讀取：
+每關一個 level_XXXX.json，附上難度資料（路線跳躍數、最窄平台、死亡區域密度）
+驗證一個候選關卡在單一核心上約 0.6～0.75 秒（每分鐘每核心約 80～100 個候選），
+每分鐘上千個候選需要十幾個以上的行程
+
+用法: python level_generator.py 輸出目錄 [--count 200] [--seed 0] [--workers 數量]
+"""
+import sys
+import os
+import time
+import random
+import argparse
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from jump_simulator import JumpSimulator, LANDED
+from reachability_graph import POSITION_BUCKET, goal_platform_indices
+from level_loader import dump_level
+from game_config import SCREEN_WIDTH, PLAYER_WIDTH, PLAYER_HEIGHT
+
+# 生成設定
+START_Y = 550  # 起點平台頂部
+START_HEIGHT = 30
+PLATFORM_HEIGHT = 20
+# 起點下方整片深淵：掉下去就死，驗證時不必模擬回到地面後的所有跳躍
+ABYSS = {"x": 0, "y": 620, "width": SCREEN_WIDTH, "height": 100}
+MIN_PLATFORMS = 6
+MAX_PLATFORMS = 10
+MAX_ROUTE_JUMPS = 30  # 驗證時最多搜尋的跳躍次數
+MIN_ROUTE_JUMPS = 3  # 太短的路線不收進關卡庫
+SEEDS_PER_TASK = 8  # 每個工作行程一次處理的候選關卡數量
+
+
+def lerp(start, end, ratio):
+    return start + (end - start) * ratio
+
+
+def rects_overlap(a, b):
+    return (
+        a["x"] < b["x"] + b["width"]
+        and a["x"] + a["width"] > b["x"]
+        and a["y"] < b["y"] + b["height"]
+        and a["y"] + a["height"] > b["y"]
+    )
+
+
+def propose_level(seed):
+    """
+    依種子提出一個候選關卡，同一個種子永遠得到同一個關卡
+    難度（0～1）決定平台寬度、垂直間距、水平位移與死亡區域數量
+    """
+    rng = random.Random(seed)
+    difficulty = rng.random()
+
+    start_width = rng.randint(150, 300)
+    x = rng.randint(50, SCREEN_WIDTH - 50 - start_width)
+    platforms = [{"x": x, "y": START_Y, "width": start_width, "height": START_HEIGHT}]
+    start_pos = (x + (start_width - PLAYER_WIDTH) // 2, START_Y - PLAYER_HEIGHT)
+    y = START_Y
+    for _ in range(rng.randint(MIN_PLATFORMS, MAX_PLATFORMS)):
+        width = int(lerp(160, 50, difficulty) * rng.uniform(0.7, 1.3))
+        shift = int(lerp(150, 330, difficulty))
+        x = max(0, min(SCREEN_WIDTH - width, x + rng.randint(-shift, shift)))
+        y -= int(lerp(70, 130, difficulty) * rng.uniform(0.8, 1.2))
+        platforms.append({"x": x, "y": y, "width": width, "height": PLATFORM_HEIGHT})
+    goal_y = platforms[-1]["y"]
+
+    # 死亡區域不能碰到任何平台，也不能碰到站在平台上的玩家
+    standing_areas = [
+        {
+            "x": p["x"] - PLAYER_WIDTH,
+            "y": p["y"] - PLAYER_HEIGHT,
+            "width": p["width"] + PLAYER_WIDTH * 2,
+            "height": p["height"] + PLAYER_HEIGHT,
+        }
+        for p in platforms
+    ]
+    death_zones = [dict(ABYSS)]
+    for _ in range(round(lerp(0, 6, difficulty) * rng.random() * 2)):
+        for _attempt in range(10):
+            zone = {
+                "x": rng.randint(0, SCREEN_WIDTH - 30),
+                "y": rng.randint(goal_y, START_Y - 60),
+                "width": rng.randint(10, 30),
+                "height": rng.randint(40, 120),
+            }
+            if not any(rects_overlap(zone, area) for area in standing_areas):
+                death_zones.append(zone)
+                break
+
+    return {
+        "name": f"生成關卡 #{seed}",
+        "platforms": platforms,
+        "death_zones": death_zones,
+        "goal_y": goal_y,
+        "start_pos": start_pos,
+        "target_deaths": 0,  # 驗證後依路線長度設定
+    }
+
+
+def shortest_route_length(level_data):
+    """
+    從起點逐層廣度優先模擬跳躍，回傳到達目標平台最少需要的跳躍次數
+    到不了或超過 MAX_ROUTE_JUMPS 回傳 None（停留位置的合併方式與可達圖相同）
+    模擬每一個蓄力幀數，結果與 route_solver 的最少跳躍路線相同；
+    跳躍數會決定 target_deaths，所以不用隔幀取樣的粗略搜尋（會多算或少算跳躍數）
+    """
+    simulator = JumpSimulator(level_data)
+    goal_platforms = set(goal_platform_indices(level_data))
+
+    rest = simulator.settle(*level_data["start_pos"])
+    if rest is None:
+        return None
+    start_x, start_y, start_vel_x, start_platform = rest[:4]
+    if start_platform in goal_platforms:
+        return 0
+
+    visited = {(start_platform, int(start_x // POSITION_BUCKET))}
+    frontier = [(start_x, start_y, start_vel_x)]
+    for jumps in range(1, MAX_ROUTE_JUMPS + 1):
+        next_frontier = []
+        for result in simulator.simulate_many(frontier):
+            for index in range(len(result["outcome"])):
+                if result["outcome"][index] != LANDED:
+                    continue
+                platform = int(result["platform"][index])
+                if platform in goal_platforms:
+                    return jumps
+                landing_x = float(result["x"][index])
+                key = (platform, int(landing_x // POSITION_BUCKET))
+                if key not in visited:
+                    visited.add(key)
+                    landing_y = float(result["y"][index])
+                    landing_vel_x = float(result["vel_x"][index])
+                    next_frontier.append((landing_x, landing_y, landing_vel_x))
+        if not next_frontier:
+            return None
+        frontier = next_frontier
+    return None
+
+
+def difficulty_metadata(level_data, route_length):
+    """關卡庫的難度資料"""
+    climbing = level_data["platforms"][1:]  # 起點平台不算
+    height = START_Y - level_data["goal_y"]
+    traps = level_data["death_zones"][1:]  # 深淵不算
+    zone_area = sum(z["width"] * z["height"] for z in traps)
+    return {
+        "route_length": route_length,
+        "min_platform_width": min(p["width"] for p in climbing),
+        "death_zone_density": round(zone_area / (height * SCREEN_WIDTH), 4),
+        "height": height,
+    }
+
+
+def verify_seeds(first_seed, count, min_route=MIN_ROUTE_JUMPS):
+    """工作行程：提出並驗證連續的種子，回傳 (候選數量, [通過驗證的關卡])"""
+    verified = []
+    for seed in range(first_seed, first_seed + count):
+        level_data = propose_level(seed)
+        route_length = shortest_route_length(level_data)
+        if route_length is None or route_length < min_route:
+            continue
+        level_data["difficulty"] = difficulty_metadata(level_data, route_length)
+        level_data["seed"] = seed
+        # 暫定的目標死亡次數：路線越長、陷阱越多越寬鬆
+        traps = len(level_data["death_zones"]) - 1  # 深淵不算
+        level_data["target_deaths"] = route_length * 3 + traps
+        verified.append(level_data)
+    return count, verified
+
+
+def generate_library(count, first_seed=0, workers=None, min_route=MIN_ROUTE_JUMPS):
+    """
+    用行程池生成 count 個通過驗證的關卡，依種子排序回傳
+    回傳 (關卡列表, 檢查過的候選數量)
+    """
+    workers = workers or os.cpu_count() or 1
+    levels = []
+    candidates = 0
+    next_seed = first_seed
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        while True:
+            # 保持每個行程都有工作，收集到足夠的關卡就不再派新的種子
+            while len(levels) < count and len(pending) < workers * 2:
+                pending.add(
+                    executor.submit(verify_seeds, next_seed, SEEDS_PER_TASK, min_route)
+                )
+                next_seed += SEEDS_PER_TASK
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                checked, verified = future.result()
+                candidates += checked
+                levels.extend(verified)
+
+    levels.sort(key=lambda level: level["seed"])
+    return levels[:count], candidates
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="生成保證有解的關卡庫")
+    parser.add_argument("output", help="輸出目錄")
+    parser.add_argument("--count", type=int, default=200, help="要生成的關卡數量")
+    parser.add_argument("--seed", type=int, default=0, help="第一個候選關卡的種子")
+    parser.add_argument("--workers", type=int, default=None, help="行程數量")
+    parser.add_argument(
+        "--min-route", type=int, default=MIN_ROUTE_JUMPS, help="最少路線跳躍數"
+    )
+    args = parser.parse_args(argv)
+
+    workers = args.workers or os.cpu_count() or 1
+    start_time = time.perf_counter()
+    levels, candidates = generate_library(
+        args.count, args.seed, workers, args.min_route
+    )
+    elapsed = time.perf_counter() - start_time
+
+    os.makedirs(args.output, exist_ok=True)
+    digits = max(4, len(str(len(levels))))
+    for number, level_data in enumerate(levels, 1):
+        path = os.path.join(args.output, f"level_{number:0{digits}d}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(dump_level(level_data))
+
+    print(
+        f"檢查 {candidates} 個候選關卡，{len(levels)} 個有解"
+        f"（{elapsed:.1f} 秒，每分鐘 {candidates / elapsed * 60:.0f} 個候選，"
+        f"{workers} 個行程）"
+    )
+    if levels:
+        routes = [level["difficulty"]["route_length"] for level in levels]
+        print(f"路線跳躍數 {min(routes)}～{max(routes)}，已寫入 {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
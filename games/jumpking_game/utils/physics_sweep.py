@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Jump King 物理參數掃描
+在一組物理參數組合上，用行程池同時以可達圖（真實物理）檢查每一關是否有解、
+最少需要幾跳，印出表格與每個參數「所有關卡仍然有解」的安全範圍。
+每個任務模擬時把參數套用到 game_config 與讀取它的模組，結束後還原，
+可達圖的快取鍵包含物理設定，同一組參數第二次掃描直接讀取快取。
+
+預設一次只改變一個參數（其他維持 game_config 的值），乘上 SWEEP_FACTORS；
+指定參數的值時改為所有指定值的完整組合：
+    python physics_sweep.py
+    python physics_sweep.py 1 2 3 --gravity 0.4 0.5 0.6 --max-jump-power 18 20
+（單檔版本 jumpking.py 的物理常數與 game_config 相同，
+ --levels-dir ../../../jumpking/levels 可以掃描單檔版本的關卡）
+"""
+import sys
+import os
+import time
+import argparse
+import itertools
+import contextlib
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+
+import jump_simulator
+import reachability_graph
+import physics
+import game_config
+
+# 可以掃描的參數與命令列選項
+PHYSICS_PARAMETERS = {
+    "GRAVITY": "--gravity",
+    "MAX_FALL_SPEED": "--max-fall-speed",
+    "MAX_JUMP_POWER": "--max-jump-power",
+    "MIN_JUMP_POWER": "--min-jump-power",
+    "JUMP_CHARGE_RATE": "--jump-charge-rate",
+}
+SWEEP_FACTORS = (0.8, 0.9, 1.1, 1.2)  # 預設掃描時相對於目前設定的倍數
+
+# 從 game_config 匯入物理常數的模組，掃描時一起改
+PHYSICS_MODULES = (game_config, physics, jump_simulator, reachability_graph)
+
+
+def base_settings():
+    """game_config 目前的物理參數"""
+    return {name: getattr(game_config, name) for name in PHYSICS_PARAMETERS}
+
+
+@contextlib.contextmanager
+def applied_settings(settings):
+    """
+    with 區塊內把物理參數套用到所有讀取它的模組，離開時還原
+    src/physics.py 與模擬器都直接讀取模組常數，所以只能暫時替換
+    """
+    saved = [
+        (module, name, getattr(module, name))
+        for module in PHYSICS_MODULES
+        for name in settings
+        if hasattr(module, name)
+    ]
+    try:
+        for module, name, _ in saved:
+            setattr(module, name, settings[name])
+        yield
+    finally:
+        for module, name, value in saved:
+            setattr(module, name, value)
+
+
+def valid_settings(settings):
+    """參數組合是否能模擬：蓄力要會增加，最小力量不能超過最大力量"""
+    return (
+        settings["GRAVITY"] > 0
+        and settings["MAX_FALL_SPEED"] > 0
+        and settings["JUMP_CHARGE_RATE"] > 0
+        and 0 < settings["MIN_JUMP_POWER"] <= settings["MAX_JUMP_POWER"]
+    )
+
+
+def one_at_a_time_grid(base, factors=SWEEP_FACTORS):
+    """目前設定，加上每次只把一個參數乘上 factors 的組合"""
+    grid = [dict(base)]
+    for name in PHYSICS_PARAMETERS:
+        for factor in factors:
+            settings = dict(base)
+            settings[name] = round(base[name] * factor, 4)
+            grid.append(settings)
+    return grid
+
+
+def product_grid(base, values):
+    """values: 參數 -> 值列表，沒有指定的參數維持目前設定"""
+    names = list(PHYSICS_PARAMETERS)
+    choices = [values.get(name) or [base[name]] for name in names]
+    return [dict(zip(names, combination)) for combination in itertools.product(*choices)]
+
+
+def evaluate(settings, level_num, level_data):
+    """
+    工作行程：以指定物理參數檢查一關
+    回傳 (關卡編號, 最少跳躍數)，無解時跳躍數為 None
+    """
+    with applied_settings(settings):
+        graph = reachability_graph.load_reachability_graph(level_data)
+    # 可達圖是廣度優先建立的，第一個到達目標平台的狀態就是跳躍次數最少的
+    for state_index, state in enumerate(graph.states):
+        if state["platform"] in graph.goal_platforms:
+            return level_num, len(graph.route_to(state_index))
+    return level_num, None
+
+
+def sweep(grid, levels, workers=None):
+    """
+    用行程池檢查每個參數組合下的每一關
+    回傳與 grid 同順序的 [{關卡編號: 最少跳躍數或 None}]
+    """
+    level_items = sorted(levels.items())
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            [
+                executor.submit(evaluate, settings, level_num, level_data)
+                for level_num, level_data in level_items
+            ]
+            for settings in grid
+        ]
+        return [dict(future.result() for future in row) for row in futures]
+
+
+def safe_envelope(grid, results, base):
+    """
+    每個參數在其他參數維持目前設定時，所有關卡都有解的連續範圍
+    回傳 參數 -> (最小值, 最大值)，目前設定本身就有關卡無解時為 None；
+    只有一個值（沒有被掃描）或沒有掃描到目前設定的參數不列出
+    """
+    envelope = {}
+    for name in PHYSICS_PARAMETERS:
+        solvable = {}
+        for settings, routes in zip(grid, results):
+            others_at_base = all(
+                settings[other] == base[other]
+                for other in PHYSICS_PARAMETERS
+                if other != name
+            )
+            if others_at_base:
+                solvable[settings[name]] = all(
+                    route is not None for route in routes.values()
+                )
+        if len(solvable) < 2 or base[name] not in solvable:
+            continue
+        if not solvable[base[name]]:
+            envelope[name] = None
+            continue
+        values = sorted(solvable)
+        position = values.index(base[name])
+        low = high = position
+        while low > 0 and solvable[values[low - 1]]:
+            low -= 1
+        while high < len(values) - 1 and solvable[values[high + 1]]:
+            high += 1
+        envelope[name] = (values[low], values[high])
+    return envelope
+
+
+def display_width(text):
+    """終端機顯示寬度，中文字佔兩格"""
+    return sum(
+        2 if unicodedata.east_asian_width(char) in "WF" else 1 for char in text
+    )
+
+
+def pad(text, width):
+    return text + " " * (width - display_width(text))
+
+
+def format_table(grid, results, base, level_numbers):
+    """每列一組參數（只列出與目前設定不同的參數），每欄一關的最少跳躍數，✗ 表示無解"""
+    rows = []
+    for settings, routes in zip(grid, results):
+        changed = [
+            f"{name}={settings[name]:g}"
+            for name in PHYSICS_PARAMETERS
+            if settings[name] != base[name]
+        ]
+        cells = [
+            "✗" if routes[num] is None else str(routes[num]) for num in level_numbers
+        ]
+        failed = sum(routes[num] is None for num in level_numbers)
+        rows.append((", ".join(changed) or "目前設定", cells, failed))
+
+    label_width = max(display_width(label) for label, _, _ in rows)
+    header = f"{pad('參數', label_width)} | " + " ".join(
+        f"{num:>3}" for num in level_numbers
+    )
+    lines = [header, "-" * display_width(header)]
+    for label, cells, failed in rows:
+        status = "全部有解" if not failed else f"{failed} 關無解"
+        lines.append(
+            f"{pad(label, label_width)} | "
+            + " ".join(f"{cell:>3}" for cell in cells)
+            + f" | {status}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    from level_loader import LEVELS_DIR
+    from level_manager import LevelManager
+
+    parser = argparse.ArgumentParser(description="掃描物理參數，找出所有關卡仍有解的範圍")
+    parser.add_argument("levels", nargs="*", type=int, help="關卡編號（預設全部）")
+    parser.add_argument("--levels-dir", default=LEVELS_DIR, help="關卡目錄")
+    parser.add_argument("--workers", type=int, default=None, help="行程數量")
+    for name, option in PHYSICS_PARAMETERS.items():
+        parser.add_argument(
+            option, dest=name, type=float, nargs="+", help=f"{name} 的掃描值"
+        )
+    args = parser.parse_args(argv)
+
+    level_manager = LevelManager(levels_dir=os.path.abspath(args.levels_dir))
+    level_numbers = args.levels or sorted(level_manager.levels)
+    missing = [num for num in level_numbers if level_manager.get_level(num) is None]
+    if missing:
+        parser.error(f"找不到關卡: {missing}")
+    # 無限關卡的分段在遊戲中即時生成，關卡資料本身無法到達目標
+    levels = {
+        num: level_manager.get_level(num)
+        for num in level_numbers
+        if not level_manager.get_level(num).get("infinite")
+    }
+    level_numbers = sorted(levels)
+
+    base = base_settings()
+    values = {name: getattr(args, name) for name in PHYSICS_PARAMETERS}
+    if any(values.values()):
+        grid = product_grid(base, values)
+    else:
+        grid = one_at_a_time_grid(base)
+    skipped = [settings for settings in grid if not valid_settings(settings)]
+    grid = [settings for settings in grid if valid_settings(settings)]
+    if skipped:
+        print(f"略過 {len(skipped)} 組無法模擬的參數")
+
+    start_time = time.perf_counter()
+    results = sweep(grid, levels, args.workers)
+    elapsed = time.perf_counter() - start_time
+
+    print(format_table(grid, results, base, level_numbers))
+    print("=" * 30)
+    print("安全範圍（其他參數維持目前設定，所有關卡都有解）:")
+    for name, limits in safe_envelope(grid, results, base).items():
+        if limits is None:
+            print(f"  {name}: 目前設定 {base[name]:g} 就有關卡無解")
+        else:
+            print(f"  {name}: {limits[0]:g} ~ {limits[1]:g}（目前 {base[name]:g}）")
+    print(f"{len(grid)} 組參數 × {len(level_numbers)} 關，共 {elapsed:.1f} 秒")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Jump King 平台可達圖
+用真實物理（批次跳躍模擬器）從起點開始探索每一種跳躍，
+建立「平台 → 平台」的有向圖，邊上標示可行的方向與蓄力幀數。
+結果依關卡資料的雜湊值快取在硬碟上，關卡沒改就不必重新計算。
+"""
+import sys
+import os
+import json
+import hashlib
+import time
+import argparse
+
+from jump_simulator import (
+    JumpSimulator,
+    LANDED,
+    SETTLE_SPEED,
+    MAX_SIMULATION_FRAMES,
+)
+import physics
+from game_config import (
+    SCREEN_WIDTH,
+    GRAVITY,
+    MAX_FALL_SPEED,
+    JUMP_CHARGE_RATE,
+    MAX_JUMP_POWER,
+    MIN_JUMP_POWER,
+    PLAYER_WIDTH,
+    PLAYER_HEIGHT,
+)
+
+# 快取設定
+GRAPH_VERSION = 4  # 圖的格式或探索方式改變時遞增，舊快取自動失效
+GRAPH_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "graph_cache"
+)
+
+POSITION_BUCKET = 10  # 同一平台上相距不到此像素的停留位置視為同一個狀態
+
+
+def level_hash(level_data):
+    """計算關卡平台、死亡區域、起點與物理設定的雜湊值，作為快取鍵"""
+    key = {
+        "version": GRAPH_VERSION,
+        "platforms": level_data["platforms"],
+        "death_zones": level_data["death_zones"],
+        "start_pos": list(level_data["start_pos"]),
+        "goal_y": level_data["goal_y"],
+        "physics": [
+            SCREEN_WIDTH,
+            GRAVITY,
+            MAX_FALL_SPEED,
+            JUMP_CHARGE_RATE,
+            MAX_JUMP_POWER,
+            MIN_JUMP_POWER,
+            PLAYER_WIDTH,
+            PLAYER_HEIGHT,
+            physics.SWEPT_COLLISION,
+            SETTLE_SPEED,
+            MAX_SIMULATION_FRAMES,
+            POSITION_BUCKET,
+        ],
+    }
+    text = json.dumps(key, sort_keys=True)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class ReachabilityGraph:
+    """
+    關卡的可達圖
+    states：探索到的停留位置（平台索引與精確座標），第一次到達的跳躍記在 parent/jump，
+            沿著 parent 往回走就是一條可以逐幀重現的路線
+    transitions：每個停留位置的所有候選跳躍
+                 (方向, 蓄力幀數, 結果, 落地狀態索引, 停穩時的 x, y, vel_x)
+    """
+
+    def __init__(self, level_hash, platform_count, goal_platforms, states, transitions):
+        self.level_hash = level_hash
+        self.platform_count = platform_count
+        self.goal_platforms = set(goal_platforms)
+        self.states = states
+        self.transitions = transitions
+        self.edges = self.build_edges()
+
+    def build_edges(self):
+        """把停留位置之間的跳躍合併成平台之間的邊"""
+        edges = {}
+        for state_index, jumps in enumerate(self.transitions):
+            from_platform = self.states[state_index]["platform"]
+            for direction, charge_frames, outcome, target, *_ in jumps:
+                if outcome != LANDED:
+                    continue
+                to_platform = self.states[target]["platform"]
+                if to_platform == from_platform:
+                    continue
+                edges.setdefault((from_platform, to_platform), []).append(
+                    {
+                        "state": state_index,
+                        "x": self.states[state_index]["x"],
+                        "direction": direction,
+                        "charge_frames": charge_frames,
+                    }
+                )
+        return edges
+
+    def successors(self, platform):
+        """從某個平台能直接跳到的其他平台"""
+        return sorted(to for (start, to) in self.edges if start == platform)
+
+    def reachable_platforms(self):
+        """從起點能到達的所有平台"""
+        return sorted({state["platform"] for state in self.states})
+
+    def goal_reachable(self):
+        """是否能到達任何目標平台"""
+        return bool(self.goal_platforms.intersection(self.reachable_platforms()))
+
+    def route_to(self, state_index):
+        """沿著第一次到達的跳躍回推，取得從起點到指定狀態的 (方向, 蓄力幀數) 序列"""
+        route = []
+        while self.states[state_index]["parent"] is not None:
+            state = self.states[state_index]
+            route.append(tuple(state["jump"]))
+            state_index = state["parent"]
+        route.reverse()
+        return route
+
+    def to_dict(self):
+        return {
+            "level_hash": self.level_hash,
+            "platform_count": self.platform_count,
+            "goal_platforms": sorted(self.goal_platforms),
+            "states": self.states,
+            "transitions": self.transitions,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            data["level_hash"],
+            data["platform_count"],
+            data["goal_platforms"],
+            data["states"],
+            [[tuple(jump) for jump in jumps] for jumps in data["transitions"]],
+        )
+
+
+def goal_platform_indices(level_data):
+    """目標平台的索引（與 Renderer.check_goal_completion 相同的條件）"""
+    return [
+        index
+        for index, platform in enumerate(level_data["platforms"])
+        if platform["y"] <= level_data["goal_y"]
+    ]
+
+
+def build_reachability_graph(level_data, simulator=None):
+    """從起點廣度優先探索所有跳躍，建立可達圖"""
+    if simulator is None:
+        simulator = JumpSimulator(level_data)
+
+    states = []
+    transitions = []
+    state_lookup = {}  # (平台, 位置格) -> 狀態索引
+
+    def add_state(platform, x, y, vel_x, parent, jump):
+        key = (platform, int(x // POSITION_BUCKET))
+        if key in state_lookup:
+            return state_lookup[key], False
+        state_lookup[key] = len(states)
+        states.append(
+            {
+                "platform": platform,
+                "x": x,
+                "y": y,
+                "vel_x": vel_x,
+                "parent": parent,
+                "jump": jump,
+            }
+        )
+        return len(states) - 1, True
+
+    # 起點：玩家出生後先落到平台上站穩
+    rest = simulator.settle(*level_data["start_pos"])
+    if rest is not None:
+        start_x, start_y, start_vel_x, start_platform = rest[:4]
+        add_state(start_platform, start_x, start_y, start_vel_x, None, None)
+
+    # 一次模擬同一層的所有停留位置，建立順序與逐一廣度優先搜尋相同
+    frontier = list(range(len(states)))
+    while frontier:
+        results = simulator.simulate_many(
+            [
+                (states[index]["x"], states[index]["y"], states[index]["vel_x"])
+                for index in frontier
+            ]
+        )
+        next_frontier = []
+        for state_index, result in zip(frontier, results):
+            jumps = []
+            for index, direction in enumerate(result["direction"]):
+                charge_frames = int(result["charge_frames"][index])
+                outcome = int(result["outcome"][index])
+                target = -1
+                landing = (None, None, None)
+                if outcome == LANDED:
+                    landing = (
+                        float(result["x"][index]),
+                        float(result["y"][index]),
+                        float(result["vel_x"][index]),
+                    )
+                    target, created = add_state(
+                        int(result["platform"][index]),
+                        *landing,
+                        state_index,
+                        [direction, charge_frames],
+                    )
+                    if created:
+                        next_frontier.append(target)
+                jumps.append((direction, charge_frames, outcome, target, *landing))
+            transitions.append(jumps)
+        frontier = next_frontier
+
+    return ReachabilityGraph(
+        level_hash(level_data),
+        len(level_data["platforms"]),
+        goal_platform_indices(level_data),
+        states,
+        transitions,
+    )
+
+
+def load_reachability_graph(level_data, cache_dir=None):
+    """
+    讀取快取的可達圖；關卡資料變更或沒有快取時重新建立並寫入
+    cache_dir 預設為 GRAPH_CACHE_DIR（呼叫時才讀取，測試可以改到暫存目錄）
+    """
+    if cache_dir is None:
+        cache_dir = GRAPH_CACHE_DIR
+    cache_file = os.path.join(cache_dir, f"graph_{level_hash(level_data)}.json")
+
+    if os.path.exists(cache_file):
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                return ReachabilityGraph.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"可達圖快取損毀，重新計算: {e}")
+
+    graph = build_reachability_graph(level_data)
+
+    # 先寫暫存檔再替換：行程池中其他行程可能同時讀取同一個快取檔
+    temp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(temp_file, "w", encoding="utf-8") as f:
+            # json.dumps 使用 C 編碼器，比串流寫入的 json.dump 快得多
+            f.write(json.dumps(graph.to_dict()))
+        os.replace(temp_file, cache_file)
+    except OSError as e:
+        print(f"無法寫入可達圖快取: {e}")
+
+    return graph
+
+
+def print_graph_summary(level_num, level_data):
+    """印出關卡的可達圖摘要"""
+    start_time = time.perf_counter()
+    graph = load_reachability_graph(level_data)
+    elapsed = time.perf_counter() - start_time
+
+    reachable = graph.reachable_platforms()
+    status = "✅ 可到達目標" if graph.goal_reachable() else "❌ 無法到達目標"
+    print(f"第{level_num}關 {level_data['name']}: {status}（{elapsed:.2f} 秒）")
+    print(
+        f"  停留位置 {len(graph.states)} 個，"
+        f"可到達平台 {len(reachable)}/{graph.platform_count}，"
+        f"平台之間的邊 {len(graph.edges)} 條"
+    )
+
+    unreachable = sorted(set(range(graph.platform_count)) - set(reachable))
+    if unreachable:
+        print(f"  無法到達的平台: {unreachable}")
+    for platform in reachable:
+        print(f"  平台{platform} → {graph.successors(platform)}")
+
+
+def main(argv=None):
+    from level_loader import LEVELS_DIR
+    from level_manager import LevelManager
+
+    parser = argparse.ArgumentParser(description="建立並印出關卡的平台可達圖")
+    parser.add_argument("levels", nargs="*", type=int, help="關卡編號（預設全部）")
+    parser.add_argument("--levels-dir", default=LEVELS_DIR, help="關卡目錄")
+    args = parser.parse_args(argv)
+
+    level_manager = LevelManager(levels_dir=os.path.abspath(args.levels_dir))
+    level_numbers = args.levels or sorted(level_manager.levels)
+    missing = [num for num in level_numbers if level_manager.get_level(num) is None]
+    if missing:
+        parser.error(f"找不到關卡: {missing}")
+
+    for level_num in level_numbers:
+        print_graph_summary(level_num, level_manager.get_level(level_num))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Jump King 路線求解器
+在平台可達圖上找出從起點到目標平台的路線：
+- 最少跳躍：跳躍次數最少
+- 最低風險：蓄力時間差一兩幀也不容易失敗的路線
+回傳的是可以逐幀重現的 (方向, 蓄力幀數) 按鍵序列
+用行程池同時求解各關；可達圖快取在 data/graph_cache，第一次求解時建立
+用法: python route_solver.py [關卡編號...] [--levels-dir 目錄] [--workers 數量]
+"""
+import sys
+import os
+import math
+import heapq
+import time
+import argparse
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+
+from jump_simulator import JumpSimulator, LANDED, SETTLE_SPEED
+from reachability_graph import POSITION_BUCKET, load_reachability_graph
+import physics
+
+RISK_TIMING_FRAMES = 2  # 評估風險時假設蓄力可能早放或晚放的幀數
+JUMP_COST = 0.001  # 最低風險路線中每多跳一次的額外成本，風險相同時選跳躍較少的
+PREFETCH_POSITIONS = 32  # 最低風險搜尋時一次批次模擬的停留位置數量
+
+DIRECTION_NAMES = {"left": "向左", "up": "向上", "right": "向右"}
+
+
+class RouteSolver:
+    """單一關卡的路線求解，模擬結果依精確停留位置記憶，不會重複計算"""
+
+    def __init__(self, level_data):
+        self.level_data = level_data
+        self.graph = load_reachability_graph(level_data)
+        self.simulator = JumpSimulator(level_data)
+        self.goal_platforms = self.graph.goal_platforms
+
+        # 精確停留位置 (x, y, vel_x) -> [(方向, 蓄力幀數, 結果, 落地平台, x, y, vel_x), ...]
+        self.jump_memo = {}
+        self.risk_memo = {}  # 精確停留位置 -> 每一種跳躍的失敗機率
+        for state, jumps in zip(self.graph.states, self.graph.transitions):
+            self.jump_memo[(state["x"], state["y"], state["vel_x"])] = [
+                (
+                    direction,
+                    charge_frames,
+                    outcome,
+                    self.graph.states[target]["platform"] if target >= 0 else -1,
+                    x,
+                    y,
+                    vel_x,
+                )
+                for direction, charge_frames, outcome, target, x, y, vel_x in jumps
+            ]
+
+    def jumps_from(self, position):
+        """某個精確停留位置的所有候選跳躍（可達圖沒有的位置才重新模擬）"""
+        if position not in self.jump_memo:
+            self.simulate_positions([position])
+        return self.jump_memo[position]
+
+    def simulate_positions(self, positions):
+        """一次模擬多個停留位置並記下結果"""
+        results = self.simulator.simulate_many(positions)
+        for position, result in zip(positions, results):
+            jumps = []
+            for index, direction in enumerate(result["direction"]):
+                outcome = int(result["outcome"][index])
+                landed = outcome == LANDED
+                jumps.append(
+                    (
+                        direction,
+                        int(result["charge_frames"][index]),
+                        outcome,
+                        int(result["platform"][index]),
+                        float(result["x"][index]) if landed else None,
+                        float(result["y"][index]) if landed else None,
+                        float(result["vel_x"][index]) if landed else None,
+                    )
+                )
+            self.jump_memo[position] = jumps
+
+    def jump_risks(self, position):
+        """
+        估計某個停留位置每一種跳躍失敗的機率：蓄力時間在前後 RISK_TIMING_FRAMES 幀內
+        平均分布時，沒有落在同一個平台上的比例（依停留位置記憶）
+        """
+        if position in self.risk_memo:
+            return self.risk_memo[position]
+
+        jumps = self.jumps_from(position)
+        by_direction = {}
+        for jump_index, jump in enumerate(jumps):
+            by_direction.setdefault(jump[0], []).append(jump_index)
+
+        risks = [0.0] * len(jumps)
+        for indices in by_direction.values():
+            indices.sort(key=lambda jump_index: jumps[jump_index][1])
+            charges = [jumps[jump_index][1] for jump_index in indices]
+            for jump_index in indices:
+                charge_frames, platform = jumps[jump_index][1], jumps[jump_index][3]
+                low = bisect_left(charges, charge_frames - RISK_TIMING_FRAMES)
+                high = bisect_right(charges, charge_frames + RISK_TIMING_FRAMES)
+                window = indices[low:high]
+                failures = sum(
+                    jumps[other][2] != LANDED or jumps[other][3] != platform
+                    for other in window
+                )
+                risks[jump_index] = failures / len(window)
+        self.risk_memo[position] = risks
+        return risks
+
+    def start_position(self):
+        """起點停穩後的精確位置與平台"""
+        if not self.graph.states:
+            return None
+        state = self.graph.states[0]
+        return (state["x"], state["y"], state["vel_x"]), state["platform"]
+
+    def min_jump_route(self):
+        """
+        最少跳躍路線
+        可達圖是廣度優先建立的，第一個到達目標平台的狀態就是跳躍次數最少的
+        """
+        for state_index, state in enumerate(self.graph.states):
+            if state["platform"] in self.goal_platforms:
+                return self.describe_route(self.graph.route_to(state_index))
+        return None
+
+    def lowest_risk_route(self):
+        """
+        最低風險路線：以 -log(1 - 失敗機率) 為成本的 Dijkstra 搜尋
+        同一平台相近的位置視為同一個狀態，但保留實際到達的精確位置，
+        所以找到的路線可以逐幀重現
+        """
+        start = self.start_position()
+        if start is None:
+            return None
+        start_position, start_platform = start
+
+        start_key = (start_platform, int(start_position[0] // POSITION_BUCKET))
+        best_cost = {start_key: 0.0}
+        best_position = {start_key: start_position}
+        came_from = {start_key: None}
+        heap = [(0.0, 0, start_key, start_position, start_platform)]
+        counter = 0
+
+        while heap:
+            cost, _, key, position, platform = heapq.heappop(heap)
+            if cost > best_cost[key] or position != best_position[key]:
+                continue  # 已經有更好的路線到達這個狀態
+
+            if platform in self.goal_platforms:
+                route = []
+                while came_from[key] is not None:
+                    key, jump = came_from[key]
+                    route.append(jump)
+                route.reverse()
+                return self.describe_route(route)
+
+            if position not in self.jump_memo:
+                # 順便模擬佇列中其他還沒算過的位置，批次模擬比逐一模擬快得多
+                pending = [position]
+                for entry in heap:
+                    entry_key, entry_position = entry[2], entry[3]
+                    if len(pending) >= PREFETCH_POSITIONS:
+                        break
+                    if (
+                        entry_position == best_position[entry_key]
+                        and entry_position not in self.jump_memo
+                        and entry_position not in pending
+                    ):
+                        pending.append(entry_position)
+                self.simulate_positions(pending)
+
+            jumps = self.jump_memo[position]
+            risks = self.jump_risks(position)
+            for jump_index, jump in enumerate(jumps):
+                direction, charge_frames, outcome, target_platform, x, y, vel_x = jump
+                if outcome != LANDED:
+                    continue
+
+                # 落在同一平台的其他位置也算一步（有些路線需要先調整站位）
+                target_key = (target_platform, int(x // POSITION_BUCKET))
+                if target_key == key:
+                    continue
+
+                risk = risks[jump_index]
+                new_cost = cost - math.log(1 - risk) + JUMP_COST
+                if new_cost >= best_cost.get(target_key, math.inf):
+                    continue
+
+                best_cost[target_key] = new_cost
+                best_position[target_key] = (x, y, vel_x)
+                came_from[target_key] = (key, (direction, charge_frames))
+                counter += 1
+                heapq.heappush(
+                    heap, (new_cost, counter, target_key, (x, y, vel_x), target_platform)
+                )
+
+        return None
+
+    def describe_route(self, route):
+        """沿著路線重新走一次，整理出每一跳的落地平台與整體風險"""
+        start_position, platform = self.start_position()
+        position = start_position
+        platforms = [platform]
+        success = 1.0
+        for direction, charge_frames in route:
+            jumps = self.jumps_from(position)
+            jump_index = next(
+                index
+                for index, jump in enumerate(jumps)
+                if jump[0] == direction and jump[1] == charge_frames
+            )
+            success *= 1 - self.jump_risks(position)[jump_index]
+            jump = jumps[jump_index]
+            platforms.append(jump[3])
+            position = jump[4:7]
+
+        return {
+            "jumps": list(route),
+            "platforms": platforms,
+            "risk": 1 - success,
+        }
+
+
+def replay_route(level_data, route):
+    """
+    用 physics.step 依遊戲的輸入順序重現路線：
+    每次都等玩家停穩才按下 SPACE，蓄力對應幀數後放開
+    回傳最後的玩家狀態，途中死亡則回傳 None
+    """
+    level = physics.CompiledLevel(level_data)
+    state = physics.PlayerState(*level_data["start_pos"])
+    idle = physics.PlayerInput()
+
+    def wait_until_settled():
+        while True:
+            if physics.step(state, idle, level):
+                return False
+            if state.on_ground and abs(state.vel_x) < SETTLE_SPEED:
+                return True
+
+    if not wait_until_settled():
+        return None
+
+    for direction, charge_frames in route:
+        # 按下 SPACE 的那一幀也會蓄力一次，放開的那一幀才跳
+        for frame in range(charge_frames):
+            player_input = physics.PlayerInput(charge_start=frame == 0, charge_held=True)
+            if physics.step(state, player_input, level):
+                return None
+        release = physics.PlayerInput(
+            charge_start=charge_frames == 0, jump_direction=direction
+        )
+        if physics.step(state, release, level):
+            return None
+        if not wait_until_settled():
+            return None
+
+    return state
+
+
+def format_route(route):
+    """把路線整理成攻略的格式"""
+    lines = []
+    for step_number, (jump, platform) in enumerate(
+        zip(route["jumps"], route["platforms"][1:]), 1
+    ):
+        direction, charge_frames = jump
+        lines.append(
+            f"  {step_number}. {DIRECTION_NAMES[direction]} 蓄力{charge_frames}幀"
+            f" → 平台{platform}"
+        )
+    return "\n".join(lines)
+
+
+def solve_level(level_num, level_data):
+    """
+    工作行程：求解單一關卡並驗證路線
+    回傳 (關卡編號, 是否全部路線都通過驗證, 報告文字)
+    """
+    start_time = time.perf_counter()
+    solver = RouteSolver(level_data)
+    routes = [
+        ("最少跳躍", solver.min_jump_route()),
+        ("最低風險", solver.lowest_risk_route()),
+    ]
+    elapsed = time.perf_counter() - start_time
+
+    lines = [f"第{level_num}關 {level_data['name']}（{elapsed:.2f} 秒）"]
+    solved = True
+    for name, route in routes:
+        if route is None:
+            lines.append(f"  {name}: ❌ 找不到路線")
+            solved = False
+            continue
+
+        final_state = replay_route(level_data, route["jumps"])
+        verified = (
+            final_state is not None
+            and solver.simulator.standing_platform(final_state.x, final_state.y)
+            in solver.goal_platforms
+        )
+        solved = solved and verified
+        lines.append(
+            f"  {name}: {len(route['jumps'])} 跳，失誤率 {route['risk']:.0%}"
+            f" {'✅' if verified else '❌ 重現失敗'}"
+        )
+        lines.append(format_route(route))
+    return level_num, solved, "\n".join(lines)
+
+
+def solve_levels(levels, workers=None):
+    """用行程池同時求解多個關卡，依關卡編號回傳 [(關卡編號, 是否解出, 報告文字)]"""
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(solve_level, level_num, level_data)
+            for level_num, level_data in sorted(levels.items())
+        ]
+        return [future.result() for future in futures]
+
+
+def main(argv=None):
+    from level_loader import LEVELS_DIR
+    from level_manager import LevelManager
+
+    parser = argparse.ArgumentParser(description="求解關卡的最少跳躍與最低風險路線")
+    parser.add_argument("levels", nargs="*", type=int, help="關卡編號（預設全部）")
+    parser.add_argument("--levels-dir", default=LEVELS_DIR, help="關卡目錄")
+    parser.add_argument("--workers", type=int, default=None, help="行程數量")
+    args = parser.parse_args(argv)
+
+    level_manager = LevelManager(levels_dir=os.path.abspath(args.levels_dir))
+    level_numbers = args.levels or sorted(level_manager.levels)
+    missing = [num for num in level_numbers if level_manager.get_level(num) is None]
+    if missing:
+        parser.error(f"找不到關卡: {missing}")
+
+    # 無限關卡的分段在遊戲中即時生成，關卡資料本身沒有通往目標的路線
+    levels = {}
+    for level_num in level_numbers:
+        level_data = level_manager.get_level(level_num)
+        if level_data.get("infinite"):
+            print(f"第{level_num}關 {level_data['name']}: 無限關卡，略過")
+        else:
+            levels[level_num] = level_data
+
+    start_time = time.perf_counter()
+    results = solve_levels(levels, args.workers)
+    solved = 0
+    for _, level_solved, report in results:
+        print(report)
+        solved += level_solved
+    print("=" * 30)
+    print(
+        f"解出 {solved}/{len(results)} 關，"
+        f"共 {time.perf_counter() - start_time:.1f} 秒"
+    )
+    return 0 if solved == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+難度估計測試
+確認建議的 target_deaths 至少為 1（0 代表第一次死亡就結束挑戰），
+到不了目標的關卡沒有建議值，結果與行程數量無關，找不到的關卡編號是參數錯誤
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import difficulty_estimator
+from fixtures import fixture_levels, run_tool
+
+
+def test_summary():
+    print("=== 死亡次數摘要測試 ===")
+    summary = difficulty_estimator.summarize([0] * 95 + [3] * 5, 10)
+    assert summary["percentiles"][90] == 0
+    assert summary["suggested"] == difficulty_estimator.MIN_TARGET_DEATHS == 1
+
+    summary = difficulty_estimator.summarize(list(range(10)) + [None] * 2, 5)
+    assert summary["cleared"] == 10 and summary["within_target"] == 6 / 12
+    assert summary["suggested"] is None  # 超過一成放棄，第 90 百分位數是無限多次
+    assert difficulty_estimator.summarize(list(range(1, 11)), 5)["suggested"] == 9
+    print("幾乎不會死的關卡建議 1 次，太多挑戰放棄時沒有建議值 ✅")
+
+
+def test_estimate_levels():
+    print("=== 蒙地卡羅估計測試 ===")
+    from level_manager import LevelManager
+
+    with fixture_levels() as levels_dir:
+        levels = LevelManager(levels_dir=levels_dir).levels
+        one = difficulty_estimator.estimate_levels(levels, 300, seed=1, workers=1)
+        two = difficulty_estimator.estimate_levels(levels, 300, seed=1, workers=2)
+        assert one == two
+        assert len(one[1]) == 300 and all(deaths is not None for deaths in one[1])
+        assert set(one[2]) == {None}  # 到不了目標
+    print("每次挑戰都有結果，行程數量不影響估計 ✅")
+
+
+def test_main():
+    print("=== 命令列測試 ===")
+    with fixture_levels() as levels_dir:
+        argv = ["--levels-dir", levels_dir, "--workers", "1", "--attempts", "100"]
+        code, output = run_tool(difficulty_estimator.main, argv)
+        assert code == 0, output
+        lines = output.splitlines()
+        assert lines[2].split()[0] == "1" and lines[2].endswith("→ 1"), lines[2]
+        assert lines[3].split()[0] == "2" and lines[3].endswith("→ -"), lines[3]
+
+        code, output = run_tool(difficulty_estimator.main, ["99"] + argv)
+        assert code == 2 and "找不到關卡: [99]" in output
+    print("輸出每關的建議值，找不到關卡為參數錯誤 ✅")
+
+
+if __name__ == "__main__":
+    test_summary()
+    test_estimate_levels()
+    test_main()
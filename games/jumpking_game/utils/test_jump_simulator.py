@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+批次跳躍模擬器測試
+確認批次模擬的每一種跳躍都和 physics.step 逐幀重現的結果完全相同，
+一次模擬多個起點與分開模擬一樣，找不到的關卡編號是參數錯誤
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import jump_simulator
+from jump_simulator import JumpSimulator, LANDED, DEATH
+from route_solver import replay_route
+from fixtures import fixture_levels, run_tool
+
+
+def test_matches_scalar_physics():
+    print("=== 批次模擬與逐幀物理比對 ===")
+    from level_manager import LevelManager
+
+    with fixture_levels() as levels_dir:
+        level_data = LevelManager(levels_dir=levels_dir).get_level(1)
+        simulator = JumpSimulator(level_data)
+        start_x, start_y, start_vel_x = simulator.settle(*level_data["start_pos"])[:3]
+        result = simulator.simulate(start_x, start_y, start_vel_x)
+
+        outcomes = set()
+        for index, direction in enumerate(result["direction"]):
+            outcome = int(result["outcome"][index])
+            jump = (direction, int(result["charge_frames"][index]))
+            state = replay_route(level_data, [jump])
+            if outcome == LANDED:
+                assert state is not None, jump
+                assert (state.x, state.y) == (result["x"][index], result["y"][index])
+                platform = simulator.standing_platform(state.x, state.y)
+                assert platform == result["platform"][index], jump
+            elif outcome == DEATH:
+                assert state is None, jump
+            outcomes.add(outcome)
+        assert outcomes == {LANDED, DEATH}
+    print(f"{len(result['outcome'])} 種跳躍的落點與死亡都和逐幀物理相同 ✅")
+
+
+def test_simulate_many():
+    print("=== 多起點批次模擬測試 ===")
+    from level_manager import LevelManager
+
+    with fixture_levels() as levels_dir:
+        level_data = LevelManager(levels_dir=levels_dir).get_level(1)
+        simulator = JumpSimulator(level_data)
+        first = simulator.settle(*level_data["start_pos"])[:3]
+        landed = simulator.simulate(*first)
+        index = list(landed["outcome"]).index(LANDED)
+        second = (landed["x"][index], landed["y"][index], landed["vel_x"][index])
+
+        batched = simulator.simulate_many([first, second])
+        for start, result in zip((first, second), batched):
+            single = simulator.simulate(*start)
+            for key in ("outcome", "platform", "x", "y", "vel_x"):
+                assert list(result[key]) == list(single[key]), key
+    print("一次模擬兩個起點與分開模擬的結果相同 ✅")
+
+
+def test_main():
+    print("=== 命令列測試 ===")
+    with fixture_levels() as levels_dir:
+        argv = ["--levels-dir", levels_dir]
+        code, output = run_tool(jump_simulator.main, ["1"] + argv)
+        assert code == 0, output
+        assert "第1關 從 (185.0, 510.0) 出發" in output
+        assert "模擬 153 種跳躍" in output and "落地 平台1" in output
+
+        code, output = run_tool(jump_simulator.main, ["99"] + argv)
+        assert code == 2 and "找不到第99關" in output
+    print("印出每種跳躍的結果，找不到關卡為參數錯誤 ✅")
+
+
+if __name__ == "__main__":
+    test_matches_scalar_physics()
+    test_simulate_many()
+    test_main()
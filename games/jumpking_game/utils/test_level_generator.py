@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+關卡生成測試
+確認同一個種子得到同一個關卡，記錄的路線跳躍數與 route_solver 的最少跳躍路線相同，
+輸出的關卡庫可以直接給 LevelManager 讀取
+"""
+
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import level_generator
+import route_solver
+from fixtures import fixture_levels, run_tool
+
+
+def test_propose_level_deterministic():
+    print("=== 候選關卡測試 ===")
+    assert level_generator.propose_level(3) == level_generator.propose_level(3)
+    assert level_generator.propose_level(3) != level_generator.propose_level(4)
+    print("同一個種子得到同一個關卡 ✅")
+
+
+def test_route_length_matches_solver():
+    print("=== 路線跳躍數測試 ===")
+    with fixture_levels():
+        # 種子 4 只用隔幀取樣的粗略搜尋會多算兩跳
+        level_data = level_generator.propose_level(4)
+        route_length = level_generator.shortest_route_length(level_data)
+        route = route_solver.RouteSolver(level_data).min_jump_route()
+        assert route is not None and len(route["jumps"]) == route_length == 3
+        assert route_solver.replay_route(level_data, route["jumps"]) is not None
+    print(f"跳躍數 {route_length} 與最少跳躍路線相同，路線能逐幀重現 ✅")
+
+
+def test_main_writes_library():
+    print("=== 關卡庫輸出測試 ===")
+    from level_manager import LevelManager
+
+    seeds_per_task = level_generator.SEEDS_PER_TASK
+    level_generator.SEEDS_PER_TASK = 1  # 只檢查需要的幾個種子
+    try:
+        with tempfile.TemporaryDirectory() as output:
+            argv = [output, "--count", "2", "--seed", "2", "--workers", "1"]
+            code, output_text = run_tool(level_generator.main, argv)
+            assert code == 0, output_text
+            assert "2 個有解" in output_text
+            assert sorted(os.listdir(output)) == ["level_0001.json", "level_0002.json"]
+
+            levels = LevelManager(levels_dir=output).levels
+            for number in (1, 2):
+                level_data = levels[number]
+                route_length = level_data["difficulty"]["route_length"]
+                assert route_length >= level_generator.MIN_ROUTE_JUMPS
+                traps = len(level_data["death_zones"]) - 1
+                assert level_data["target_deaths"] == route_length * 3 + traps
+            assert [levels[number]["seed"] for number in (1, 2)] == [2, 3]
+    finally:
+        level_generator.SEEDS_PER_TASK = seeds_per_task
+    print("關卡庫依種子排序，LevelManager 可以直接讀取 ✅")
+
+
+if __name__ == "__main__":
+    test_propose_level_deterministic()
+    test_route_length_matches_solver()
+    test_main_writes_library()
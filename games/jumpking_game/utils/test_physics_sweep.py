@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+物理參數掃描測試
+確認每個任務結束後物理常數都還原，安全範圍停在第一個無解的參數值之前，
+找不到的關卡編號是參數錯誤
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import physics_sweep
+from fixtures import fixture_levels, run_tool
+
+
+def test_settings_restored():
+    print("=== 物理常數還原測試 ===")
+    from level_manager import LevelManager
+
+    base = physics_sweep.base_settings()
+    with fixture_levels() as levels_dir:
+        level_data = LevelManager(levels_dir=levels_dir).get_level(1)
+        weak = dict(base, MAX_JUMP_POWER=8)
+        assert physics_sweep.evaluate(weak, 1, level_data) == (1, None)
+        for module in physics_sweep.PHYSICS_MODULES:
+            for name, value in base.items():
+                if hasattr(module, name):
+                    assert getattr(module, name) == value, (module.__name__, name)
+
+        # 同一個行程接著用目前設定，結果不受前一個任務影響
+        assert physics_sweep.evaluate(base, 1, level_data)[1] is not None
+    print("任務結束後各模組的物理常數都還原 ✅")
+
+
+def test_sweep_table_and_envelope():
+    print("=== 掃描表格與安全範圍測試 ===")
+    with fixture_levels() as levels_dir:
+        argv = ["--levels-dir", levels_dir, "--workers", "1"]
+        code, output = run_tool(
+            physics_sweep.main, ["1", "--max-jump-power", "8", "20", "24"] + argv
+        )
+        assert code == 0, output
+        assert "MAX_JUMP_POWER=8" in output and "1 關無解" in output
+        assert "MAX_JUMP_POWER: 20 ~ 24（目前 20）" in output
+
+        code, output = run_tool(physics_sweep.main, ["99"] + argv)
+        assert code == 2 and "找不到關卡: [99]" in output
+    print("無解的參數標示 ✗，安全範圍正確，找不到關卡為參數錯誤 ✅")
+
+
+if __name__ == "__main__":
+    test_settings_restored()
+    test_sweep_table_and_envelope()
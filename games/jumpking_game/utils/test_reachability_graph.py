@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+可達圖測試
+確認到得了與到不了的目標都判斷正確，圖上的路線能逐幀重現，
+快取寫在指定目錄且第二次直接讀取，關卡改變後快取失效，找不到的關卡編號是參數錯誤
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import reachability_graph
+from route_solver import replay_route
+from fixtures import fixture_levels, run_tool
+
+
+def test_goal_reachable():
+    print("=== 目標可達性測試 ===")
+    from level_manager import LevelManager
+
+    with fixture_levels() as levels_dir:
+        level_manager = LevelManager(levels_dir=levels_dir)
+        level_data = level_manager.get_level(1)
+        graph = reachability_graph.load_reachability_graph(level_data)
+        assert graph.goal_reachable()
+        assert graph.goal_platforms == {3}
+
+        goal_state = next(
+            index
+            for index, state in enumerate(graph.states)
+            if state["platform"] in graph.goal_platforms
+        )
+        state = replay_route(level_data, graph.route_to(goal_state))
+        assert (state.x, state.y) == (
+            graph.states[goal_state]["x"],
+            graph.states[goal_state]["y"],
+        )
+
+        graph = reachability_graph.load_reachability_graph(level_manager.get_level(2))
+        assert not graph.goal_reachable()
+        assert 3 not in graph.reachable_platforms()
+    print("第1關到得了目標且路線能重現，第2關到不了 ✅")
+
+
+def test_cache():
+    print("=== 可達圖快取測試 ===")
+    from level_manager import LevelManager
+
+    with fixture_levels() as levels_dir:
+        level_data = LevelManager(levels_dir=levels_dir).get_level(1)
+        cache_dir = reachability_graph.GRAPH_CACHE_DIR
+        graph = reachability_graph.load_reachability_graph(level_data)
+        cache_file = f"graph_{reachability_graph.level_hash(level_data)}.json"
+        assert os.listdir(cache_dir) == [cache_file]
+
+        build = reachability_graph.build_reachability_graph
+        reachability_graph.build_reachability_graph = None  # 有快取就不會重新建立
+        try:
+            cached = reachability_graph.load_reachability_graph(level_data)
+        finally:
+            reachability_graph.build_reachability_graph = build
+        assert cached.to_dict() == graph.to_dict()
+        assert cached.edges == graph.edges
+
+        moved = dict(level_data, start_pos=(200, 510))
+        reachability_graph.load_reachability_graph(moved)
+        assert len(os.listdir(cache_dir)) == 2
+    print("快取寫在暫存目錄，第二次直接讀取，關卡改變後重新建立 ✅")
+
+
+def test_main():
+    print("=== 命令列測試 ===")
+    with fixture_levels() as levels_dir:
+        argv = ["--levels-dir", levels_dir]
+        code, output = run_tool(reachability_graph.main, argv)
+        assert code == 0, output
+        assert "第1關 測試關卡: ✅ 可到達目標" in output
+        assert "第2關 到不了的目標: ❌ 無法到達目標" in output
+        assert "無法到達的平台: [3]" in output
+
+        code, output = run_tool(reachability_graph.main, ["99"] + argv)
+        assert code == 2 and "找不到關卡: [99]" in output
+    print("印出每關的可達圖摘要，找不到關卡為參數錯誤 ✅")
+
+
+if __name__ == "__main__":
+    test_goal_reachable()
+    test_cache()
+    test_main()
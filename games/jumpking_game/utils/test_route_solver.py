@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+路線求解器測試
+確認找到的路線能用 physics.step 逐幀重現，
+有關卡解不出來時結束代碼為 1，找不到的關卡編號是參數錯誤
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import route_solver
+from fixtures import fixture_levels, run_tool
+
+
+def test_routes_replay_to_goal():
+    print("=== 路線重現測試 ===")
+    from level_manager import LevelManager
+
+    with fixture_levels() as levels_dir:
+        level_data = LevelManager(levels_dir=levels_dir).get_level(1)
+        solver = route_solver.RouteSolver(level_data)
+        min_jump = solver.min_jump_route()
+        lowest_risk = solver.lowest_risk_route()
+
+        for route in (min_jump, lowest_risk):
+            state = route_solver.replay_route(level_data, route["jumps"])
+            assert state is not None
+            platform = solver.simulator.standing_platform(state.x, state.y)
+            assert platform in solver.goal_platforms
+            assert route["platforms"][-1] == platform
+        assert len(min_jump["jumps"]) <= len(lowest_risk["jumps"])
+        assert lowest_risk["risk"] <= min_jump["risk"]
+    print(f"最少跳躍 {len(min_jump['jumps'])} 跳、最低風險都能逐幀重現到目標 ✅")
+
+
+def test_exit_code():
+    print("=== 結束代碼測試 ===")
+    with fixture_levels() as levels_dir:
+        code, output = run_tool(route_solver.main, ["1", "--levels-dir", levels_dir])
+        assert code == 0, output
+        assert "解出 1/1 關" in output
+
+        # 第2關的目標到不了：CI 要能發現
+        code, output = run_tool(route_solver.main, ["--levels-dir", levels_dir])
+        assert code == 1, output
+        assert "解出 1/2 關" in output and "找不到路線" in output
+
+        code, output = run_tool(route_solver.main, ["99", "--levels-dir", levels_dir])
+        assert code == 2 and "找不到關卡: [99]" in output
+    print("全部解出為 0，有關卡解不出來為 1，找不到關卡為參數錯誤 ✅")
+
+
+if __name__ == "__main__":
+    test_routes_replay_to_goal()
+    test_exit_code()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+關卡檢查測試
+確認重疊平台、蓋住起點的死亡區域、到不了的目標都會被找出來，
+有問題的關卡讓結束代碼為 1，找不到的關卡編號是參數錯誤而不是行程池崩潰
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import validate_levels
+from fixtures import fixture_levels, run_tool
+
+
+def test_validate_level_issues():
+    print("=== 關卡問題檢查 ===")
+    from level_manager import LevelManager
+
+    with fixture_levels() as levels_dir:
+        level_manager = LevelManager(levels_dir=levels_dir)
+        level_data = level_manager.get_level(1)
+        assert validate_levels.validate_level(1, level_data)[1] == []
+
+        _, issues, _ = validate_levels.validate_level(2, level_manager.get_level(2))
+        assert any("無法到達任何目標平台" in issue for issue in issues), issues
+
+        # 多一個與平台1重疊的平台，以及蓋住起點的死亡區域
+        overlapping = dict(level_data["platforms"][1], x=330)
+        start_trap = {"x": 180, "y": 500, "width": 20, "height": 20}
+        broken = dict(
+            level_data,
+            platforms=level_data["platforms"] + [overlapping],
+            death_zones=level_data["death_zones"] + [start_trap],
+        )
+        _, issues, _ = validate_levels.validate_level(1, broken)
+        assert "平台1與平台4重疊" in issues, issues
+        assert any("死亡區域蓋住起點" in issue for issue in issues), issues
+    print("正常關卡沒有問題，重疊、陷阱與到不了的目標都被找出 ✅")
+
+
+def test_exit_code():
+    print("=== 結束代碼測試 ===")
+    with fixture_levels() as levels_dir:
+        argv = ["--levels-dir", levels_dir, "--workers", "1"]
+        code, output = run_tool(validate_levels.main, ["1"] + argv)
+        assert code == 0, output
+        assert "1/1 關通過檢查" in output
+
+        code, output = run_tool(validate_levels.main, argv)
+        assert code == 1, output
+        assert "1/2 關通過檢查" in output
+
+        code, output = run_tool(validate_levels.main, ["99"] + argv)
+        assert code == 2 and "找不到關卡: [99]" in output
+    print("通過為 0，有問題為 1，找不到關卡為參數錯誤 ✅")
+
+
+if __name__ == "__main__":
+    test_validate_level_issues()
+    test_exit_code()
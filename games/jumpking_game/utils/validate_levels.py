@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Jump King 關卡檢查
+用行程池同時檢查所有關卡：
+- 互相重疊的平台
+- 蓋住起點或目標平台的死亡區域
+- 以真實物理（可達圖）無法到達的目標平台
+- 到達後再也跳不出去的平台
+用法: python validate_levels.py [關卡編號...] [--levels-dir 目錄] [--workers 數量]
+（--levels-dir ../../../jumpking/levels 可以檢查單檔版本的關卡）
+"""
+import sys
+import os
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from jump_simulator import LANDED
+from reachability_graph import goal_platform_indices, load_reachability_graph
+from physics import compile_rect, DeathZoneIndex
+from game_config import PLAYER_WIDTH, PLAYER_HEIGHT
+
+
+def overlapping_platforms(platforms):
+    """內部互相重疊的平台索引對（只碰到邊緣不算）"""
+    order = sorted(range(len(platforms)), key=lambda index: platforms[index].x)
+    pairs = []
+    for position, first in enumerate(order):
+        a = platforms[first]
+        for second in order[position + 1 :]:
+            b = platforms[second]
+            if b.x >= a.right:
+                break
+            if a.y < b.bottom and a.bottom > b.y:
+                pairs.append(tuple(sorted((first, second))))
+    return sorted(pairs)
+
+
+def covered_goal_platforms(platforms, goal_indices, death_zone_index):
+    """死亡區域碰到平台本身或站在平台上的玩家的目標平台"""
+    return [
+        index
+        for index in goal_indices
+        if death_zone_index.overlaps(
+            platforms[index].x,
+            platforms[index].y - PLAYER_HEIGHT,
+            platforms[index].width,
+            platforms[index].height + PLAYER_HEIGHT,
+        )
+    ]
+
+
+def inescapable_platforms(graph):
+    """
+    可以到達、卻沒有任何跳躍能落到其他平台的平台（目標平台除外）
+    回傳 [(平台索引, 是否能靠死亡離開)]
+    """
+    leaves = {}  # 平台 -> 是否能落到其他平台
+    can_die = {}
+    for state, jumps in zip(graph.states, graph.transitions):
+        platform = state["platform"]
+        leaves.setdefault(platform, False)
+        can_die.setdefault(platform, False)
+        for _, _, outcome, target, *_ in jumps:
+            if outcome == LANDED:
+                if graph.states[target]["platform"] != platform:
+                    leaves[platform] = True
+            else:
+                can_die[platform] = True
+    return [
+        (platform, can_die[platform])
+        for platform, left in sorted(leaves.items())
+        if not left and platform not in graph.goal_platforms
+    ]
+
+
+def validate_level(level_num, level_data):
+    """檢查一個關卡，回傳 (關卡編號, 問題列表, 花費秒數)"""
+    start_time = time.perf_counter()
+    issues = []
+
+    platforms = [compile_rect(p) for p in level_data["platforms"]]
+    death_zones = [compile_rect(z) for z in level_data["death_zones"]]
+    death_zone_index = DeathZoneIndex(death_zones)
+    goal_indices = goal_platform_indices(level_data)
+
+    for first, second in overlapping_platforms(platforms):
+        issues.append(f"平台{first}與平台{second}重疊")
+
+    start_x, start_y = level_data["start_pos"]
+    if death_zone_index.overlaps(start_x, start_y, PLAYER_WIDTH, PLAYER_HEIGHT):
+        issues.append(f"死亡區域蓋住起點 {tuple(level_data['start_pos'])}")
+
+    if not goal_indices:
+        issues.append(f"沒有頂部在 goal_y={level_data['goal_y']} 以上的目標平台")
+    for index in covered_goal_platforms(platforms, goal_indices, death_zone_index):
+        issues.append(f"死亡區域蓋住目標平台{index}")
+
+    if level_data.get("infinite"):
+        # 無限關卡的分段在遊戲中即時生成，關卡資料本身無法到達目標
+        return level_num, issues, time.perf_counter() - start_time
+
+    graph = load_reachability_graph(level_data)
+    reachable = set(graph.reachable_platforms())
+    if goal_indices and not reachable.intersection(goal_indices):
+        issues.append(f"無法到達任何目標平台 {goal_indices}")
+    for platform, can_die in inescapable_platforms(graph):
+        escape = "只能靠死亡離開" if can_die else "永遠無法離開"
+        issues.append(f"平台{platform}跳不到其他平台（{escape}）")
+
+    return level_num, issues, time.perf_counter() - start_time
+
+
+def validate_levels(levels, workers=None):
+    """用行程池檢查多個關卡，依關卡編號回傳 [(關卡編號, 問題列表, 花費秒數)]"""
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(validate_level, level_num, level_data)
+            for level_num, level_data in sorted(levels.items())
+        ]
+        return [future.result() for future in futures]
+
+
+def main(argv=None):
+    from level_loader import LEVELS_DIR
+    from level_manager import LevelManager
+
+    parser = argparse.ArgumentParser(description="同時檢查所有關卡")
+    parser.add_argument("levels", nargs="*", type=int, help="關卡編號（預設全部）")
+    parser.add_argument("--levels-dir", default=LEVELS_DIR, help="關卡目錄")
+    parser.add_argument("--workers", type=int, default=None, help="行程數量")
+    args = parser.parse_args(argv)
+
+    level_manager = LevelManager(levels_dir=os.path.abspath(args.levels_dir))
+    level_numbers = args.levels or sorted(level_manager.levels)
+    missing = [num for num in level_numbers if level_manager.get_level(num) is None]
+    if missing:
+        parser.error(f"找不到關卡: {missing}")
+    levels = {num: level_manager.get_level(num) for num in level_numbers}
+
+    start_time = time.perf_counter()
+    results = validate_levels(levels, args.workers)
+    failed = 0
+    for level_num, issues, elapsed in results:
+        status = "✅" if not issues else f"❌ {len(issues)} 個問題"
+        print(f"第{level_num}關 {levels[level_num]['name']}: {status}（{elapsed:.2f} 秒）")
+        for issue in issues:
+            print(f"  - {issue}")
+        failed += bool(issues)
+
+    print("=" * 30)
+    print(
+        f"{len(results) - failed}/{len(results)} 關通過檢查，"
+        f"共 {time.perf_counter() - start_time:.1f} 秒"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,15 +2,63 @@ import pygame
 import math
 import json
 import os
+import time
+import threading
+from collections import OrderedDict
+
+# 物理設定與玩家物理（不依賴 pygame，可單獨給模擬工具使用）
+import physics
+from physics import (
+    SCREEN_WIDTH,
+    FPS,
+    GRAVITY,
+    MAX_FALL_SPEED,
+    JUMP_CHARGE_RATE,
+    MAX_JUMP_POWER,
+    MIN_JUMP_POWER,
+    JUMP_POWER_PAUSE_DURATION,
+    PLAYER_WIDTH,
+    PLAYER_HEIGHT,
+    CompiledLevel,
+    StreamingLevel,
+)
+from level_loader import LEVELS_DIR, level_files, load_levels
+from level_pack import LevelPack, PackedLevel, level_pack_files
+from tower import (
+    TOWER_SEGMENT_HEIGHT,
+    DEFAULT_TOWER_SEED,
+    generate_segment,
+    load_tower_file,
+)
 
 # 初始化 Pygame
 pygame.init()
 pygame.mixer.init()
 
-# 遊戲設定
-SCREEN_WIDTH = 1200  # 增加視窗寬度
+# 遊戲設定（SCREEN_WIDTH、FPS 與物理設定定義在 physics.py）
 SCREEN_HEIGHT = 900  # 增加視窗高度
-FPS = 60
+RENDER_FPS = 144  # 畫面更新上限，0 表示不限制
+MAX_FRAME_TIME = 0.25  # 單幀最多補算的時間（秒），機器太慢時寧可掉幀
+RENDER_INTERPOLATION = True  # 在兩次物理更新之間插值繪製玩家與相機
+# 全屏縮放方式："nearest" 最近點縮放、"integer" 只用整數倍放大（像素銳利，四周留黑邊）、
+# "smooth" 平滑縮放
+FULLSCREEN_SCALE_MODE = "nearest"
+
+# 無限之塔（第12關）串流設定（分段生成在 tower.py）
+TOWER_SEED = DEFAULT_TOWER_SEED  # 世界種子，同一個種子永遠生成同一座塔
+TOWER_FILE = "jumpking_tower.json"  # 用 tower.py bake 烘焙的塔檔案，存在時優先使用
+TOWER_GENERATE_ABOVE = 400  # 畫面上方預先生成分段的距離（像素）
+TOWER_KEEP_BELOW = 400  # 畫面下方保留分段的距離，更下方的分段會被移除
+
+# 開發模式：修改 levels/ 中的關卡檔案後，遊戲中直接重新載入（保留玩家位置）
+LEVEL_HOT_RELOAD = False
+LEVEL_RELOAD_INTERVAL = 0.5  # 檢查關卡檔案的間隔（秒）
+
+# 靜態關卡圖層：牆壁、平台與死亡區域進入關卡時先畫成圖塊，每幀只貼上畫面範圍內的圖塊
+STATIC_LEVEL_LAYER = True
+LEVEL_LAYER_TILE_HEIGHT = SCREEN_HEIGHT  # 圖塊高度，畫面最多跨兩個圖塊
+LEVEL_LAYER_MAX_TILES = 8  # 快取的圖塊數量上限，無限關卡往上爬時移除離畫面最遠的
+TEXT_CACHE_SIZE = 256  # 文字快取的 Surface 數量上限，超過時移除最久沒用到的
 
 # 顏色定義
 WHITE = (255, 255, 255)
@@ -26,13 +74,6 @@ PURPLE = (128, 0, 128)
 ORANGE = (255, 165, 0)
 PINK = (255, 192, 203)
 
-# 物理設定
-GRAVITY = 0.5
-MAX_FALL_SPEED = 15
-JUMP_CHARGE_RATE = 0.3
-MAX_JUMP_POWER = 20
-MIN_JUMP_POWER = 5
-
 # 遊戲狀態
 MENU = 0
 PLAYING = 1
@@ -48,8 +89,8 @@ class Player:
     def __init__(self, x, y, game=None):
         self.x = x
         self.y = y
-        self.width = 30
-        self.height = 40
+        self.width = PLAYER_WIDTH
+        self.height = PLAYER_HEIGHT
         self.vel_x = 0
         self.vel_y = 0
         self.on_ground = True  # 初始化時假設在地面上
@@ -58,28 +99,23 @@ class Player:
         self.facing_right = True
         self.start_x = x
         self.start_y = y
+        self.prev_x = x  # 上一次物理更新的位置，用於插值繪製
+        self.prev_y = y
         self.death_count = 0
         self.game = game  # 對遊戲實例的引用，用於播放音效
 
         # 跳躍力量循環系統
         self.jump_power_paused = False  # 是否處於暫停狀態
         self.jump_power_pause_timer = 0  # 暫停計時器
-        self.jump_power_pause_duration = 30  # 暫停幀數（約0.5秒，假設60FPS）
+        self.jump_power_pause_duration = JUMP_POWER_PAUSE_DURATION
+        self.jump_charge_ticks = 0  # 已蓄力的時間（以物理更新次數計）
+        self.jump_charge_started_at = None  # 按下 SPACE 的時間，用來計算蓄力
 
     def reset_position(self):
         """重置玩家位置到關卡起點"""
-        self.x = self.start_x
-        self.y = self.start_y
-        self.vel_x = 0
-        self.vel_y = 0
-        self.on_ground = True  # 確保重置後在地面上
-        self.jump_charging = False
-        self.jump_power = 0
-        self.death_count += 1
-
-        # 重置跳躍力量循環系統
-        self.jump_power_paused = False
-        self.jump_power_pause_timer = 0
+        physics.reset_position(self)
+        self.prev_x = self.x  # 瞬移不做插值
+        self.prev_y = self.y
 
     def set_start_position(self, x, y):
         """設置新的起點位置"""
@@ -87,221 +123,82 @@ class Player:
         self.start_y = y
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.vel_x = 0
         self.vel_y = 0
         self.on_ground = True  # 確保設置後在地面上
 
-    def update(self, platforms, death_zones=None, level_num=None):
-        # 處理重力
-        if not self.on_ground:
-            self.vel_y += GRAVITY
-            if self.vel_y > MAX_FALL_SPEED:
-                self.vel_y = MAX_FALL_SPEED
-
-        # 更新位置
-        self.x += self.vel_x
-        self.y += self.vel_y
-
-        # 檢查屏幕邊界並反彈
-        self.check_screen_boundaries()
-
-        # 特殊處理第11關的掉落機制
-        if level_num == 11 and self.y > 400:  # 當玩家在較高位置時
-            # 如果玩家墜落速度很快且在特定區域，有機率觸發直接掉落
-            if self.vel_y > 10:  # 高速墜落時
-                import random
-
-                # 在特定x座標範圍內，有15%機率直接掉到底部
-                danger_zones = [
-                    (90, 160),  # 第一個危險區域
-                    (240, 310),  # 第二個危險區域
-                    (490, 560),  # 第三個危險區域
-                    (740, 810),  # 第四個危險區域
-                ]
-
-                for min_x, max_x in danger_zones:
-                    if min_x <= self.x + self.width / 2 <= max_x:
-                        if random.random() < 0.15:  # 15%機率
-                            # 直接掉到底部
-                            self.y = 500
-                            self.vel_y = 0
-                            self.reset_position()
-                            return "fall_trap"
-
-        # 特殊處理第12關的無限生成機制
-        if level_num == 12:
-            # 當玩家達到很高的高度時，動態生成新的平台
-            current_height = -self.y  # 轉換為正數高度
-            if current_height > 2000:  # 超過2000像素高度
-                # 觸發無限模式
-                return "infinite_mode"
-
-        # 檢查死亡區域
-        if death_zones:
-            for zone in death_zones:
-                if (
-                    self.x < zone["x"] + zone["width"]
-                    and self.x + self.width > zone["x"]
-                    and self.y < zone["y"] + zone["height"]
-                    and self.y + self.height > zone["y"]
-                ):
-                    return "death"
-
-        # 檢查平台碰撞
-        self.check_platform_collision(platforms)
-
-        # 減少水平速度（摩擦力）
-        if self.on_ground:
-            self.vel_x *= 0.8
-        else:
-            self.vel_x *= 0.95
-
-        return None
+    def update(
+        self,
+        platforms,
+        death_zones=None,
+        level_num=None,
+        platform_grid=None,
+        death_zone_index=None,
+    ):
+        # 記錄更新前的位置供插值繪製
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+        # 物理計算交給不依賴 pygame 的物理核心
+        result = physics.update_player(
+            self,
+            platforms,
+            death_zones,
+            level_num,
+            platform_grid,
+            death_zone_index,
+        )
+        if result == "fall_trap":
+            self.prev_x = self.x
+            self.prev_y = self.y
+        return result
+
+    def get_render_position(self, alpha):
+        """取得上一次與這一次物理更新之間的插值位置（只用於繪製）"""
+        return (
+            self.prev_x + (self.x - self.prev_x) * alpha,
+            self.prev_y + (self.y - self.prev_y) * alpha,
+        )
 
     def check_screen_boundaries(self):
         """檢查屏幕邊界並處理反彈"""
-        wall_width = 10
+        physics.check_screen_boundaries(self)
 
-        # 左邊界（考慮牆壁寬度）
-        if self.x <= wall_width:
-            self.x = wall_width
-            if self.vel_x < 0:  # 只有當玩家向左移動時才反彈
-                self.vel_x = -self.vel_x * 0.7  # 反彈，保持較多速度
-
-        # 右邊界（考慮牆壁寬度）
-        if self.x + self.width >= SCREEN_WIDTH - wall_width:
-            self.x = SCREEN_WIDTH - wall_width - self.width
-            if self.vel_x > 0:  # 只有當玩家向右移動時才反彈
-                self.vel_x = -self.vel_x * 0.7  # 反彈，保持較多速度
-
-    def check_platform_collision(self, platforms):
-        player_rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        was_on_ground = self.on_ground
-        ground_detected = False  # 先用標記而不是直接設置
-
-        for platform in platforms:
-            platform_rect = pygame.Rect(
-                platform["x"], platform["y"], platform["width"], platform["height"]
-            )
+    def check_platform_collision(self, platforms, platform_grid=None):
+        """檢查平台碰撞"""
+        physics.check_platform_collision(self, platforms, platform_grid)
 
-            if player_rect.colliderect(platform_rect):
-                # 改善碰撞檢測 - 更精確的判斷
-                overlap_left = (self.x + self.width) - platform["x"]
-                overlap_right = (platform["x"] + platform["width"]) - self.x
-                overlap_top = (self.y + self.height) - platform["y"]
-                overlap_bottom = (platform["y"] + platform["height"]) - self.y
+    def sweep_platform_collision(self, platforms, start_x, start_y, platform_grid=None):
+        """連續碰撞檢測"""
+        physics.sweep_platform_collision(
+            self, platforms, start_x, start_y, platform_grid
+        )
 
-                # 找出最小重疊方向
-                min_overlap = min(
-                    overlap_left, overlap_right, overlap_top, overlap_bottom
-                )
+    def start_jump_charge(self, timestamp=None):
+        # timestamp 為按下 SPACE 的時間（time.perf_counter）
+        physics.start_jump_charge(self)
+        self.jump_charge_started_at = timestamp
 
-                if min_overlap == overlap_top and self.vel_y >= 0:
-                    # 從上方落下
-                    self.y = platform["y"] - self.height
-                    self.vel_y = 0
-                    ground_detected = True
-                elif min_overlap == overlap_bottom and self.vel_y <= 0:
-                    # 從下方撞擊
-                    self.y = platform["y"] + platform["height"]
-                    self.vel_y = 0
-                elif min_overlap == overlap_left and self.vel_x >= 0:
-                    # 從左側撞擊平台 - 反彈
-                    self.x = platform["x"] - self.width
-                    self.vel_x = -self.vel_x * 0.6  # 反彈，保持更多速度
-                elif min_overlap == overlap_right and self.vel_x <= 0:
-                    # 從右側撞擊平台 - 反彈
-                    self.x = platform["x"] + platform["width"]
-                    self.vel_x = -self.vel_x * 0.6  # 反彈，保持更多速度
-
-        # 詳細地面檢測 - 檢查玩家底部是否接觸任何平台
-        if not ground_detected:
-            for platform in platforms:
-                # 檢查水平重疊
-                if (
-                    self.x < platform["x"] + platform["width"]
-                    and self.x + self.width > platform["x"]
-                ):
-                    # 檢查垂直接觸（允許小誤差）
-                    platform_top = platform["y"]
-                    player_bottom = self.y + self.height
-                    if abs(player_bottom - platform_top) <= 3 and self.vel_y >= -0.5:
-                        ground_detected = True
-                        self.y = platform_top - self.height
-                        self.vel_y = 0
-                        break
-
-        # 只有確認不在地面時才設置為 False
-        self.on_ground = ground_detected
+    def update_jump_charge(self, timestamp=None):
+        # 有按下 SPACE 的時間時依實際經過的時間計算（包含蓄滿暫停循環），
+        # 否則以一次物理更新計
+        if timestamp is None or self.jump_charge_started_at is None:
+            physics.update_jump_charge(self)
+        else:
+            physics.charge_for_duration(self, timestamp - self.jump_charge_started_at)
 
-    def start_jump_charge(self):
-        # 移除 on_ground 檢查，允許任何時候開始蓄力（但執行時仍需檢查）
-        self.jump_charging = True
-        self.jump_power = MIN_JUMP_POWER
-        # 重置暫停狀態
-        self.jump_power_paused = False
-        self.jump_power_pause_timer = 0
+    def execute_jump(self, direction, timestamp=None):
+        # timestamp 為放開 SPACE 的時間，跳躍力量以按住的時間決定，與幀率無關
+        if timestamp is not None and self.jump_charge_started_at is not None:
+            physics.charge_for_duration(self, timestamp - self.jump_charge_started_at)
+        self.jump_charge_started_at = None
 
-    def update_jump_charge(self):
-        # 只要在蓄力就持續處理力量變化
-        if self.jump_charging:
-            if self.jump_power_paused:
-                # 處於暫停狀態，計時器遞減
-                self.jump_power_pause_timer -= 1
-                if self.jump_power_pause_timer <= 0:
-                    # 暫停結束，重新開始充能
-                    self.jump_power_paused = False
-                    self.jump_power = MIN_JUMP_POWER
-            else:
-                # 正常充能狀態
-                self.jump_power += JUMP_CHARGE_RATE
-                if self.jump_power >= MAX_JUMP_POWER:
-                    # 達到最大值，進入暫停狀態
-                    self.jump_power = MAX_JUMP_POWER
-                    self.jump_power_paused = True
-                    self.jump_power_pause_timer = self.jump_power_pause_duration
-
-    def execute_jump(self, direction):
         # 只有在地面上且蓄力時才能跳躍
-        if self.jump_charging and self.on_ground:
-            # 計算跳躍向量
-            angle = 0
-            if direction == "left":
-                angle = 120  # 左上 (調整角度)
-                self.facing_right = False
-            elif direction == "right":
-                angle = 60  # 右上 (調整角度)
-                self.facing_right = True
-            else:  # 直接向上
-                angle = 90
-
-            # 轉換為弧度
-            angle_rad = math.radians(angle)
-
-            # 應用跳躍力 (增強跳躍力)
-            jump_force = self.jump_power * 1.2  # 增加跳躍力
-            self.vel_x = math.cos(angle_rad) * jump_force
-            self.vel_y = math.sin(angle_rad) * -jump_force
-
+        if physics.execute_jump(self, direction) and self.game:
             # 播放跳躍音效
-            if self.game:
-                self.game.play_jump_sound()
-
-            # 重置跳躍狀態
-            self.jump_charging = False
-            self.jump_power = 0
-            self.on_ground = False
-            # 重置暫停狀態
-            self.jump_power_paused = False
-            self.jump_power_pause_timer = 0
-        else:
-            # 即使無法跳躍也要重置蓄力狀態
-            if self.jump_charging:
-                self.jump_charging = False
-                self.jump_power = 0
-                # 重置暫停狀態
-                self.jump_power_paused = False
-                self.jump_power_pause_timer = 0
+            self.game.play_jump_sound()
 
     def draw(self, screen, camera_y):
         # 繪製玩家
@@ -361,526 +258,395 @@ class Player:
 
 
 class LevelManager:
-    def __init__(self):
-        self.levels = self.create_all_levels()
-
-    def generate_infinite_platforms_segment(self, base_y, segment_num):
-        """為無限關卡生成一個階段的平台"""
-        import random
-
-        random.seed(segment_num)  # 使用段數作為種子，確保結果可重現
-
-        platforms = []
-        platform_spacing = 200  # 每個段落的高度間隔
-
-        # 根據段數調整難度
-        difficulty = min(segment_num, 10)  # 最大難度為10
-        platform_size = max(8, 20 - difficulty)  # 平台大小隨難度減小
-        platform_height = max(3, 8 - difficulty // 2)  # 平台高度隨難度減小
-
-        # 每個段落生成6-8個平台
-        num_platforms = random.randint(6, 8)
-
-        for i in range(num_platforms):
-            # 計算平台位置
-            x = random.randint(50, 750)
-            y = base_y + i * (platform_spacing // num_platforms)
-
-            # 添加一些隨機偏移讓路線更有趣
-            x_offset = random.randint(-50, 50)
-            y_offset = random.randint(-20, 20)
-
-            x = max(50, min(750, x + x_offset))
-            y = y + y_offset
-
-            platforms.append(
-                {"x": x, "y": y, "width": platform_size, "height": platform_height}
-            )
-
-        return platforms
-
-    def generate_infinite_death_zones_segment(self, base_y, segment_num):
-        """為無限關卡生成一個階段的死亡區域"""
-        import random
-
-        random.seed(segment_num + 1000)  # 不同的種子避免和平台重疊
-
-        death_zones = []
-
-        # 根據段數調整陷阱密度
-        difficulty = min(segment_num, 10)
-        num_traps = difficulty + 2  # 陷阱數量隨難度增加
-
-        for i in range(num_traps):
-            # 隨機放置陷阱
-            x = random.randint(100, 700)
-            y = base_y + random.randint(-100, 100)
-            width = random.randint(5, 15)
-            height = random.randint(50, 150)
-
-            death_zones.append({"x": x, "y": y, "width": width, "height": height})
-
-        return death_zones
-
-    def create_all_levels(self):
-        """創建所有關卡的平台和死亡區域"""
-        levels = {}
-
-        # 第1關 - 簡單練習
-        levels[1] = {
-            "name": "初學者之路",
-            "platforms": [
-                {"x": 0, "y": 550, "width": 800, "height": 50},  # 地面
-                {"x": 200, "y": 450, "width": 150, "height": 20},
-                {"x": 450, "y": 350, "width": 150, "height": 20},
-                {"x": 200, "y": 250, "width": 150, "height": 20},
-                {"x": 300, "y": 100, "width": 200, "height": 30},  # 目標
-            ],
-            "death_zones": [],
-            "goal_y": 100,
-            "start_pos": (100, 500),
-            "target_deaths": 5,  # 期望死亡次數
-        }
-
-        # 第2關 - 加入陷阱
-        levels[2] = {
-            "name": "小心陷阱",
-            "platforms": [
-                {"x": 0, "y": 550, "width": 800, "height": 50},
-                {"x": 150, "y": 450, "width": 100, "height": 20},
-                {"x": 400, "y": 400, "width": 80, "height": 20},
-                {"x": 100, "y": 300, "width": 80, "height": 20},
-                {"x": 500, "y": 250, "width": 100, "height": 20},
-                {"x": 200, "y": 150, "width": 80, "height": 20},
-                {"x": 350, "y": 50, "width": 100, "height": 30},
-            ],
-            "death_zones": [
-                {"x": 250, "y": 400, "width": 150, "height": 200},  # 陷阱區域
-            ],
-            "goal_y": 50,
-            "start_pos": (100, 500),
-            "target_deaths": 8,
-        }
-
-        # 第3關 - 精確跳躍
-        levels[3] = {
-            "name": "精確控制",
-            "platforms": [
-                {"x": 0, "y": 550, "width": 100, "height": 50},
-                {"x": 180, "y": 450, "width": 60, "height": 20},
-                {"x": 320, "y": 380, "width": 50, "height": 20},
-                {"x": 500, "y": 320, "width": 60, "height": 20},
-                {"x": 650, "y": 250, "width": 50, "height": 20},
-                {"x": 100, "y": 180, "width": 60, "height": 20},
-                {"x": 300, "y": 100, "width": 80, "height": 30},
-            ],
-            "death_zones": [
-                {"x": 0, "y": 600, "width": 800, "height": 100},  # 底部死亡
-            ],
-            "goal_y": 100,
-            "start_pos": (50, 500),
-            "target_deaths": 12,
-        }
+    def __init__(
+        self, tower_seed=TOWER_SEED, tower_file=TOWER_FILE, levels_dir=LEVELS_DIR
+    ):
+        # 關卡資料在 levels/level_XX.json，第一次使用時才讀取（見 levels）
+        self.levels_dir = levels_dir
+        self._levels = None
+        self.level_packs = {}
+        self.file_stats = {}  # 讀取時各關卡檔案的狀態，用來偵測修改（熱重載）
+        self.compiled_levels = {}  # 關卡編號 -> CompiledLevel，第一次進入關卡時編譯
+        # 背景預先建立關卡時，避免與主執行緒重複讀取或編譯同一個關卡
+        self.lock = threading.RLock()
+
+        # 無限之塔：有烘焙好的塔檔案就從檔案讀取（第一次生成分段時才讀取），
+        # 否則依種子即時生成
+        self.tower_seed = tower_seed
+        self.tower_file = None
+        self.tower_file_path = tower_file
+
+    @property
+    def levels(self):
+        """所有關卡資料 {關卡編號: 關卡字典}"""
+        levels = self._levels
+        if levels is not None:
+            return levels
+        with self.lock:
+            if self._levels is None:
+                self._levels = self.load_levels()
+            return self._levels
+
+    def load_levels(self, open_packs=None):
+        """
+        讀取關卡檔案；關卡包 level_XX.jkpack 取代同編號的關卡檔案
+        open_packs 為 {路徑: LevelPack}，其中的關卡包直接沿用，不重新開啟
+        """
+        # 先記錄檔案狀態再讀取，讀取途中的修改會在下次檢查時發現
+        self.file_stats = self.level_file_stats()
+        levels = load_levels(self.levels_dir)
+        open_packs = open_packs or {}
+        # 關卡包的平台留在 mmap 中不讀進記憶體
+        for level_num, path in level_pack_files(self.levels_dir).items():
+            try:
+                level_pack = open_packs.get(path) or LevelPack(path)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"載入關卡包失敗: {e}")
+                continue
+            self.level_packs[level_num] = level_pack
+            levels[level_num] = level_pack.level_data()
+        return levels
 
-        # 第4關 - 移動平台(靜態，但位置更難)
-        levels[4] = {
-            "name": "危險跳躍",
-            "platforms": [
-                {"x": 0, "y": 550, "width": 100, "height": 50},
-                {"x": 150, "y": 480, "width": 40, "height": 15},
-                {"x": 250, "y": 420, "width": 35, "height": 15},
-                {"x": 350, "y": 380, "width": 40, "height": 15},
-                {"x": 500, "y": 320, "width": 35, "height": 15},
-                {"x": 600, "y": 260, "width": 40, "height": 15},
-                {"x": 450, "y": 200, "width": 35, "height": 15},
-                {"x": 200, "y": 140, "width": 40, "height": 15},
-                {"x": 350, "y": 80, "width": 100, "height": 30},
-            ],
-            "death_zones": [
-                {"x": 0, "y": 600, "width": 800, "height": 100},
-                {"x": 100, "y": 450, "width": 50, "height": 150},  # 額外陷阱
-            ],
-            "goal_y": 80,
-            "start_pos": (50, 500),
-            "target_deaths": 15,
-        }
+    def get_level(self, level_num):
+        """獲取指定關卡"""
+        return self.levels.get(level_num)
 
-        # 第5關 - 中級挑戰
-        levels[5] = {
-            "name": "中級試煉",
-            "platforms": [
-                {"x": 0, "y": 550, "width": 80, "height": 50},
-                {"x": 120, "y": 490, "width": 30, "height": 15},
-                {"x": 200, "y": 440, "width": 25, "height": 15},
-                {"x": 300, "y": 400, "width": 30, "height": 15},
-                {"x": 400, "y": 350, "width": 25, "height": 15},
-                {"x": 520, "y": 300, "width": 30, "height": 15},
-                {"x": 600, "y": 240, "width": 25, "height": 15},
-                {"x": 500, "y": 180, "width": 30, "height": 15},
-                {"x": 350, "y": 120, "width": 25, "height": 15},
-                {"x": 200, "y": 60, "width": 30, "height": 15},
-                {"x": 300, "y": 0, "width": 100, "height": 30},
-            ],
-            "death_zones": [
-                {"x": 0, "y": 600, "width": 800, "height": 100},
-                {"x": 80, "y": 450, "width": 40, "height": 100},
-                {"x": 450, "y": 250, "width": 50, "height": 100},
-            ],
-            "goal_y": 0,
-            "start_pos": (40, 500),
-            "target_deaths": 20,
+    def level_file_stats(self):
+        """各關卡檔案與關卡包的 {路徑: (關卡編號, 修改時間, 大小)}"""
+        paths = {
+            os.path.join(self.levels_dir, name): level_num
+            for level_num, name in level_files(self.levels_dir).items()
         }
-
-        # 第6關 - 進階挑戰（重新設計，更流暢的路徑）
-        levels[6] = {
-            "name": "進階挑戰",
-            "platforms": [
-                {"x": 0, "y": 550, "width": 80, "height": 30},  # 起始平台（更大）
-                {"x": 120, "y": 500, "width": 60, "height": 20},  # 簡單開始跳躍
-                {"x": 250, "y": 460, "width": 55, "height": 18},  # 中程跳躍
-                {"x": 150, "y": 400, "width": 55, "height": 18},  # 回跳（技巧性）
-                {"x": 320, "y": 350, "width": 50, "height": 15},  # 前進跳躍
-                {"x": 480, "y": 300, "width": 50, "height": 15},  # 長距離跳躍
-                {"x": 350, "y": 240, "width": 50, "height": 15},  # 精準回跳
-                {"x": 520, "y": 180, "width": 45, "height": 15},  # 挑戰跳躍
+        paths.update(
+            (path, level_num)
+            for level_num, path in level_pack_files(self.levels_dir).items()
+        )
+        stats = {}
+        for path, level_num in paths.items():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # 檢查途中被刪除
+            stats[path] = (level_num, stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def reload_changed_levels(self):
+        """
+        開發模式的熱重載：檢查關卡檔案，只重新讀取並重建有修改的關卡
+        回傳有變更的關卡編號；沒有檔案變動時只需要列出目錄並 stat 各檔案
+        """
+        if self._levels is None:
+            return []
+        stats = self.level_file_stats()
+        if stats == self.file_stats:
+            return []
+
+        with self.lock:
+            old_stats = self.file_stats
+            old_levels = self._levels
+            # 新增、刪除或修改時間、大小改變的檔案
+            touched = {
+                level_num for _, (level_num, _, _) in stats.items() ^ old_stats.items()
+            }
+            old_packs = self.level_packs
+            # 修改時間與大小都沒變的關卡包沿用原本的 mmap
+            unchanged_packs = {
+                level_pack.path: level_pack
+                for level_pack in old_packs.values()
+                if stats.get(level_pack.path) == old_stats.get(level_pack.path)
+            }
+            self.level_packs = {}
+            try:
+                levels = self.load_levels(unchanged_packs)
+            except (ValueError, KeyError, TypeError) as e:
+                # 編輯到一半的檔案，保留原本的關卡，下次存檔時再重新讀取
+                print(f"關卡檔案有錯誤，保留原本的關卡: {e}")
+                self.close_level_packs(self.level_packs, old_packs)
+                self.level_packs = old_packs
+                return []
+            # 只被 touch 的關卡檔案內容沒變，不必重建；重新開啟的關卡包一律重建
+            changed = sorted(
+                level_num
+                for level_num in touched
+                if self.level_packs.get(level_num) is not old_packs.get(level_num)
+                or old_levels.get(level_num) != levels.get(level_num)
+            )
+            self._levels = levels
+            for level_num in changed:
+                self.compiled_levels.pop(level_num, None)
+            # 被取代的關卡包不再使用，立即釋放 mmap，建置工具才能覆寫檔案；
+            # 整個關卡被刪除時遊戲會保留原本的關卡繼續玩，留給垃圾回收
+            self.close_level_packs(
                 {
-                    "x": 300,
-                    "y": 120,
-                    "width": 100,
-                    "height": 25,
-                },  # 目標平台（更大更容易落地）
-            ],
-            "death_zones": [
-                {"x": 0, "y": 600, "width": 1200, "height": 100},  # 底部深淵
-                # 重新設計的陷阱，更合理的位置
-                {"x": 80, "y": 470, "width": 25, "height": 80},  # 第一個陷阱
-                {"x": 200, "y": 420, "width": 25, "height": 80},  # 第二個陷阱
-                {"x": 280, "y": 370, "width": 25, "height": 80},  # 第三個陷阱
-                {"x": 420, "y": 260, "width": 25, "height": 80},  # 第四個陷阱
-                {"x": 460, "y": 200, "width": 25, "height": 80},  # 第五個陷阱
-            ],
-            "goal_y": 120,
-            "start_pos": (40, 520),
-            "target_deaths": 35,  # 稍微降低死亡目標，提高可玩性
-        }
-
-        # 第7關 - 簡單練習（簡化版本）
-        levels[7] = {
-            "name": "簡單練習",
-            "platforms": [
-                {"x": 50, "y": 550, "width": 120, "height": 25},  # 起始平台（加大）
-                # 簡化路線：只保留關鍵平台
-                {"x": 250, "y": 480, "width": 90, "height": 20},  # 第一跳（大平台）
-                {"x": 450, "y": 420, "width": 85, "height": 20},  # 第二跳
-                {"x": 200, "y": 360, "width": 85, "height": 20},  # 回跳
-                {"x": 400, "y": 300, "width": 80, "height": 20},  # 前進
-                {"x": 150, "y": 240, "width": 80, "height": 20},  # 左側
-                {"x": 350, "y": 180, "width": 80, "height": 20},  # 中央
-                {"x": 500, "y": 120, "width": 75, "height": 20},  # 右側
-                # 勝利平台：超大平台
-                {"x": 250, "y": 60, "width": 200, "height": 30},  # 勝利平台（超大）
-            ],
-            "death_zones": [
-                {"x": 0, "y": 600, "width": 1200, "height": 100},  # 底部深淵
-                # 只保留3個簡單陷阱
-                {"x": 380, "y": 350, "width": 8, "height": 100},  # 中間陷阱1
-                {"x": 280, "y": 250, "width": 8, "height": 100},  # 中間陷阱2
-                {"x": 450, "y": 150, "width": 8, "height": 100},  # 上層陷阱
-                # 邊界保護
-                {"x": 0, "y": -50, "width": 8, "height": 400},  # 左邊界
-                {"x": 792, "y": -50, "width": 8, "height": 400},  # 右邊界
-            ],
-            "goal_y": 60,
-            "start_pos": (100, 530),  # 起始位置調整
-            "target_deaths": 8,  # 大幅降低死亡目標
-        }
-
-        # 第8關 - 輕鬆練習（超簡化版本）
-        levels[8] = {
-            "name": "輕鬆練習",
-            "platforms": [
-                {"x": 0, "y": 550, "width": 120, "height": 30},  # 起始平台（超大）
-                {"x": 200, "y": 480, "width": 100, "height": 25},  # 第一跳（超大）
-                {"x": 400, "y": 420, "width": 90, "height": 25},  # 第二跳（大平台）
-                {"x": 250, "y": 360, "width": 90, "height": 25},  # 回跳（大平台）
-                {"x": 450, "y": 300, "width": 85, "height": 25},  # 前進
-                {"x": 200, "y": 240, "width": 85, "height": 25},  # 左側
-                {"x": 400, "y": 180, "width": 80, "height": 25},  # 右側
-                # 勝利平台：超級大平台
-                {"x": 250, "y": 120, "width": 200, "height": 35},  # 勝利平台（超大）
-            ],
-            "death_zones": [
-                {"x": 0, "y": 600, "width": 1200, "height": 100},  # 底部深淵
-                # 只保留2個很小的陷阱
-                {"x": 350, "y": 350, "width": 6, "height": 80},  # 小陷阱1
-                {"x": 320, "y": 220, "width": 6, "height": 80},  # 小陷阱2
-                # 邊界保護
-                {"x": 0, "y": -50, "width": 8, "height": 300},  # 左邊界
-                {"x": 792, "y": -50, "width": 8, "height": 300},  # 右邊界
-            ],
-            "goal_y": 120,
-            "start_pos": (50, 520),
-            "target_deaths": 5,  # 超低死亡目標
-        }
-
-        # 第9關 - 螺旋迷宮（物理驗證挑戰版本）
-        levels[9] = {
-            "name": "螺旋迷宮",
-            "platforms": [
-                # 起始平台
-                {"x": 0, "y": 550, "width": 50, "height": 25},
-                # 第一層螺旋 - 外圈（安全距離）
-                {"x": 200, "y": 480, "width": 25, "height": 12},  # 跳躍距離: 208px
-                {"x": 380, "y": 420, "width": 25, "height": 12},  # 跳躍距離: 188px
-                {"x": 550, "y": 360, "width": 25, "height": 12},  # 跳躍距離: 178px
-                {"x": 700, "y": 300, "width": 25, "height": 12},  # 跳躍距離: 158px
-                {"x": 600, "y": 240, "width": 25, "height": 12},  # 回跳距離: 112px
-                # 第二層螺旋 - 中圈（增加挑戰）
-                {"x": 450, "y": 180, "width": 22, "height": 10},  # 跳躍距離: 158px
-                {"x": 280, "y": 120, "width": 22, "height": 10},  # 跳躍距離: 178px
-                {"x": 120, "y": 60, "width": 22, "height": 10},  # 跳躍距離: 168px
-                {"x": 300, "y": 0, "width": 22, "height": 10},  # 跳躍距離: 188px
-                # 第三層螺旋 - 內圈（最終挑戰）
-                {"x": 500, "y": -60, "width": 20, "height": 8},  # 跳躍距離: 208px
-                {"x": 680, "y": -120, "width": 20, "height": 8},  # 跳躍距離: 188px
-                {"x": 520, "y": -180, "width": 20, "height": 8},  # 跳躍距離: 168px
-                {"x": 340, "y": -240, "width": 20, "height": 8},  # 跳躍距離: 188px
-                # 最終目標
-                {"x": 450, "y": -300, "width": 60, "height": 20},  # 跳躍距離: 128px
-            ],
-            "death_zones": [
-                {"x": 0, "y": 600, "width": 1200, "height": 100},
-                # 第一層螺旋陷阱
-                {"x": 100, "y": 450, "width": 15, "height": 200},  # 外圈陷阱1
-                {"x": 290, "y": 390, "width": 15, "height": 200},  # 外圈陷阱2
-                {"x": 465, "y": 330, "width": 15, "height": 200},  # 外圈陷阱3
-                {"x": 625, "y": 270, "width": 15, "height": 200},  # 邊界陷阱
-                {"x": 525, "y": 210, "width": 15, "height": 200},  # 回程陷阱
-                # 第二層螺旋陷阱
-                {"x": 365, "y": 150, "width": 14, "height": 250},  # 中圈陷阱1
-                {"x": 200, "y": 90, "width": 14, "height": 250},  # 中圈陷阱2
-                {"x": 50, "y": 30, "width": 14, "height": 250},  # 中圈陷阱3
-                {"x": 220, "y": -30, "width": 14, "height": 250},  # 穿越陷阱
-                # 第三層螺旋陷阱
-                {"x": 400, "y": -90, "width": 13, "height": 300},  # 內圈陷阱1
-                {"x": 600, "y": -150, "width": 13, "height": 300},  # 內圈陷阱2
-                {"x": 430, "y": -210, "width": 13, "height": 300},  # 內圈陷阱3
-                {"x": 260, "y": -270, "width": 13, "height": 300},  # 最終陷阱
-                # 邊界死亡牆
-                {"x": 0, "y": -100, "width": 20, "height": 500},  # 左邊界
-                {"x": 780, "y": -100, "width": 20, "height": 500},  # 右邊界
-            ],
-            "goal_y": -300,
-            "start_pos": (25, 525),
-            "target_deaths": 80,  # 有挑戰性但合理
-        }
-
-        # 第10關 - 終極挑戰（物理驗證困難版本）
-        levels[10] = {
-            "name": "終極挑戰",
-            "platforms": [
-                # 起始平台
-                {"x": 0, "y": 550, "width": 45, "height": 20},
-                # 第一階段 - 精密跳躍挑戰
-                {"x": 220, "y": 480, "width": 18, "height": 8},  # 跳躍距離: 228px
-                {"x": 420, "y": 420, "width": 18, "height": 8},  # 跳躍距離: 208px
-                {"x": 600, "y": 360, "width": 18, "height": 8},  # 跳躍距離: 188px
-                {"x": 750, "y": 300, "width": 18, "height": 8},  # 跳躍距離: 158px
-                {"x": 600, "y": 240, "width": 18, "height": 8},  # 回跳距離: 158px
-                # 第二階段 - 高空精密操作
-                {"x": 400, "y": 180, "width": 16, "height": 6},  # 跳躍距離: 208px
-                {"x": 200, "y": 120, "width": 16, "height": 6},  # 跳躍距離: 208px
-                {"x": 50, "y": 60, "width": 16, "height": 6},  # 跳躍距離: 158px
-                {"x": 300, "y": 0, "width": 16, "height": 6},  # 跳躍距離: 258px
-                # 第三階段 - 超高空極限
-                {"x": 550, "y": -60, "width": 14, "height": 5},  # 跳躍距離: 258px
-                {"x": 750, "y": -120, "width": 14, "height": 5},  # 跳躍距離: 208px
-                {"x": 600, "y": -180, "width": 14, "height": 5},  # 跳躍距離: 158px
-                {"x": 400, "y": -240, "width": 14, "height": 5},  # 跳躍距離: 208px
-                {"x": 150, "y": -300, "width": 14, "height": 5},  # 跳躍距離: 258px
-                # 第四階段 - 終極精準
-                {"x": 450, "y": -360, "width": 12, "height": 4},  # 跳躍距離: 308px
-                {"x": 700, "y": -420, "width": 12, "height": 4},  # 跳躍距離: 258px
-                {"x": 500, "y": -480, "width": 12, "height": 4},  # 跳躍距離: 208px
-                {"x": 250, "y": -540, "width": 12, "height": 4},  # 跳躍距離: 258px
-                # 最終目標平台
-                {"x": 400, "y": -600, "width": 60, "height": 20},  # 跳躍距離: 178px
-            ],
-            "death_zones": [
-                {"x": 0, "y": 600, "width": 1200, "height": 100},
-                # 第一階段陷阱
-                {"x": 110, "y": 450, "width": 12, "height": 200},  # 陷阱1
-                {"x": 320, "y": 390, "width": 12, "height": 200},  # 陷阱2
-                {"x": 510, "y": 330, "width": 12, "height": 200},  # 陷阱3
-                {"x": 675, "y": 270, "width": 12, "height": 200},  # 邊界陷阱
-                {"x": 525, "y": 210, "width": 12, "height": 200},  # 回程陷阱
-                # 第二階段陷阱
-                {"x": 300, "y": 150, "width": 11, "height": 250},  # 高空陷阱1
-                {"x": 125, "y": 90, "width": 11, "height": 250},  # 高空陷阱2
-                {"x": 25, "y": 30, "width": 11, "height": 250},  # 邊界陷阱
-                {"x": 175, "y": -30, "width": 11, "height": 250},  # 穿越陷阱
-                # 第三階段陷阱
-                {"x": 425, "y": -90, "width": 10, "height": 300},  # 超高空陷阱1
-                {"x": 675, "y": -150, "width": 10, "height": 300},  # 超高空陷阱2
-                {"x": 525, "y": -210, "width": 10, "height": 300},  # 超高空陷阱3
-                {"x": 275, "y": -270, "width": 10, "height": 300},  # 超高空陷阱4
-                {"x": 75, "y": -330, "width": 10, "height": 300},  # 邊界超高空陷阱
-                # 第四階段陷阱
-                {"x": 325, "y": -390, "width": 9, "height": 350},  # 終極陷阱1
-                {"x": 575, "y": -450, "width": 9, "height": 350},  # 終極陷阱2
-                {"x": 375, "y": -510, "width": 9, "height": 350},  # 終極陷阱3
-                {"x": 125, "y": -570, "width": 9, "height": 350},  # 最終陷阱
-                # 邊界死亡牆
-                {"x": 0, "y": -300, "width": 15, "height": 800},  # 左邊界
-                {"x": 785, "y": -300, "width": 15, "height": 800},  # 右邊界
-                # 天花板
-                {"x": 0, "y": -650, "width": 1200, "height": 40},  # 天花板死亡區
-            ],
-            "goal_y": -600,
-            "start_pos": (22, 530),
-            "target_deaths": 120,  # 很有挑戰性但可達成
-        }
-
-        # 第11關 - 天堂之塔（物理驗證終極挑戰，無岩漿）
-        levels[11] = {
-            "name": "天堂之塔",
-            "platforms": [
-                # 起始平台
-                {"x": 0, "y": 550, "width": 40, "height": 15},
-                # 第一階段 - 基礎攀爬（高度：550 → 200）
-                {"x": 240, "y": 480, "width": 15, "height": 6},  # 跳躍距離: 248px
-                {"x": 480, "y": 420, "width": 15, "height": 6},  # 跳躍距離: 248px
-                {"x": 700, "y": 360, "width": 15, "height": 6},  # 跳躍距離: 228px
-                {"x": 550, "y": 300, "width": 15, "height": 6},  # 回跳距離: 158px
-                {"x": 350, "y": 240, "width": 15, "height": 6},  # 跳躍距離: 208px
-                {"x": 150, "y": 180, "width": 15, "height": 6},  # 跳躍距離: 208px
-                {"x": 400, "y": 120, "width": 15, "height": 6},  # 跳躍距離: 258px
-                {"x": 650, "y": 60, "width": 15, "height": 6},  # 跳躍距離: 258px
-                {"x": 500, "y": 0, "width": 15, "height": 6},  # 跳躍距離: 158px
-                # 第二階段 - 雲端區域（高度：0 → -350）
-                {"x": 250, "y": -60, "width": 12, "height": 5},  # 跳躍距離: 258px
-                {"x": 50, "y": -120, "width": 12, "height": 5},  # 跳躍距離: 208px
-                {"x": 350, "y": -180, "width": 12, "height": 5},  # 跳躍距離: 308px
-                {"x": 600, "y": -240, "width": 12, "height": 5},  # 跳躍距離: 258px
-                {"x": 400, "y": -300, "width": 12, "height": 5},  # 跳躍距離: 208px
-                {"x": 150, "y": -360, "width": 12, "height": 5},  # 跳躍距離: 258px
-                # 第三階段 - 天空殿堂（高度：-360 → -710）
-                {"x": 450, "y": -420, "width": 10, "height": 4},  # 跳躍距離: 308px
-                {"x": 700, "y": -480, "width": 10, "height": 4},  # 跳躍距離: 258px
-                {"x": 500, "y": -540, "width": 10, "height": 4},  # 跳躍距離: 208px
-                {"x": 250, "y": -600, "width": 10, "height": 4},  # 跳躍距離: 258px
-                {"x": 550, "y": -660, "width": 10, "height": 4},  # 跳躍距離: 308px
-                {"x": 750, "y": -720, "width": 10, "height": 4},  # 跳躍距離: 208px
-                # 第四階段 - 星辰領域（高度：-720 → -1070）
-                {"x": 550, "y": -780, "width": 8, "height": 3},  # 跳躍距離: 208px
-                {"x": 300, "y": -840, "width": 8, "height": 3},  # 跳躍距離: 258px
-                {"x": 100, "y": -900, "width": 8, "height": 3},  # 跳躍距離: 208px
-                {"x": 400, "y": -960, "width": 8, "height": 3},  # 跳躍距離: 308px
-                {"x": 650, "y": -1020, "width": 8, "height": 3},  # 跳躍距離: 258px
-                {"x": 450, "y": -1080, "width": 8, "height": 3},  # 跳躍距離: 208px
-                # 第五階段 - 天堂之門（高度：-1080 → -1200）
-                {"x": 200, "y": -1140, "width": 6, "height": 3},  # 跳躍距離: 258px
-                {"x": 500, "y": -1200, "width": 6, "height": 3},  # 跳躍距離: 308px
-                # 最終目標 - 天堂頂峰
-                {"x": 350, "y": -1260, "width": 80, "height": 20},  # 跳躍距離: 178px
-            ],
-            "death_zones": [
-                # 普通地板死亡區域（不是岩漿）
-                {"x": 0, "y": 600, "width": 1200, "height": 100},  # 底部深淵
-                # 第一階段陷阱 - 雲霧陷阱
-                {"x": 120, "y": 450, "width": 8, "height": 200},  # 雲霧陷阱1
-                {"x": 360, "y": 390, "width": 8, "height": 200},  # 雲霧陷阱2
-                {"x": 590, "y": 330, "width": 8, "height": 200},  # 雲霧陷阱3
-                {"x": 450, "y": 270, "width": 8, "height": 200},  # 回程雲霧陷阱
-                {"x": 250, "y": 210, "width": 8, "height": 200},  # 雲霧陷阱4
-                {"x": 50, "y": 150, "width": 8, "height": 200},  # 邊界雲霧陷阱
-                {"x": 275, "y": 90, "width": 8, "height": 200},  # 雲霧陷阱5
-                {"x": 525, "y": 30, "width": 8, "height": 200},  # 雲霧陷阱6
-                # 第二階段陷阱 - 風暴陷阱
-                {"x": 150, "y": -30, "width": 7, "height": 250},  # 風暴陷阱1
-                {"x": 25, "y": -90, "width": 7, "height": 250},  # 邊界風暴陷阱
-                {"x": 225, "y": -150, "width": 7, "height": 250},  # 風暴陷阱2
-                {"x": 475, "y": -210, "width": 7, "height": 250},  # 風暴陷阱3
-                {"x": 325, "y": -270, "width": 7, "height": 250},  # 風暴陷阱4
-                {"x": 75, "y": -330, "width": 7, "height": 250},  # 風暴陷阱5
-                # 第三階段陷阱 - 雷電陷阱
-                {"x": 325, "y": -390, "width": 6, "height": 300},  # 雷電陷阱1
-                {"x": 575, "y": -450, "width": 6, "height": 300},  # 雷電陷阱2
-                {"x": 375, "y": -510, "width": 6, "height": 300},  # 雷電陷阱3
-                {"x": 125, "y": -570, "width": 6, "height": 300},  # 雷電陷阱4
-                {"x": 425, "y": -630, "width": 6, "height": 300},  # 雷電陷阱5
-                {"x": 625, "y": -690, "width": 6, "height": 300},  # 雷電陷阱6
-                # 第四階段陷阱 - 虛空陷阱
-                {"x": 425, "y": -750, "width": 5, "height": 350},  # 虛空陷阱1
-                {"x": 200, "y": -810, "width": 5, "height": 350},  # 虛空陷阱2
-                {"x": 50, "y": -870, "width": 5, "height": 350},  # 虛空陷阱3
-                {"x": 275, "y": -930, "width": 5, "height": 350},  # 虛空陷阱4
-                {"x": 525, "y": -990, "width": 5, "height": 350},  # 虛空陷阱5
-                {"x": 375, "y": -1050, "width": 5, "height": 350},  # 虛空陷阱6
-                # 第五階段陷阱 - 天堂審判陷阱
-                {"x": 100, "y": -1110, "width": 4, "height": 400},  # 審判陷阱1
-                {"x": 350, "y": -1170, "width": 4, "height": 400},  # 審判陷阱2
-                {"x": 250, "y": -1230, "width": 4, "height": 400},  # 最終審判陷阱
-                # 邊界死亡牆 - 高塔邊界
-                {"x": 0, "y": -600, "width": 15, "height": 800},  # 左邊界虛空牆
-                {"x": 785, "y": -600, "width": 15, "height": 800},  # 右邊界虛空牆
-                # 天空屏障
-                {"x": 0, "y": -1320, "width": 1200, "height": 50},  # 天空屏障
-            ],
-            "goal_y": -1260,  # 極高的目標高度，相當於21層樓
-            "start_pos": (20, 535),
-            "target_deaths": 200,  # 超級高死亡目標，真正的終極挑戰
-        }
+                    level_num: level_pack
+                    for level_num, level_pack in old_packs.items()
+                    if level_num in levels
+                },
+                self.level_packs,
+            )
+        return changed
+
+    def close_level_packs(self, level_packs, keep):
+        """關閉 level_packs 中不在 keep 裡的關卡包"""
+        kept = {id(level_pack) for level_pack in keep.values()}
+        for level_pack in level_packs.values():
+            if id(level_pack) not in kept:
+                level_pack.close()
+
+    def get_tower_file(self):
+        """烘焙好的塔檔案，沒有時回傳 None"""
+        if self.tower_file_path:
+            path = self.tower_file_path
+            self.tower_file_path = None
+            if os.path.exists(path):
+                try:
+                    self.tower_file = load_tower_file(path)
+                    self.tower_seed = self.tower_file.seed
+                except (OSError, ValueError, KeyError) as e:
+                    print(f"載入塔檔案失敗: {e}")
+        return self.tower_file
+
+    def generate_tower_segment(self, segment_num):
+        """無限之塔第 segment_num 段的平台與死亡區域"""
+        tower_file = self.get_tower_file()
+        if tower_file:
+            return tower_file.segment(segment_num)
+        return generate_segment(self.tower_seed, segment_num)
+
+    def get_compiled_level(self, level_num):
+        """
+        獲取編譯後的關卡，每幀的碰撞、繪製與目標判定都使用這份資料
+        無限關卡回傳 StreamingLevel、關卡包回傳 PackedLevel，
+        兩者都需要隨畫面呼叫 update_window
+        """
+        compiled_level = self.compiled_levels.get(level_num)
+        if compiled_level is not None:
+            return compiled_level
+
+        with self.lock:
+            compiled_level = self.compiled_levels.get(level_num)
+            if compiled_level is not None:
+                return compiled_level
+            level_data = self.levels.get(level_num)
+            if not level_data:
+                return None
+            if level_num in self.level_packs:
+                compiled_level = PackedLevel(
+                    self.level_packs[level_num],
+                    TOWER_SEGMENT_HEIGHT,
+                    TOWER_GENERATE_ABOVE,
+                    TOWER_KEEP_BELOW,
+                    level_num,
+                )
+            elif level_data.get("infinite"):
+                compiled_level = StreamingLevel(
+                    level_data,
+                    self.generate_tower_segment,
+                    TOWER_SEGMENT_HEIGHT,
+                    TOWER_GENERATE_ABOVE,
+                    TOWER_KEEP_BELOW,
+                    level_num,
+                )
+            else:
+                compiled_level = CompiledLevel(level_data, level_num)
+            self.compiled_levels[level_num] = compiled_level
+        return compiled_level
+
+    def preload_level(self, level_num):
+        """
+        在背景執行緒建立關卡（勝利畫面時先準備下一關），
+        之後進入關卡時 get_compiled_level 直接取用，建立中則等待完成
+        """
+        if level_num in self.compiled_levels or level_num not in self.levels:
+            return
+        threading.Thread(
+            target=self.get_compiled_level, args=(level_num,), daemon=True
+        ).start()
+
+
+class StaticLevelLayer:
+    """
+    關卡的靜態圖層：背景、牆壁、平台與死亡區域預先畫在與畫面同寬的圖塊上，
+    每幀依相機位置貼上一兩個圖塊，繪製成本與平台數量無關
+    無限關卡與關卡包重建範圍後平台列表會換成新的，圖塊隨之重畫
+    """
+
+    def __init__(
+        self,
+        level,
+        tile_height=LEVEL_LAYER_TILE_HEIGHT,
+        max_tiles=LEVEL_LAYER_MAX_TILES,
+    ):
+        self.level = level
+        self.tile_height = tile_height
+        self.max_tiles = max_tiles
+        self.tiles = {}  # 圖塊編號 -> Surface，第 n 塊涵蓋 y 範圍 [n * 高度, (n + 1) * 高度)
+        self.platforms = None
+        self.death_zones = None
+        self.goal_platforms = None
+        self.prerender()
+
+    def sync(self):
+        """關卡的平台或死亡區域換成新的列表時清除所有圖塊"""
+        level = self.level
+        if (
+            level.platforms is not self.platforms
+            or level.death_zones is not self.death_zones
+        ):
+            self.platforms = level.platforms
+            self.death_zones = level.death_zones
+            self.goal_platforms = level.goal_platform_set
+            self.tiles.clear()
+
+    def tile_range(self, top, bottom):
+        """y 範圍 [top, bottom) 涵蓋的第一個與最後一個圖塊編號"""
+        height = self.tile_height
+        return math.floor(top / height), math.floor((bottom - 1) / height)
+
+    def prerender(self):
+        """先畫好涵蓋整個關卡的圖塊（需要太多圖塊的關卡改為畫面經過時才畫）"""
+        self.sync()
+        bounds = self.level.bounds
+        if bounds is None:
+            return
+        first, last = self.tile_range(bounds.y, bounds.bottom)
+        if last - first + 1 > self.max_tiles:
+            return
+        for index in range(first, last + 1):
+            self.tile(index)
+
+    def tile(self, index):
+        surface = self.tiles.get(index)
+        if surface is None:
+            surface = self.render_tile(index)
+            self.tiles[index] = surface
+        return surface
+
+    def render_tile(self, index):
+        """依原本逐一繪製的順序畫出一個圖塊：背景、牆壁、平台、死亡區域"""
+        top = index * self.tile_height
+        bottom = top + self.tile_height
+        surface = pygame.Surface((SCREEN_WIDTH, self.tile_height))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()  # 與畫面相同的像素格式，貼上時不必轉換
+        surface.fill(DARK_BLUE)
+
+        draw_rect = pygame.draw.rect
+        wall_width = 10
+        draw_rect(surface, GRAY, (0, 0, wall_width, self.tile_height))
+        draw_rect(
+            surface,
+            GRAY,
+            (SCREEN_WIDTH - wall_width, 0, wall_width, self.tile_height),
+        )
 
-        # 第12關 - 無限之塔（真正的無限高度挑戰）
-        levels[12] = {
-            "name": "無限之塔",
-            "platforms": [
-                # 起始平台
-                {"x": 0, "y": 550, "width": 60, "height": 20},
-                # 第一段階梯 - 每隔200高度生成一組平台
-                *self.generate_infinite_platforms_segment(-200, 1),
-                *self.generate_infinite_platforms_segment(-400, 2),
-                *self.generate_infinite_platforms_segment(-600, 3),
-                *self.generate_infinite_platforms_segment(-800, 4),
-                *self.generate_infinite_platforms_segment(-1000, 5),
-                *self.generate_infinite_platforms_segment(-1200, 6),
-                *self.generate_infinite_platforms_segment(-1400, 7),
-                *self.generate_infinite_platforms_segment(-1600, 8),
-                *self.generate_infinite_platforms_segment(-1800, 9),
-                *self.generate_infinite_platforms_segment(-2000, 10),
-                # 理論上可以繼續無限延伸...
-                # 終極目標平台（如果真的有人能到達）
-                {"x": 350, "y": -2200, "width": 150, "height": 40},  # 神級目標
-            ],
-            "death_zones": [
-                {"x": 0, "y": 600, "width": 1200, "height": 100},  # 底部深淵
-                # 為每個階段生成相應的陷阱
-                *self.generate_infinite_death_zones_segment(-200, 1),
-                *self.generate_infinite_death_zones_segment(-400, 2),
-                *self.generate_infinite_death_zones_segment(-600, 3),
-                *self.generate_infinite_death_zones_segment(-800, 4),
-                *self.generate_infinite_death_zones_segment(-1000, 5),
-                *self.generate_infinite_death_zones_segment(-1200, 6),
-                *self.generate_infinite_death_zones_segment(-1400, 7),
-                *self.generate_infinite_death_zones_segment(-1600, 8),
-                *self.generate_infinite_death_zones_segment(-1800, 9),
-                *self.generate_infinite_death_zones_segment(-2000, 10),
-                # 邊界死亡牆
-                {"x": 0, "y": -1500, "width": 15, "height": 2000},  # 左邊界
-                {"x": 785, "y": -1500, "width": 15, "height": 2000},  # 右邊界
-            ],
-            "goal_y": -2200,  # 超高目標，但理論上可以更高
-            "start_pos": (30, 530),
-            "target_deaths": 500,  # 史詩級死亡目標
-            "infinite": True,  # 標記為無限關卡
-        }
+        level = self.level
+        goal_platforms = self.goal_platforms
+        for platform in level.platform_view_index.query(top, bottom):
+            x, y, width, height, _, _ = platform
+            # 目標平台為黃色（無限關卡中高於目標的分段平台不算目標）
+            color = YELLOW if platform in goal_platforms else BROWN
+            draw_rect(surface, color, (x, y - top, width, height))
+        death_zones = level.death_zone_view_index.query(top, bottom)
+        for x, y, width, height, _, _ in death_zones:
+            draw_rect(surface, RED, (x, y - top, width, height))
+        return surface
 
-        return levels
+    def draw(self, screen, camera_y):
+        """貼上畫面範圍內的圖塊"""
+        self.sync()
+        first, last = self.tile_range(camera_y, camera_y + screen.get_height())
+        for index in range(first, last + 1):
+            screen.blit(self.tile(index), (0, index * self.tile_height - camera_y))
+
+        # 無限關卡一路往上時，移除離畫面最遠的圖塊
+        extra = len(self.tiles) - self.max_tiles
+        if extra > 0:
+            farthest = sorted(self.tiles, key=lambda index: -abs(index - first))
+            for index in farthest[:extra]:
+                del self.tiles[index]
+
+
+class TextCache:
+    """
+    font.render 結果的 LRU 快取，以 (字體, 文字, 反鋸齒, 顏色, 背景色) 為鍵
+    標題、操作說明等固定文字只在第一次繪製時光柵化，之後每幀直接取用同一個 Surface；
+    數字會變的文字（高度、死亡次數）才會重新光柵化，超過上限時移除最久沒用到的
+    回傳的 Surface 是共用的，呼叫端不可以修改它（set_alpha、fill 等）
+    """
+
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        """與 font.render 相同的參數，命中快取時不重新光柵化"""
+        key = (
+            font,
+            text,
+            antialias,
+            tuple(color),
+            None if background is None else tuple(background),
+        )
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """重新載入字體後舊字體的文字用不到了"""
+        self.surfaces.clear()
+
+    def stats(self):
+        """回傳 (命中次數, 未命中次數, 目前快取數量)"""
+        return self.hits, self.misses, len(self.surfaces)
+
+
+class GlyphAtlas:
+    """
+    逐字的字形圖集：每個 (字體, 反鋸齒, 顏色) 的每個字元只光柵化一次
+    數值一直在變的 HUD 文字（死亡次數、高度、蓄力、音量）用快取的字形逐字貼上，
+    每幀成本只與字數有關，數值怎麼變都不會重新光柵化
+    逐字排列以整數像素前進、不做字距微調，寬度可能與 font.render 差一兩個像素
+    """
 
-    def get_level(self, level_num):
-        """獲取指定關卡"""
-        return self.levels.get(level_num)
+    def __init__(self):
+        self.glyphs = {}  # (字體, 反鋸齒, 顏色) -> {字元: (Surface, 寬度)}
+        self.misses = 0  # 光柵化過的字形數量
+
+    def draw(self, screen, font, text, antialias, color, pos):
+        """把 text 的左上角畫在 pos，回傳涵蓋的 Rect"""
+        key = (font, antialias, tuple(color))
+        glyphs = self.glyphs.get(key)
+        if glyphs is None:
+            glyphs = self.glyphs[key] = {}
+
+        x, y = pos
+        blits = []
+        for char in text:
+            glyph = glyphs.get(char)
+            if glyph is None:
+                self.misses += 1
+                surface = font.render(char, antialias, color)
+                glyph = glyphs[char] = (surface, surface.get_width())
+            blits.append((glyph[0], (x, y)))
+            x += glyph[1]
+        screen.blits(blits, False)
+        return pygame.Rect(pos[0], y, x - pos[0], font.get_height())
+
+    def clear(self):
+        """重新載入字體後舊字體的字形用不到了"""
+        self.glyphs.clear()
 
 
 class Game:
@@ -893,6 +659,11 @@ class Game:
         self.ui_scale_y = 1.0
         self.ui_scale = 1.0
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # 全屏時的虛擬畫布與螢幕上的縮放目的地，只在切換全屏時重建
+        self.virtual_screen = None
+        self.scaled_screen = None
+        self.letterbox_rects = []  # 畫布周圍的黑邊
+        self.smooth_scale = False
         pygame.display.set_caption("Jump King - 十關挑戰")
         self.clock = pygame.time.Clock()
         self.running = True
@@ -910,7 +681,12 @@ class Game:
         # 初始化組件
         self.level_manager = LevelManager()
         self.player = None
+        self.compiled_level = None  # 目前關卡的編譯結果
+        self.level_layer = None  # 目前關卡預先畫好的靜態圖層
+        self.next_level_reload_check = 0  # 開發模式下次檢查關卡檔案的時間
         self.camera_y = 0
+        self.prev_camera_y = 0  # 上一次物理更新的相機位置
+        self.render_alpha = 1.0  # 目前畫面位於兩次物理更新之間的比例
 
         # 字體 - 使用微軟正黑體支援中文
         font_paths = [
@@ -927,12 +703,15 @@ class Game:
         # 情緒價值系統
         self.encouragement_messages = []
         self.encouragement_timer = 0
+        self.infinite_milestone = 0  # 無限模式已達到的最高里程碑
         self.congratulation_messages = []
         self.congratulation_timer = 0
         self.mega_celebration = False
         self.mega_celebration_timer = 0
 
         # 載入字體
+        self.text_cache = TextCache()  # 所有文字繪製共用的快取
+        self.glyph_atlas = GlyphAtlas()  # 數值一直在變的 HUD 文字逐字貼上
         self.load_fonts()
 
         # 音效系統
@@ -980,6 +759,9 @@ class Game:
             self.font_small = pygame.font.Font(None, small_size)
             print("使用系統預設字體")
 
+        self.text_cache.clear()
+        self.glyph_atlas.clear()
+
     def load_sounds(self):
         """載入音效"""
         try:
@@ -1232,10 +1014,13 @@ class Game:
             self.screen_width = info.current_w
             self.screen_height = info.current_h
             self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            # 以實際取得的全屏大小為準（可能與桌面解析度不同）
+            self.screen_width, self.screen_height = self.screen.get_size()
             # 計算UI縮放比例
             self.ui_scale_x = self.screen_width / SCREEN_WIDTH
             self.ui_scale_y = self.screen_height / SCREEN_HEIGHT
             self.ui_scale = min(self.ui_scale_x, self.ui_scale_y)  # 保持比例
+            self.build_fullscreen_canvas()
         else:
             self.screen_width = SCREEN_WIDTH
             self.screen_height = SCREEN_HEIGHT
@@ -1243,11 +1028,57 @@ class Game:
             self.ui_scale_x = 1.0
             self.ui_scale_y = 1.0
             self.ui_scale = 1.0
+            self.virtual_screen = None
+            self.scaled_screen = None
+            self.letterbox_rects = []
 
         # 重新載入字體以適應新的縮放比例
         self.load_fonts()
         pygame.display.set_caption("Jump King - 十關挑戰")
 
+    def build_fullscreen_canvas(self):
+        """
+        建立全屏用的虛擬畫布，以及螢幕上置中的縮放目的地（螢幕的子表面）
+        畫布與螢幕像素格式相同，每幀直接縮放進螢幕，不再配置新的 Surface
+        整數倍模式把縮放比例降到整數（螢幕比畫布小時仍然縮小）
+        """
+        if FULLSCREEN_SCALE_MODE == "integer" and self.ui_scale >= 1:
+            self.ui_scale = math.floor(self.ui_scale)
+        scaled_width = int(SCREEN_WIDTH * self.ui_scale)
+        scaled_height = int(SCREEN_HEIGHT * self.ui_scale)
+        offset_x = (self.screen_width - scaled_width) // 2
+        offset_y = (self.screen_height - scaled_height) // 2
+        scaled_rect = pygame.Rect(offset_x, offset_y, scaled_width, scaled_height)
+
+        self.virtual_screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.scaled_screen = self.screen.subsurface(scaled_rect)
+        # 平滑縮放只支援 24／32 位元的表面
+        self.smooth_scale = (
+            FULLSCREEN_SCALE_MODE == "smooth" and self.screen.get_bitsize() in (24, 32)
+        )
+
+        screen_rect = self.screen.get_rect()
+        self.letterbox_rects = [
+            rect
+            for rect in (
+                pygame.Rect(0, 0, screen_rect.width, scaled_rect.top),
+                pygame.Rect(
+                    0,
+                    scaled_rect.bottom,
+                    screen_rect.width,
+                    screen_rect.height - scaled_rect.bottom,
+                ),
+                pygame.Rect(0, scaled_rect.top, scaled_rect.left, scaled_height),
+                pygame.Rect(
+                    scaled_rect.right,
+                    scaled_rect.top,
+                    screen_rect.width - scaled_rect.right,
+                    scaled_height,
+                ),
+            )
+            if rect.width > 0 and rect.height > 0
+        ]
+
     def scale_pos(self, x, y):
         """根據UI縮放調整位置"""
         if self.fullscreen:
@@ -1281,14 +1112,26 @@ class Game:
         start_x, start_y = level_data["start_pos"]
         self.player = Player(start_x, start_y, self)  # 傳遞遊戲實例
 
+        # 關卡載入時取得編譯後的關卡（含平台空間網格與死亡區域索引）
+        self.compiled_level = self.level_manager.get_compiled_level(level_num)
+
         # 確保玩家正確地站在起始平台上
         self.player.on_ground = True
         self.player.vel_x = 0
         self.player.vel_y = 0
 
         self.camera_y = 0
+        self.prev_camera_y = 0
         self.state = PLAYING
 
+        # 無限關卡：分段範圍回到起點附近
+        self.infinite_milestone = 0
+        self.update_level_window()
+
+        # 進入關卡時先畫好靜態圖層
+        if STATIC_LEVEL_LAYER:
+            self.get_level_layer()
+
         # 開始播放背景音樂
         self.start_background_music()
 
@@ -1327,6 +1170,9 @@ class Game:
         self.save_progress()
         self.state = VICTORY
 
+        # 顯示勝利畫面的同時在背景建立下一關
+        self.level_manager.preload_level(self.current_level + 1)
+
     def game_over(self):
         """遊戲失敗"""
         print(f"遊戲失敗！第{self.current_level}關超過目標死亡次數")
@@ -1467,9 +1313,11 @@ class Game:
 
     def handle_playing_events(self, event):
         """處理遊戲中的事件"""
+        # pygame 事件沒有時間戳記，以處理事件的時間作為按下/放開 SPACE 的時間
+        now = time.perf_counter()
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE:
-                self.player.start_jump_charge()
+                self.player.start_jump_charge(now)
             elif event.key == pygame.K_r:
                 # 重置玩家位置
                 self.player.reset_position()
@@ -1480,11 +1328,11 @@ class Game:
                 # 決定跳躍方向
                 keys = pygame.key.get_pressed()
                 if keys[pygame.K_LEFT]:
-                    self.player.execute_jump("left")
+                    self.player.execute_jump("left", now)
                 elif keys[pygame.K_RIGHT]:
-                    self.player.execute_jump("right")
+                    self.player.execute_jump("right", now)
                 else:
-                    self.player.execute_jump("up")
+                    self.player.execute_jump("up", now)
 
     def handle_events(self):
         """處理事件"""
@@ -1546,33 +1394,21 @@ class Game:
                 elif self.state == GAME_OVER:
                     pass  # GAME_OVER 狀態的其他事件類型不需要處理
 
-    def check_goal_completion(self, level_data):
-        """檢查玩家是否踩在目標平台上"""
+    def check_goal_completion(self, level):
+        """檢查玩家是否踩在目標平台上（目標平台在編譯關卡時已篩選好）"""
         if not self.player or not self.player.on_ground:
             return False
 
-        # 找到目標平台（黃色平台）
-        goal_platforms = []
-        for platform in level_data["platforms"]:
-            if platform["y"] <= level_data["goal_y"]:
-                goal_platforms.append(platform)
+        player_left = self.player.x
+        player_right = self.player.x + self.player.width
+        player_bottom = self.player.y + self.player.height
 
-        # 檢查玩家是否踩在任何目標平台上
-        player_rect = pygame.Rect(
-            self.player.x, self.player.y, self.player.width, self.player.height
-        )
-
-        for platform in goal_platforms:
-            platform_rect = pygame.Rect(
-                platform["x"], platform["y"], platform["width"], platform["height"]
-            )
-
-            # 檢查玩家底部是否接觸平台頂部
+        # 檢查玩家底部是否接觸任何目標平台（黃色平台）的頂部
+        for platform in level.goal_platforms:
             if (
-                self.player.x < platform["x"] + platform["width"]
-                and self.player.x + self.player.width > platform["x"]
-                and abs((self.player.y + self.player.height) - platform["y"]) <= 3
-                and self.player.on_ground
+                player_left < platform.right
+                and player_right > platform.x
+                and abs(player_bottom - platform.y) <= 3
             ):
                 return True
 
@@ -1583,19 +1419,27 @@ class Game:
         if not self.player:
             return
 
-        # 更新跳躍蓄力
+        if LEVEL_HOT_RELOAD:
+            self.check_level_reload()
+
+        # 更新跳躍蓄力（只影響蓄力條顯示，實際力量在放開 SPACE 時依按住的時間計算）
         keys = pygame.key.get_pressed()
         if keys[pygame.K_SPACE]:
-            self.player.update_jump_charge()
+            self.player.update_jump_charge(time.perf_counter())
 
         # 獲取當前關卡資料
         level_data = self.level_manager.get_level(self.current_level)
-        if not level_data:
+        level = self.compiled_level
+        if not level_data or not level:
             return
 
         # 更新玩家
         result = self.player.update(
-            level_data["platforms"], level_data["death_zones"], self.current_level
+            level.platforms,
+            level.death_zones,
+            self.current_level,
+            level.platform_grid,
+            level.death_zone_index,
         )
 
         # 檢查死亡
@@ -1631,11 +1475,12 @@ class Game:
             # 第12關無限模式觸發
             self.handle_infinite_mode()
 
-        # 更新相機
+        # 更新相機，無限關卡依新的畫面範圍生成與移除分段
         self.update_camera()
+        self.update_level_window()
 
         # 檢查是否完成關卡（必須踩在目標平台上）
-        if self.check_goal_completion(level_data):
+        if self.check_goal_completion(level):
             self.complete_level()
 
     def handle_infinite_mode(self):
@@ -1644,10 +1489,11 @@ class Game:
             return
 
         current_height = -self.player.y
-        # 每達到新的500像素高度里程碑，添加鼓勵訊息
+        # 每達到新的500像素高度里程碑，添加一次鼓勵訊息
         milestone = int(current_height // 500) * 500
 
-        if milestone > 2000 and milestone % 500 == 0:
+        if milestone > 2000 and milestone > self.infinite_milestone:
+            self.infinite_milestone = milestone
             infinite_messages = [
                 f"🚀 突破{milestone}米高度！",
                 "🌟 你正在創造奇蹟！",
@@ -1661,8 +1507,41 @@ class Game:
             self.encouragement_messages.append(message)
             self.encouragement_timer = 240  # 4秒顯示
 
+    def check_level_reload(self):
+        """開發模式：定期檢查關卡檔案，目前的關卡有修改時換上新的關卡"""
+        now = time.perf_counter()
+        if now < self.next_level_reload_check:
+            return
+        self.next_level_reload_check = now + LEVEL_RELOAD_INTERVAL
+
+        changed = self.level_manager.reload_changed_levels()
+        if self.current_level not in changed:
+            return
+        level_data = self.level_manager.get_level(self.current_level)
+        if not level_data:
+            print(f"第{self.current_level}關的檔案已被刪除，保留原本的關卡")
+            return
+
+        # 碰撞索引、目標平台等都隨新的 CompiledLevel 重建，玩家留在原地，只更新重生點
+        self.compiled_level = self.level_manager.get_compiled_level(self.current_level)
+        self.player.start_x, self.player.start_y = level_data["start_pos"]
+        self.update_level_window()
+        elapsed = (time.perf_counter() - now) * 1000
+        print(f"已重新載入第{self.current_level}關（{elapsed:.1f} ms）")
+
+    def update_level_window(self):
+        """無限關卡與關卡包：讓載入的範圍涵蓋目前畫面與玩家所在位置"""
+        level = self.compiled_level
+        if not isinstance(level, (StreamingLevel, PackedLevel)) or not self.player:
+            return
+        level.update_window(
+            min(self.camera_y, self.player.y),
+            max(self.camera_y + SCREEN_HEIGHT, self.player.y + self.player.height),
+        )
+
     def update_camera(self):
         """更新相機位置"""
+        self.prev_camera_y = self.camera_y
         if self.player:
             target_y = self.player.y - SCREEN_HEIGHT // 2
             self.camera_y += (target_y - self.camera_y) * 0.1
@@ -1692,9 +1571,8 @@ class Game:
         """繪製主選單"""
         if self.fullscreen:
             # 全屏模式下，先繪製到虛擬畫布
-            virtual_screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.draw_menu_content(virtual_screen)
-            self.scale_and_blit_virtual_screen(virtual_screen)
+            self.draw_menu_content(self.virtual_screen)
+            self.scale_and_blit_virtual_screen()
         else:
             # 視窗模式直接繪製
             self.draw_menu_content(self.screen)
@@ -1704,12 +1582,14 @@ class Game:
         screen.fill(DARK_BLUE)
 
         # 標題
-        title = self.font_large.render("Jump King - 十關挑戰", True, YELLOW)
+        title = self.text_cache.render(
+            self.font_large, "Jump King - 十關挑戰", True, YELLOW
+        )
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 150))
         screen.blit(title, title_rect)
 
         # 副標題
-        subtitle = self.font_medium.render("考驗你的耐心與技巧", True, WHITE)
+        subtitle = self.text_cache.render(self.font_medium, "考驗你的耐心與技巧", True, WHITE)
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, 200))
         screen.blit(subtitle, subtitle_rect)
 
@@ -1717,29 +1597,28 @@ class Game:
         menu_options = ["開始遊戲", "繼續遊戲", "退出遊戲"]
         for i, option in enumerate(menu_options):
             color = YELLOW if i == self.menu_selection else WHITE
-            text = self.font_medium.render(option, True, color)
+            text = self.text_cache.render(self.font_medium, option, True, color)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 300 + i * 50))
             screen.blit(text, text_rect)
 
         # 進度資訊
         progress_text = f"已解鎖關卡: {self.unlocked_levels}/{TOTAL_LEVELS}"
-        progress = self.font_small.render(progress_text, True, GREEN)
+        progress = self.text_cache.render(self.font_small, progress_text, True, GREEN)
         progress_rect = progress.get_rect(center=(SCREEN_WIDTH // 2, 500))
         screen.blit(progress, progress_rect)
 
         # 操作說明
         controls = ["↑↓ 選擇", "Enter 確認", "M 切換音效", "ESC 退出", "F11 切換全屏"]
         for i, control in enumerate(controls):
-            text = self.font_small.render(control, True, GRAY)
+            text = self.text_cache.render(self.font_small, control, True, GRAY)
             screen.blit(text, (50, 500 + i * 25))
 
     def draw_level_select(self):
         """繪製關卡選擇畫面"""
         if self.fullscreen:
             # 全屏模式下，先繪製到虛擬畫布
-            virtual_screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.draw_level_select_content(virtual_screen)
-            self.scale_and_blit_virtual_screen(virtual_screen)
+            self.draw_level_select_content(self.virtual_screen)
+            self.scale_and_blit_virtual_screen()
         else:
             # 視窗模式直接繪製
             self.draw_level_select_content(self.screen)
@@ -1749,7 +1628,7 @@ class Game:
         screen.fill(DARK_BLUE)
 
         # 標題
-        title = self.font_large.render("選擇關卡", True, YELLOW)
+        title = self.text_cache.render(self.font_large, "選擇關卡", True, YELLOW)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 100))
         screen.blit(title, title_rect)
 
@@ -1840,7 +1719,9 @@ class Game:
             )
 
             # 關卡編號
-            level_text = self.font_medium.render(f"第{level}關", True, text_color)
+            level_text = self.text_cache.render(
+                self.font_medium, f"第{level}關", True, text_color
+            )
             level_text_x, level_text_y = self.scale_pos(x + 50, y + 20)
             level_rect = level_text.get_rect(center=(level_text_x, level_text_y))
             self.screen.blit(level_text, level_rect)
@@ -1848,14 +1729,18 @@ class Game:
             # 關卡名稱
             level_data = self.level_manager.get_level(level)
             if level_data:
-                name_text = self.font_small.render(level_data["name"], True, text_color)
+                name_text = self.text_cache.render(
+                    self.font_small, level_data["name"], True, text_color
+                )
                 name_text_x, name_text_y = self.scale_pos(x + 50, y + 40)
                 name_rect = name_text.get_rect(center=(name_text_x, name_text_y))
                 self.screen.blit(name_text, name_rect)
 
             # 狀態
             for i, line in enumerate(status.split("\n")):
-                status_text = self.font_small.render(line, True, text_color)
+                status_text = self.text_cache.render(
+                    self.font_small, line, True, text_color
+                )
                 status_text_x, status_text_y = self.scale_pos(x + 50, y + 55 + i * 12)
                 status_rect = status_text.get_rect(
                     center=(status_text_x, status_text_y)
@@ -1869,7 +1754,8 @@ class Game:
                 detail_y = 450
 
                 # 關卡名稱
-                name = self.font_medium.render(
+                name = self.text_cache.render(
+                    self.font_medium,
                     f"第{self.level_select_selection}關: {level_data['name']}",
                     True,
                     YELLOW,
@@ -1882,7 +1768,9 @@ class Game:
                 target_text = f"挑戰目標: {level_data['target_deaths']}次死亡內完成"
                 if self.level_select_selection == 11:
                     target_text = f"超級挑戰: {level_data['target_deaths']}次死亡內完成"
-                target = self.font_small.render(target_text, True, WHITE)
+                target = self.text_cache.render(
+                    self.font_small, target_text, True, WHITE
+                )
                 target_x, target_y = self.scale_pos(SCREEN_WIDTH // 2, detail_y + 30)
                 target_rect = target.get_rect(center=(target_x, target_y))
                 self.screen.blit(target, target_rect)
@@ -1890,7 +1778,9 @@ class Game:
                 # 第11關特殊警告
                 if self.level_select_selection == 11:
                     warning_text = "⚠️ 注意：此關卡包含隨機掉落陷阱！"
-                    warning = self.font_small.render(warning_text, True, RED)
+                    warning = self.text_cache.render(
+                        self.font_small, warning_text, True, RED
+                    )
                     warning_x, warning_y = self.scale_pos(
                         SCREEN_WIDTH // 2, detail_y + 55
                     )
@@ -1900,7 +1790,9 @@ class Game:
                 # 第12關特殊說明
                 if self.level_select_selection == 12:
                     warning_text = "🚀 無限之塔：挑戰你的極限！"
-                    warning = self.font_small.render(warning_text, True, (255, 215, 0))
+                    warning = self.text_cache.render(
+                        self.font_small, warning_text, True, (255, 215, 0)
+                    )
                     warning_x, warning_y = self.scale_pos(
                         SCREEN_WIDTH // 2, detail_y + 55
                     )
@@ -1908,7 +1800,9 @@ class Game:
                     self.screen.blit(warning, warning_rect)
 
                     warning_text2 = "理論上可以無限攀爬..."
-                    warning2 = self.font_small.render(warning_text2, True, PURPLE)
+                    warning2 = self.text_cache.render(
+                        self.font_small, warning_text2, True, PURPLE
+                    )
                     warning2_x, warning2_y = self.scale_pos(
                         SCREEN_WIDTH // 2, detail_y + 75
                     )
@@ -1924,7 +1818,7 @@ class Game:
             "F11 切換全屏",
         ]
         for i, control in enumerate(controls):
-            text = self.font_small.render(control, True, GRAY)
+            text = self.text_cache.render(self.font_small, control, True, GRAY)
             control_x, control_y = self.scale_pos(50, 550 + i * 20)
             self.screen.blit(text, (control_x, control_y))
 
@@ -1932,41 +1826,28 @@ class Game:
         """繪製遊戲畫面"""
         if self.fullscreen:
             # 全屏模式下，先繪製到虛擬畫布
-            virtual_screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.draw_playing_content(virtual_screen)
-
-            # 縮放並居中顯示虛擬畫布
-            scaled_surface = pygame.transform.scale(
-                virtual_screen,
-                (int(SCREEN_WIDTH * self.ui_scale), int(SCREEN_HEIGHT * self.ui_scale)),
-            )
-
-            # 計算居中位置
-            offset_x = (self.screen_width - SCREEN_WIDTH * self.ui_scale) // 2
-            offset_y = (self.screen_height - SCREEN_HEIGHT * self.ui_scale) // 2
-
-            # 清除螢幕並繪製縮放後的畫面
-            self.screen.fill(BLACK)
-            self.screen.blit(scaled_surface, (offset_x, offset_y))
+            self.draw_playing_content(self.virtual_screen)
+            self.scale_and_blit_virtual_screen()
         else:
             # 視窗模式直接繪製
             self.draw_playing_content(self.screen)
 
-    def scale_and_blit_virtual_screen(self, virtual_screen):
-        """縮放虛擬畫布並繪製到實際螢幕"""
-        # 縮放並居中顯示虛擬畫布
-        scaled_surface = pygame.transform.scale(
-            virtual_screen,
-            (int(SCREEN_WIDTH * self.ui_scale), int(SCREEN_HEIGHT * self.ui_scale)),
-        )
-
-        # 計算居中位置
-        offset_x = (self.screen_width - SCREEN_WIDTH * self.ui_scale) // 2
-        offset_y = (self.screen_height - SCREEN_HEIGHT * self.ui_scale) // 2
+    def scale_and_blit_virtual_screen(self):
+        """把虛擬畫布直接縮放到螢幕上預先配置的置中區域"""
+        for rect in self.letterbox_rects:
+            self.screen.fill(BLACK, rect)
+        target = self.scaled_screen
+        if self.smooth_scale:
+            pygame.transform.smoothscale(self.virtual_screen, target.get_size(), target)
+        else:
+            # 整數倍模式的縮放比例是整數，最近點縮放就是把每個像素放大成方塊
+            pygame.transform.scale(self.virtual_screen, target.get_size(), target)
 
-        # 清除螢幕並繪製縮放後的畫面
-        self.screen.fill(BLACK)
-        self.screen.blit(scaled_surface, (offset_x, offset_y))
+    def get_render_camera_y(self):
+        """取得兩次物理更新之間的插值相機位置"""
+        return self.prev_camera_y + (self.camera_y - self.prev_camera_y) * (
+            self.render_alpha
+        )
 
     def draw_playing_content(self, screen):
         """繪製遊戲畫面內容"""
@@ -1977,47 +1858,43 @@ class Game:
 
         # 獲取當前關卡資料
         level_data = self.level_manager.get_level(self.current_level)
-        if not level_data:
+        level = self.compiled_level
+        if not level_data or not level:
             return
 
-        # 繪製屏幕邊界牆壁
-        wall_width = 10
-        # 左邊界牆壁
-        pygame.draw.rect(screen, GRAY, (0, 0, wall_width, SCREEN_HEIGHT))
-        # 右邊界牆壁
-        pygame.draw.rect(
-            screen, GRAY, (SCREEN_WIDTH - wall_width, 0, wall_width, SCREEN_HEIGHT)
-        )
-
-        # 繪製平台
-        for platform in level_data["platforms"]:
-            color = BROWN
-            if platform["y"] <= level_data["goal_y"]:  # 目標平台
-                color = YELLOW
+        camera_y = self.get_render_camera_y()
 
+        if STATIC_LEVEL_LAYER:
+            # 牆壁、平台與死亡區域都在預先畫好的圖塊中
+            self.get_level_layer().draw(screen, camera_y)
+        else:
+            # 繪製屏幕邊界牆壁
+            wall_width = 10
+            # 左邊界牆壁
+            pygame.draw.rect(screen, GRAY, (0, 0, wall_width, SCREEN_HEIGHT))
+            # 右邊界牆壁
             pygame.draw.rect(
-                screen,
-                color,
-                (
-                    platform["x"],
-                    platform["y"] - self.camera_y,
-                    platform["width"],
-                    platform["height"],
-                ),
+                screen, GRAY, (SCREEN_WIDTH - wall_width, 0, wall_width, SCREEN_HEIGHT)
             )
 
-        # 繪製死亡區域
-        for zone in level_data["death_zones"]:
-            pygame.draw.rect(
-                screen,
-                RED,
-                (
-                    zone["x"],
-                    zone["y"] - self.camera_y,
-                    zone["width"],
-                    zone["height"],
-                ),
-            )
+            # 只繪製與畫面垂直範圍重疊的平台與死亡區域
+            view_bottom = camera_y + SCREEN_HEIGHT
+            platforms = level.platform_view_index.query(camera_y, view_bottom)
+            death_zones = level.death_zone_view_index.query(camera_y, view_bottom)
+
+            # 繪製平台
+            goal_y = level.goal_y
+            goal_platforms = level.goal_platform_set
+            draw_rect = pygame.draw.rect
+            for platform in platforms:
+                x, y, width, height, _, _ = platform
+                # 目標平台為黃色（無限關卡中高於目標的分段平台不算目標）
+                color = YELLOW if y <= goal_y and platform in goal_platforms else BROWN
+                draw_rect(screen, color, (x, y - camera_y, width, height))
+
+            # 繪製死亡區域
+            for x, y, width, height, _, _ in death_zones:
+                draw_rect(screen, RED, (x, y - camera_y, width, height))
 
         # 第11關特殊視覺效果 - 繪製掉落陷阱警告區域
         if self.current_level == 11:
@@ -2039,10 +1916,10 @@ class Game:
                 warning_surface = pygame.Surface((max_x - min_x, height))
                 warning_surface.set_alpha(alpha)
                 warning_surface.fill(ORANGE)
-                screen.blit(warning_surface, (min_x, y - self.camera_y))
+                screen.blit(warning_surface, (min_x, y - camera_y))
 
         # 繪製玩家
-        self.draw_player_content(screen, self.camera_y)
+        self.draw_player_content(screen, camera_y)
 
         # 繪製UI
         self.draw_playing_ui_content(screen, level_data)
@@ -2050,11 +1927,19 @@ class Game:
         # 繪製情緒價值訊息
         self.draw_emotional_messages(screen)
 
+    def get_level_layer(self):
+        """目前關卡的靜態圖層，換關或熱重載換了編譯結果時重新建立"""
+        if self.level_layer is None or self.level_layer.level is not self.compiled_level:
+            self.level_layer = StaticLevelLayer(self.compiled_level)
+        return self.level_layer
+
     def draw_player_content(self, screen, camera_y):
         """繪製玩家（不縮放版本，用於虛擬畫布）"""
         if not self.player:
             return
 
+        player_x, player_y = self.player.get_render_position(self.render_alpha)
+
         # 繪製玩家
         player_color = BLUE
         if self.player.jump_charging:
@@ -2069,8 +1954,8 @@ class Game:
             screen,
             player_color,
             (
-                self.player.x,
-                self.player.y - camera_y,
+                player_x,
+                player_y - camera_y,
                 self.player.width,
                 self.player.height,
             ),
@@ -2078,8 +1963,8 @@ class Game:
 
         # 繪製面向方向指示
         eye_offset_x = 20 if self.player.facing_right else 10
-        eye_x = self.player.x + eye_offset_x
-        eye_y = self.player.y - camera_y + 10
+        eye_x = player_x + eye_offset_x
+        eye_y = player_y - camera_y + 10
         pygame.draw.circle(screen, WHITE, (eye_x, eye_y), 3)
 
         # 繪製蓄力指示器
@@ -2089,8 +1974,8 @@ class Game:
             )
             bar_width = 40
             bar_height = 8
-            bar_x = self.player.x - 5
-            bar_y = self.player.y - camera_y - 15
+            bar_x = player_x - 5
+            bar_y = player_y - camera_y - 15
 
             # 背景
             pygame.draw.rect(screen, GRAY, (bar_x, bar_y, bar_width, bar_height))
@@ -2163,29 +2048,31 @@ class Game:
         """繪製遊戲中的UI"""
         # 關卡資訊
         level_text = f"第{self.current_level}關: {level_data['name']}"
-        text = self.font_medium.render(level_text, True, YELLOW)
+        text = self.text_cache.render(self.font_medium, level_text, True, YELLOW)
         ui_x, ui_y = self.scale_pos(10, 10)
         self.screen.blit(text, (ui_x, ui_y))
 
         # 死亡次數
         deaths_text = f"死亡次數: {self.player.death_count}"
-        text = self.font_small.render(deaths_text, True, WHITE)
         deaths_x, deaths_y = self.scale_pos(10, 45)
-        self.screen.blit(text, (deaths_x, deaths_y))
+        self.glyph_atlas.draw(
+            self.screen, self.font_small, deaths_text, True, WHITE, (deaths_x, deaths_y)
+        )
 
         # 目標
         target_text = f"目標: {level_data['target_deaths']}次內完成"
         color = GREEN if self.player.death_count <= level_data["target_deaths"] else RED
-        text = self.font_small.render(target_text, True, color)
+        text = self.text_cache.render(self.font_small, target_text, True, color)
         target_x, target_y = self.scale_pos(10, 70)
         self.screen.blit(text, (target_x, target_y))
 
         # 高度
         height = max(0, int((level_data["start_pos"][1] - self.player.y) / 10))
         height_text = f"高度: {height}m"
-        text = self.font_small.render(height_text, True, WHITE)
         height_x, height_y = self.scale_pos(SCREEN_WIDTH - 150, 10)
-        self.screen.blit(text, (height_x, height_y))
+        self.glyph_atlas.draw(
+            self.screen, self.font_small, height_text, True, WHITE, (height_x, height_y)
+        )
 
         # 控制說明
         controls = [
@@ -2205,47 +2092,55 @@ class Game:
             controls.append("掉落陷阱！")
 
         for i, control in enumerate(controls):
-            text = self.font_small.render(control, True, WHITE)
+            text = self.text_cache.render(self.font_small, control, True, WHITE)
             control_x, control_y = self.scale_pos(10, SCREEN_HEIGHT - 140 + i * 20)
             self.screen.blit(text, (control_x, control_y))
 
         # 玩家狀態
         status_text = f"在地面: {'是' if self.player.on_ground else '否'}"
         color = GREEN if self.player.on_ground else RED
-        text = self.font_small.render(status_text, True, color)
+        text = self.text_cache.render(self.font_small, status_text, True, color)
         status_x, status_y = self.scale_pos(SCREEN_WIDTH - 150, 35)
         self.screen.blit(text, (status_x, status_y))
 
         # 蓄力狀態
         if self.player.jump_charging:
             charge_text = f"蓄力: {self.player.jump_power:.1f}"
-            text = self.font_small.render(charge_text, True, YELLOW)
             charge_x, charge_y = self.scale_pos(SCREEN_WIDTH - 150, 60)
-            self.screen.blit(text, (charge_x, charge_y))
+            self.glyph_atlas.draw(
+                self.screen,
+                self.font_small,
+                charge_text,
+                True,
+                YELLOW,
+                (charge_x, charge_y),
+            )
 
     def draw_playing_ui_content(self, screen, level_data):
         """繪製遊戲中的UI（不縮放版本，用於虛擬畫布）"""
         # 關卡資訊
         level_text = f"第{self.current_level}關: {level_data['name']}"
-        text = self.font_medium.render(level_text, True, YELLOW)
+        text = self.text_cache.render(self.font_medium, level_text, True, YELLOW)
         screen.blit(text, (10, 10))
 
         # 死亡次數
         deaths_text = f"死亡次數: {self.player.death_count}"
-        text = self.font_small.render(deaths_text, True, WHITE)
-        screen.blit(text, (10, 45))
+        self.glyph_atlas.draw(
+            screen, self.font_small, deaths_text, True, WHITE, (10, 45)
+        )
 
         # 目標
         target_text = f"目標: {level_data['target_deaths']}次內完成"
         color = GREEN if self.player.death_count <= level_data["target_deaths"] else RED
-        text = self.font_small.render(target_text, True, color)
+        text = self.text_cache.render(self.font_small, target_text, True, color)
         screen.blit(text, (10, 70))
 
         # 高度
         height = max(0, int((level_data["start_pos"][1] - self.player.y) / 10))
         height_text = f"高度: {height}m"
-        text = self.font_small.render(height_text, True, WHITE)
-        screen.blit(text, (SCREEN_WIDTH - 150, 10))
+        self.glyph_atlas.draw(
+            screen, self.font_small, height_text, True, WHITE, (SCREEN_WIDTH - 150, 10)
+        )
 
         # 控制說明
         controls = [
@@ -2267,26 +2162,33 @@ class Game:
             controls.append("掉落陷阱！")
 
         for i, control in enumerate(controls):
-            text = self.font_small.render(control, True, WHITE)
+            text = self.text_cache.render(self.font_small, control, True, WHITE)
             screen.blit(text, (10, SCREEN_HEIGHT - 140 + i * 20))
 
         # 玩家狀態
         status_text = f"在地面: {'是' if self.player.on_ground else '否'}"
         color = GREEN if self.player.on_ground else RED
-        text = self.font_small.render(status_text, True, color)
+        text = self.text_cache.render(self.font_small, status_text, True, color)
         screen.blit(text, (SCREEN_WIDTH - 150, 35))
 
         # 蓄力狀態
         if self.player.jump_charging:
             charge_text = f"蓄力: {self.player.jump_power:.1f}"
-            text = self.font_small.render(charge_text, True, YELLOW)
-            screen.blit(text, (SCREEN_WIDTH - 150, 60))
+            self.glyph_atlas.draw(
+                screen,
+                self.font_small,
+                charge_text,
+                True,
+                YELLOW,
+                (SCREEN_WIDTH - 150, 60),
+            )
 
         # 音效狀態
         sound_status = "開啟" if self.sound_enabled else "關閉"
         sound_text = f"音效: {sound_status} ({int(self.sound_volume * 100)}%)"
-        text = self.font_small.render(sound_text, True, WHITE)
-        screen.blit(text, (SCREEN_WIDTH - 150, 85))
+        self.glyph_atlas.draw(
+            screen, self.font_small, sound_text, True, WHITE, (SCREEN_WIDTH - 150, 85)
+        )
 
     def draw_emotional_messages(self, screen):
         """繪製情緒價值訊息"""
@@ -2311,7 +2213,9 @@ class Game:
                 )
 
                 # 繪製文字
-                text = self.font_medium.render(message, True, (255, 255, 0, alpha))
+                text = self.text_cache.render(
+                    self.font_medium, message, True, (255, 255, 0, alpha)
+                )
                 text_rect = text.get_rect(
                     center=(SCREEN_WIDTH // 2, y_offset + i * 35 + 15)
                 )
@@ -2343,7 +2247,7 @@ class Game:
                 )
 
                 # 繪製慶祝文字
-                text = self.font_medium.render(message, True, color)
+                text = self.text_cache.render(self.font_medium, message, True, color)
                 text_rect = text.get_rect(
                     center=(SCREEN_WIDTH // 2, y_offset + i * 40 + 15 - bounce)
                 )
@@ -2369,14 +2273,18 @@ class Game:
             # 大字慶祝文字
             if self.mega_celebration_timer > 450:  # 前7.5秒
                 mega_text = "🎆 傳奇誕生！🎆"
-                text = self.font_large.render(mega_text, True, (255, 255, 255))
+                text = self.text_cache.render(
+                    self.font_large, mega_text, True, (255, 255, 255)
+                )
                 text_rect = text.get_rect(
                     center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
                 )
 
                 # 文字發光效果
                 for offset in [(-2, -2), (-2, 2), (2, -2), (2, 2)]:
-                    glow_text = self.font_large.render(mega_text, True, flash_color)
+                    glow_text = self.text_cache.render(
+                        self.font_large, mega_text, True, flash_color
+                    )
                     glow_rect = text_rect.copy()
                     glow_rect.x += offset[0]
                     glow_rect.y += offset[1]
@@ -2388,9 +2296,8 @@ class Game:
         """繪製勝利畫面"""
         if self.fullscreen:
             # 全屏模式下，先繪製到虛擬畫布
-            virtual_screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.draw_victory_content(virtual_screen)
-            self.scale_and_blit_virtual_screen(virtual_screen)
+            self.draw_victory_content(self.virtual_screen)
+            self.scale_and_blit_virtual_screen()
         else:
             # 視窗模式直接繪製
             self.draw_victory_content(self.screen)
@@ -2416,11 +2323,15 @@ class Game:
 
         # 勝利訊息
         if self.current_level == 12:
-            title = self.font_large.render("🏆 無限征服者！🏆", True, (255, 215, 0))
+            title = self.text_cache.render(
+                self.font_large, "🏆 無限征服者！🏆", True, (255, 215, 0)
+            )
         elif self.current_level == TOTAL_LEVELS:
-            title = self.font_large.render("👑 跳躍之神！👑", True, (255, 215, 0))
+            title = self.text_cache.render(
+                self.font_large, "👑 跳躍之神！👑", True, (255, 215, 0)
+            )
         else:
-            title = self.font_large.render("恭喜過關！", True, YELLOW)
+            title = self.text_cache.render(self.font_large, "恭喜過關！", True, YELLOW)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 200))
         screen.blit(title, title_rect)
 
@@ -2431,28 +2342,32 @@ class Game:
             target = level_data["target_deaths"]
 
             stats_text = f"第{self.current_level}關: {level_data['name']}"
-            text = self.font_medium.render(stats_text, True, WHITE)
+            text = self.text_cache.render(self.font_medium, stats_text, True, WHITE)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 280))
             screen.blit(text, text_rect)
 
             deaths_text = f"死亡次數: {deaths}"
             color = GREEN if deaths <= target else RED
-            text = self.font_medium.render(deaths_text, True, color)
+            text = self.text_cache.render(self.font_medium, deaths_text, True, color)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 320))
             screen.blit(text, text_rect)
 
             target_text = f"目標: {target}次"
-            text = self.font_medium.render(target_text, True, WHITE)
+            text = self.text_cache.render(self.font_medium, target_text, True, WHITE)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 360))
             screen.blit(text, text_rect)
 
             if deaths <= target:
                 if self.current_level == 12:
                     perfect_text = "🌟 史詩級成就達成！🌟"
-                    text = self.font_medium.render(perfect_text, True, (255, 215, 0))
+                    text = self.text_cache.render(
+                        self.font_medium, perfect_text, True, (255, 215, 0)
+                    )
                 else:
                     perfect_text = "挑戰成功！"
-                    text = self.font_medium.render(perfect_text, True, GREEN)
+                    text = self.text_cache.render(
+                        self.font_medium, perfect_text, True, GREEN
+                    )
                 text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 400))
                 screen.blit(text, text_rect)
 
@@ -2464,7 +2379,9 @@ class Game:
                 "💎 創造了不可能的奇蹟！",
             ]
             for i, achievement in enumerate(achievement_texts):
-                text = self.font_small.render(achievement, True, (255, 215, 0))
+                text = self.text_cache.render(
+                    self.font_small, achievement, True, (255, 215, 0)
+                )
                 text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 440 + i * 25))
                 screen.blit(text, text_rect)
 
@@ -2474,18 +2391,18 @@ class Game:
         else:
             continue_text = "你已完成所有關卡！"
 
-        text = self.font_small.render(continue_text, True, WHITE)
+        text = self.text_cache.render(self.font_small, continue_text, True, WHITE)
         text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 520))
         screen.blit(text, text_rect)
 
         back_text = "ESC 返回主選單"
-        text = self.font_small.render(back_text, True, WHITE)
+        text = self.text_cache.render(self.font_small, back_text, True, WHITE)
         text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 550))
         screen.blit(text, text_rect)
 
         # F11全屏快捷鍵說明
         fullscreen_text = "F11 切換全屏"
-        text = self.font_small.render(fullscreen_text, True, GRAY)
+        text = self.text_cache.render(self.font_small, fullscreen_text, True, GRAY)
         text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 580))
         screen.blit(text, text_rect)
 
@@ -2493,9 +2410,8 @@ class Game:
         """繪製失敗畫面"""
         if self.fullscreen:
             # 全屏模式下，先繪製到虛擬畫布
-            virtual_screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.draw_game_over_content(virtual_screen)
-            self.scale_and_blit_virtual_screen(virtual_screen)
+            self.draw_game_over_content(self.virtual_screen)
+            self.scale_and_blit_virtual_screen()
         else:
             # 視窗模式直接繪製
             self.draw_game_over_content(self.screen)
@@ -2506,7 +2422,7 @@ class Game:
         screen.fill((80, 20, 20))
 
         # 失敗標題
-        title = self.font_large.render("挑戰失敗！", True, RED)
+        title = self.text_cache.render(self.font_large, "挑戰失敗！", True, RED)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 200))
         screen.blit(title, title_rect)
 
@@ -2518,48 +2434,48 @@ class Game:
 
             # 關卡名稱
             level_text = f"第{self.current_level}關: {level_data['name']}"
-            text = self.font_medium.render(level_text, True, WHITE)
+            text = self.text_cache.render(self.font_medium, level_text, True, WHITE)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 280))
             screen.blit(text, text_rect)
 
             # 死亡次數
             deaths_text = f"你的死亡次數: {deaths}"
-            text = self.font_medium.render(deaths_text, True, RED)
+            text = self.text_cache.render(self.font_medium, deaths_text, True, RED)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 320))
             screen.blit(text, text_rect)
 
             # 目標次數
             target_text = f"目標死亡次數: {target}"
-            text = self.font_medium.render(target_text, True, WHITE)
+            text = self.text_cache.render(self.font_medium, target_text, True, WHITE)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 360))
             screen.blit(text, text_rect)
 
             # 超過提示
             over_text = f"超過目標 {deaths - target} 次"
-            text = self.font_medium.render(over_text, True, YELLOW)
+            text = self.text_cache.render(self.font_medium, over_text, True, YELLOW)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 400))
             screen.blit(text, text_rect)
 
         # 鼓勵文字
         encouragement = "不要放棄！再試一次！"
-        text = self.font_medium.render(encouragement, True, GREEN)
+        text = self.text_cache.render(self.font_medium, encouragement, True, GREEN)
         text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 460))
         screen.blit(text, text_rect)
 
         # 操作說明
         restart_text = "Enter/Space 重新開始關卡"
-        text = self.font_small.render(restart_text, True, WHITE)
+        text = self.text_cache.render(self.font_small, restart_text, True, WHITE)
         text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 520))
         screen.blit(text, text_rect)
 
         menu_text = "ESC 返回主選單"
-        text = self.font_small.render(menu_text, True, WHITE)
+        text = self.text_cache.render(self.font_small, menu_text, True, WHITE)
         text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 550))
         screen.blit(text, text_rect)
 
         # F11全屏快捷鍵說明
         fullscreen_text = "F11 切換全屏"
-        text = self.font_small.render(fullscreen_text, True, GRAY)
+        text = self.text_cache.render(self.font_small, fullscreen_text, True, GRAY)
         text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 580))
         screen.blit(text, text_rect)
 
@@ -2579,12 +2495,29 @@ class Game:
         pygame.display.flip()
 
     def run(self):
-        """主遊戲循環"""
+        """主遊戲循環：物理以固定頻率更新，畫面依機器能力繪製"""
+        physics_step = 1.0 / FPS
+        accumulator = 0.0
+        last_time = time.perf_counter()
+
         while self.running:
+            now = time.perf_counter()
+            # 慢的幀靠多跑幾次物理補回來；卡頓過久才丟棄時間，避免越補越慢
+            accumulator += min(now - last_time, MAX_FRAME_TIME)
+            last_time = now
+
             self.handle_events()
-            self.update()
+
+            # 依累積的時間補跑固定步長的物理更新
+            while accumulator >= physics_step:
+                self.update()
+                accumulator -= physics_step
+
+            self.render_alpha = (
+                accumulator / physics_step if RENDER_INTERPOLATION else 1.0
+            )
             self.draw()
-            self.clock.tick(FPS)
+            self.clock.tick(RENDER_FPS)
 
         pygame.quit()
 
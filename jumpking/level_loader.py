@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Jump King 關卡檔案讀取
+關卡資料放在 levels/level_XX.json（矩形可以加上 "note" 欄位當作註解），
+解析後的結果以 pickle 快取；檔案的修改時間與大小沒變時直接讀取快取，
+變了才比對內容雜湊，真的有修改的關卡才重新解析。
+不依賴 pygame，兩個版本的遊戲與工具都可以讀取同一個關卡目錄。
+"""
+import os
+import re
+import json
+import pickle
+import hashlib
+
+LEVEL_CACHE_VERSION = 1  # 快取格式或關卡解析方式改變時遞增，舊快取自動失效
+LEVELS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "levels")
+LEVEL_CACHE_NAME = "levels.cache"  # 快取檔案放在關卡目錄中
+
+LEVEL_FILE_PATTERN = re.compile(r"^level_(\d+)\.json$")
+RECT_KEYS = ("x", "y", "width", "height")
+
+
+def level_files(levels_dir):
+    """關卡編號 -> 檔案名稱"""
+    files = {}
+    for name in os.listdir(levels_dir):
+        match = LEVEL_FILE_PATTERN.match(name)
+        if match:
+            files[int(match.group(1))] = name
+    return files
+
+
+def parse_level(raw):
+    """解析一個關卡檔案的內容，回傳遊戲使用的關卡字典"""
+    level_data = json.loads(raw)
+    for key in ("platforms", "death_zones"):
+        # 去掉 note 等編輯用欄位，遊戲只需要矩形
+        level_data[key] = [
+            {rect_key: rect[rect_key] for rect_key in RECT_KEYS}
+            for rect in level_data[key]
+        ]
+    level_data["start_pos"] = tuple(level_data["start_pos"])
+    return level_data
+
+
+def dump_level(level_data):
+    """把關卡字典轉成關卡檔案的文字，每個矩形一行方便編輯與比對差異"""
+    items = []
+    for key, value in level_data.items():
+        if key in ("platforms", "death_zones") and value:
+            rects = ",\n".join(
+                "    " + json.dumps(rect, ensure_ascii=False) for rect in value
+            )
+            items.append(f'  "{key}": [\n{rects}\n  ]')
+        else:
+            items.append(f'  "{key}": ' + json.dumps(value, ensure_ascii=False))
+    return "{\n" + ",\n".join(items) + "\n}\n"
+
+
+def load_cache(cache_file):
+    """讀取快取，格式不符或損毀時回傳空快取"""
+    try:
+        with open(cache_file, "rb") as f:
+            cache = pickle.load(f)
+        if cache.get("version") == LEVEL_CACHE_VERSION:
+            return cache
+    except FileNotFoundError:
+        pass
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+        print(f"關卡快取損毀，重新解析: {e}")
+    return {"version": LEVEL_CACHE_VERSION, "files": {}}
+
+
+def save_cache(cache_file, cache):
+    """寫入快取（先寫暫存檔再替換，避免同時啟動時讀到一半的檔案）"""
+    temp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        with open(temp_file, "wb") as f:
+            pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, cache_file)
+    except OSError as e:
+        print(f"無法寫入關卡快取: {e}")
+
+
+def load_levels(levels_dir=LEVELS_DIR, cache_file=None):
+    """
+    讀取目錄中所有關卡，回傳 {關卡編號: 關卡字典}
+    快取中每個檔案記錄 (修改時間, 大小, 內容雜湊, 關卡字典)
+    """
+    if cache_file is None:
+        cache_file = os.path.join(levels_dir, LEVEL_CACHE_NAME)
+    cache = load_cache(cache_file)
+    cached_files = cache["files"]
+    files = {}
+    levels = {}
+    changed = False
+
+    for level_num, name in sorted(level_files(levels_dir).items()):
+        path = os.path.join(levels_dir, name)
+        stat = os.stat(path)
+        entry = cached_files.get(name)
+
+        if entry and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+            files[name] = entry
+            levels[level_num] = entry[3]
+            continue
+
+        with open(path, "rb") as f:
+            raw = f.read()
+        digest = hashlib.sha1(raw).hexdigest()
+        if entry and entry[2] == digest:
+            # 只是被 touch 過，內容沒變
+            level_data = entry[3]
+        else:
+            level_data = parse_level(raw)
+        files[name] = (stat.st_mtime_ns, stat.st_size, digest, level_data)
+        levels[level_num] = level_data
+        changed = True
+
+    if changed or files.keys() != cached_files.keys():
+        save_cache(cache_file, {"version": LEVEL_CACHE_VERSION, "files": files})
+
+    return levels
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Jump King 二進位關卡包
+給非常高的自訂塔（數十萬個平台）使用：平台與死亡區域依 y 排序，
+以固定寬度的 int32 (x, y, width, height) 紀錄存放，遊戲用 mmap 開啟後，
+以二分搜尋找出畫面範圍內的矩形，不必把整座塔讀成 Python 字典，
+啟動時間與記憶體用量不隨塔的高度增加。
+
+檔案格式（little-endian）：
+    標頭 PACK_HEADER、關卡資訊 JSON、補齊到 16 位元組，
+    接著是平台紀錄與死亡區域紀錄，兩段各自依 (y, x) 排序
+
+    python level_pack.py pack levels/level_12.json --segments 100000 --output tall.jkpack
+    python level_pack.py info levels/level_12.jkpack
+"""
+import os
+import re
+import sys
+import json
+import mmap
+import math
+import struct
+import argparse
+from bisect import bisect_left, bisect_right
+
+from physics import (
+    LevelRect,
+    PlatformGrid,
+    DeathZoneIndex,
+    RectRangeIndex,
+    level_bounds,
+)
+
+PACK_MAGIC = b"JKPK"
+PACK_VERSION = 1
+# 魔術字、版本、平台數量、死亡區域數量、平台最大高度、死亡區域最大高度、資訊長度
+PACK_HEADER = struct.Struct("<4sIIIiiI")
+RECORD = struct.Struct("<iiii")
+RECORD_Y = struct.Struct("<i")
+RECORD_Y_OFFSET = 4  # y 在紀錄中的位置
+RECORD_ALIGN = 16
+
+PACK_FILE_PATTERN = re.compile(r"^level_(\d+)\.jkpack$")
+
+
+def level_pack_files(levels_dir):
+    """關卡編號 -> 關卡包路徑"""
+    files = {}
+    for name in os.listdir(levels_dir):
+        match = PACK_FILE_PATTERN.match(name)
+        if match:
+            files[int(match.group(1))] = os.path.join(levels_dir, name)
+    return files
+
+
+def rect_values(rect):
+    """關卡字典或 LevelRect 轉成 (x, y, width, height)"""
+    if isinstance(rect, dict):
+        return rect["x"], rect["y"], rect["width"], rect["height"]
+    return tuple(rect[:4])
+
+
+def write_level_pack(path, level_data, goal_platforms=None):
+    """
+    把關卡寫成關卡包
+    level_data 與關卡檔案相同，platforms、death_zones 可以是字典或 LevelRect
+    goal_platforms 預設為頂部在 goal_y 以上的平台；加上塔的分段時，
+    與 StreamingLevel 相同只有關卡本身的目標平台算目標，需另外指定
+    """
+    if goal_platforms is None:
+        goal_y = level_data["goal_y"]
+        goal_platforms = [
+            p for p in level_data["platforms"] if rect_values(p)[1] <= goal_y
+        ]
+    platforms = sorted(
+        (rect_values(p) for p in level_data["platforms"]), key=lambda r: (r[1], r[0])
+    )
+    death_zones = sorted(
+        (rect_values(z) for z in level_data["death_zones"]), key=lambda r: (r[1], r[0])
+    )
+    rects = [
+        LevelRect(x, y, w, h, x + w, y + h) for x, y, w, h in platforms + death_zones
+    ]
+    bounds = level_bounds(rects)
+
+    # 目標平台與整體範圍存在關卡資訊中，開啟時不必掃描紀錄
+    info = {
+        key: value
+        for key, value in level_data.items()
+        if key not in ("platforms", "death_zones")
+    }
+    info["start_pos"] = list(info["start_pos"])
+    info["goal_platforms"] = [rect_values(p) for p in goal_platforms]
+    info["bounds"] = list(bounds[:4]) if bounds else None
+    info_bytes = json.dumps(info, ensure_ascii=False).encode("utf-8")
+
+    header = PACK_HEADER.pack(
+        PACK_MAGIC,
+        PACK_VERSION,
+        len(platforms),
+        len(death_zones),
+        max((r[3] for r in platforms), default=0),
+        max((r[3] for r in death_zones), default=0),
+        len(info_bytes),
+    )
+    padding = -(len(header) + len(info_bytes)) % RECORD_ALIGN
+
+    temp_file = f"{path}.{os.getpid()}.tmp"
+    with open(temp_file, "wb") as f:
+        f.write(header)
+        f.write(info_bytes)
+        f.write(b"\0" * padding)
+        for values in platforms:
+            f.write(RECORD.pack(*values))
+        for values in death_zones:
+            f.write(RECORD.pack(*values))
+    os.replace(temp_file, path)
+
+
+class _RecordColumn:
+    """把 mmap 中一段紀錄的 y 欄位包成可以二分搜尋的序列"""
+
+    __slots__ = ("buffer", "offset", "count")
+
+    def __init__(self, buffer, offset, count):
+        self.buffer = buffer
+        self.offset = offset
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        offset = self.offset + index * RECORD.size + RECORD_Y_OFFSET
+        return RECORD_Y.unpack_from(self.buffer, offset)[0]
+
+
+class LevelPack:
+    """以 mmap 開啟的關卡包，只有查詢到的矩形才會轉成 LevelRect"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (
+            magic,
+            version,
+            platform_count,
+            death_zone_count,
+            self.max_platform_height,
+            self.max_death_zone_height,
+            info_length,
+        ) = PACK_HEADER.unpack_from(self.buffer, 0)
+        if magic != PACK_MAGIC:
+            self.close()
+            raise ValueError(f"不是關卡包: {path}")
+        if version != PACK_VERSION:
+            self.close()
+            raise ValueError(f"不支援的關卡包版本: {version}")
+
+        info_start = PACK_HEADER.size
+        self.info = json.loads(self.buffer[info_start : info_start + info_length])
+        records_start = info_start + info_length
+        records_start += -records_start % RECORD_ALIGN
+
+        self.platform_ys = _RecordColumn(self.buffer, records_start, platform_count)
+        self.death_zone_ys = _RecordColumn(
+            self.buffer, records_start + platform_count * RECORD.size, death_zone_count
+        )
+
+    def level_data(self):
+        """關卡名稱、起點、目標等資訊（不含平台與死亡區域）"""
+        level_data = {
+            key: value
+            for key, value in self.info.items()
+            if key not in ("goal_platforms", "bounds")
+        }
+        level_data["start_pos"] = tuple(level_data["start_pos"])
+        return level_data
+
+    def _rects_in(self, column, max_height, top, bottom):
+        """紀錄中與 [top, bottom] 重疊的矩形"""
+        first = bisect_left(column, top - max_height)
+        last = bisect_right(column, bottom)
+        rects = []
+        offset = column.offset + first * RECORD.size
+        for x, y, width, height in RECORD.iter_unpack(
+            self.buffer[offset : column.offset + last * RECORD.size]
+        ):
+            if y + height >= top:
+                rects.append(LevelRect(x, y, width, height, x + width, y + height))
+        return rects
+
+    def platforms_in(self, top, bottom):
+        """y 範圍 [top, bottom] 內的平台"""
+        return self._rects_in(self.platform_ys, self.max_platform_height, top, bottom)
+
+    def death_zones_in(self, top, bottom):
+        """y 範圍 [top, bottom] 內的死亡區域"""
+        return self._rects_in(
+            self.death_zone_ys, self.max_death_zone_height, top, bottom
+        )
+
+    def close(self):
+        self.buffer.close()
+
+
+class PackedLevel:
+    """
+    關卡包的關卡，介面與 CompiledLevel 相同
+    與 StreamingLevel 一樣隨畫面呼叫 update_window，只保留畫面附近的矩形
+    """
+
+    __slots__ = (
+        "number",
+        "platforms",
+        "death_zones",
+        "goal_y",
+        "goal_platforms",
+        "goal_platform_set",
+        "bounds",
+        "platform_grid",
+        "death_zone_index",
+        "platform_view_index",
+        "death_zone_view_index",
+        "pack",
+        "chunk_height",
+        "load_above",
+        "keep_below",
+        "chunk_range",
+    )
+
+    def __init__(self, pack, chunk_height, load_above, keep_below, number=None):
+        self.number = number
+        self.pack = pack
+        self.chunk_height = chunk_height  # 範圍以此高度為單位移動，避免每幀重建
+        self.load_above = load_above  # 畫面上方預先載入的距離（像素）
+        self.keep_below = keep_below  # 畫面下方保留的距離
+
+        info = pack.info
+        self.goal_y = info["goal_y"]
+        self.goal_platforms = tuple(
+            LevelRect(x, y, w, h, x + w, y + h) for x, y, w, h in info["goal_platforms"]
+        )
+        self.goal_platform_set = frozenset(self.goal_platforms)  # 繪製時查詢用
+        if info["bounds"]:
+            x, y, w, h = info["bounds"]
+            self.bounds = LevelRect(x, y, w, h, x + w, y + h)
+        else:
+            self.bounds = None
+
+        self.chunk_range = None
+        start_y = info["start_pos"][1]
+        self.update_window(start_y, start_y)
+
+    def update_window(self, view_top, view_bottom):
+        """畫面移動後呼叫：範圍改變時才重新查詢矩形並重建碰撞索引，回傳是否重建"""
+        height = self.chunk_height
+        chunk_range = (
+            math.floor((view_top - self.load_above) / height),
+            math.ceil((view_bottom + self.keep_below) / height),
+        )
+        if chunk_range == self.chunk_range:
+            return False
+
+        top = chunk_range[0] * height
+        bottom = chunk_range[1] * height
+        self.chunk_range = chunk_range
+        self.platforms = tuple(self.pack.platforms_in(top, bottom))
+        self.death_zones = tuple(self.pack.death_zones_in(top, bottom))
+        self.platform_grid = PlatformGrid(self.platforms)
+        self.death_zone_index = DeathZoneIndex(self.death_zones)
+        self.platform_view_index = RectRangeIndex(self.platforms)
+        self.death_zone_view_index = RectRangeIndex(self.death_zones)
+        return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="關卡包工具")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    pack = commands.add_parser("pack", help="把關卡檔案（可加上塔的分段）寫成關卡包")
+    pack.add_argument("level", help="關卡檔案 level_XX.json")
+    pack.add_argument("--tower", help="用 tower.py bake 烘焙的塔檔案")
+    pack.add_argument("--seed", type=int, default=None, help="直接以此種子生成塔")
+    pack.add_argument("--segments", type=int, default=0, help="生成的分段數量")
+    pack.add_argument("--workers", type=int, default=None, help="生成分段的行程數量")
+    pack.add_argument("--output", required=True, help="輸出的關卡包")
+
+    info = commands.add_parser("info", help="顯示關卡包資訊")
+    info.add_argument("files", nargs="+", help="關卡包")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "pack":
+        import tower
+        from level_loader import parse_level
+
+        with open(args.level, "rb") as f:
+            level_data = parse_level(f.read())
+        goal_platforms = [
+            p for p in level_data["platforms"] if p["y"] <= level_data["goal_y"]
+        ]
+
+        segments = []
+        if args.tower:
+            segments = tower.load_tower_file(args.tower).segments
+        elif args.segments:
+            seed = tower.DEFAULT_TOWER_SEED if args.seed is None else args.seed
+            segments = tower.bake_tower(seed, args.segments, args.workers).segments
+        for platforms, death_zones in segments:
+            level_data["platforms"].extend(platforms)
+            level_data["death_zones"].extend(death_zones)
+
+        write_level_pack(args.output, level_data, goal_platforms)
+        print(
+            f"已寫入 {args.output}: {len(level_data['platforms'])} 個平台、"
+            f"{len(level_data['death_zones'])} 個死亡區域"
+            f"（{os.path.getsize(args.output) / 1024:.0f} KB）"
+        )
+    else:
+        for path in args.files:
+            level_pack = LevelPack(path)
+            bounds = level_pack.info["bounds"]
+            print(
+                f"{path}: {level_pack.info['name']}，"
+                f"{len(level_pack.platform_ys)} 個平台、"
+                f"{len(level_pack.death_zone_ys)} 個死亡區域，"
+                f"y 範圍 {bounds[1] if bounds else '-'} ~ "
+                f"{bounds[1] + bounds[3] if bounds else '-'}"
+            )
+            level_pack.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
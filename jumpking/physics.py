@@ -0,0 +1,780 @@
+#!/usr/bin/env python3
+"""
+Jump King 物理核心
+不依賴 pygame 與 Game 實例的玩家物理
+遊戲中的 Player 與求解器、測試、機器人共用同一份邏輯，結果完全一致
+"""
+import math
+import random
+from collections import namedtuple
+from bisect import bisect_left, bisect_right
+
+# 物理設定
+SCREEN_WIDTH = 1200  # 左右牆壁貼齊畫面兩側
+FPS = 60  # 物理固定更新頻率（每秒更新次數），蓄力時間也依此換算成更新次數
+GRAVITY = 0.5
+MAX_FALL_SPEED = 15
+JUMP_CHARGE_RATE = 0.3
+MAX_JUMP_POWER = 20
+MIN_JUMP_POWER = 5
+JUMP_POWER_PAUSE_DURATION = 30  # 蓄滿後暫停的物理更新次數（約0.5秒）
+
+# 玩家設定
+PLAYER_WIDTH = 30
+PLAYER_HEIGHT = 40
+
+# 碰撞設定
+COLLISION_CELL_SIZE = 100  # 平台空間網格的格子大小（像素）
+SWEPT_COLLISION = True  # 連續碰撞檢測，避免高速穿過薄平台
+DEATH_ZONE_TALL_HEIGHT = 200  # 高於此值的死亡區域（例如邊界牆）不放進排序索引
+
+# 第11關掉落陷阱
+FALL_TRAP_ZONES = [
+    (90, 160),  # 第一個危險區域
+    (240, 310),  # 第二個危險區域
+    (490, 560),  # 第三個危險區域
+    (740, 810),  # 第四個危險區域
+]
+FALL_TRAP_CHANCE = 0.15  # 15%機率
+
+
+# 關卡中的平台或死亡區域，右邊與底部在編譯時預先算好
+LevelRect = namedtuple("LevelRect", ("x", "y", "width", "height", "right", "bottom"))
+
+
+def compile_rect(rect_data):
+    """把關卡資料中的 {"x", "y", "width", "height"} 字典轉成 LevelRect"""
+    x = rect_data["x"]
+    y = rect_data["y"]
+    width = rect_data["width"]
+    height = rect_data["height"]
+    return LevelRect(x, y, width, height, x + width, y + height)
+
+
+def level_bounds(rects):
+    """涵蓋所有矩形的範圍，沒有矩形時回傳 None"""
+    if not rects:
+        return None
+    left = min(rect.x for rect in rects)
+    top = min(rect.y for rect in rects)
+    right = max(rect.right for rect in rects)
+    bottom = max(rect.bottom for rect in rects)
+    return LevelRect(left, top, right - left, bottom - top, right, bottom)
+
+
+class PlatformGrid:
+    """平台空間網格：關卡載入時建立，碰撞檢測只需檢查玩家附近的平台"""
+
+    def __init__(self, platforms, cell_size=COLLISION_CELL_SIZE):
+        self.platforms = platforms
+        self.cell_size = cell_size
+        self.cells = {}
+
+        for index, platform in enumerate(platforms):
+            for cell in self.cells_in_rect(
+                platform.x, platform.y, platform.width, platform.height
+            ):
+                self.cells.setdefault(cell, []).append(index)
+
+    def cells_in_rect(self, x, y, width, height):
+        """列出矩形覆蓋到的所有格子"""
+        size = self.cell_size
+        min_col = int(x // size)
+        max_col = int((x + width) // size)
+        min_row = int(y // size)
+        max_row = int((y + height) // size)
+
+        for col in range(min_col, max_col + 1):
+            for row in range(min_row, max_row + 1):
+                yield col, row
+
+    def query(self, x, y, width, height):
+        """取得可能與矩形重疊的平台，順序與原始平台列表相同"""
+        size = self.cell_size
+        min_col = int(x // size)
+        max_col = int((x + width) // size)
+        min_row = int(y // size)
+        max_row = int((y + height) // size)
+        cells = self.cells
+
+        # 大多數格子是空的：只找到一格有平台時直接用該格的列表（已依原始順序排列）
+        first_bucket = None
+        indices = None
+        for col in range(min_col, max_col + 1):
+            for row in range(min_row, max_row + 1):
+                bucket = cells.get((col, row))
+                if not bucket:
+                    continue
+                if first_bucket is None:
+                    first_bucket = bucket
+                elif indices is None:
+                    indices = set(first_bucket)
+                    indices.update(bucket)
+                else:
+                    indices.update(bucket)
+
+        if first_bucket is None:
+            return []
+
+        # 保持原始順序，碰撞處理的先後才會與逐一檢查完全一致
+        platforms = self.platforms
+        if indices is None:
+            return [platforms[index] for index in first_bucket]
+        return [platforms[index] for index in sorted(indices)]
+
+
+class DeathZoneIndex:
+    """死亡區域區間索引：依頂部 y 排序，只檢查垂直範圍可能重疊的區域"""
+
+    def __init__(self, death_zones, tall_height=DEATH_ZONE_TALL_HEIGHT):
+        self.tall_zones = []  # 很高的區域（例如邊界牆）每次直接檢查
+        zones = []
+        for zone in death_zones:
+            bounds = (zone.x, zone.right, zone.y, zone.bottom)
+            if zone.height > tall_height:
+                self.tall_zones.append(bounds)
+            else:
+                zones.append(bounds)
+
+        zones.sort(key=lambda bounds: bounds[2])
+        self.zones = zones
+        self.tops = [bounds[2] for bounds in zones]
+        self.max_height = max((bottom - top for _, _, top, bottom in zones), default=0)
+
+    def query(self, y, height):
+        """取得垂直範圍可能與 y 到 y + height 重疊的區域（不含很高的區域）"""
+        low = bisect_right(self.tops, y - self.max_height)
+        high = bisect_left(self.tops, y + height)
+        return self.zones[low:high]
+
+    def overlaps(self, x, y, width, height):
+        """矩形是否碰到任何死亡區域"""
+        for left, right, top, bottom in self.tall_zones:
+            if x < right and x + width > left and y < bottom and y + height > top:
+                return True
+        for left, right, top, bottom in self.query(y, height):
+            if x < right and x + width > left and y < bottom and y + height > top:
+                return True
+        return False
+
+
+class RectRangeIndex:
+    """
+    繪製用的矩形索引：依頂部 y 排序，用二分搜尋找出與畫面垂直範圍重疊的矩形，
+    只畫畫面內的物件；很高的矩形（例如邊界牆）每次直接檢查
+    """
+
+    def __init__(self, rects, tall_height=DEATH_ZONE_TALL_HEIGHT):
+        self.rects = rects
+        self.tall_indices = []
+        entries = []
+        for index, rect in enumerate(rects):
+            if rect.height > tall_height:
+                self.tall_indices.append(index)
+            else:
+                entries.append((rect.y, index))
+
+        entries.sort()
+        self.tops = [top for top, _ in entries]
+        self.indices = [index for _, index in entries]
+        self.max_height = max(
+            (rects[index].height for index in self.indices), default=0
+        )
+
+    def query(self, top, bottom):
+        """與 y 範圍 [top, bottom) 重疊的矩形，順序與原始列表相同（重疊時的繪製先後不變）"""
+        rects = self.rects
+        low = bisect_right(self.tops, top - self.max_height)
+        high = bisect_left(self.tops, bottom)
+        indices = [
+            index for index in self.indices[low:high] if rects[index].bottom > top
+        ]
+        for index in self.tall_indices:
+            if rects[index].y < bottom and rects[index].bottom > top:
+                indices.append(index)
+        indices.sort()
+        return [rects[index] for index in indices]
+
+
+class PlayerState:
+    """無畫面模擬用的玩家狀態，欄位名稱與 Player 相同"""
+
+    __slots__ = (
+        "x",
+        "y",
+        "vel_x",
+        "vel_y",
+        "on_ground",
+        "jump_charging",
+        "jump_power",
+        "facing_right",
+        "start_x",
+        "start_y",
+        "death_count",
+        "jump_power_paused",
+        "jump_power_pause_timer",
+        "jump_charge_ticks",
+    )
+
+    width = PLAYER_WIDTH
+    height = PLAYER_HEIGHT
+    jump_power_pause_duration = JUMP_POWER_PAUSE_DURATION
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.vel_x = 0
+        self.vel_y = 0
+        self.on_ground = True
+        self.jump_charging = False
+        self.jump_power = 0
+        self.facing_right = True
+        self.start_x = x
+        self.start_y = y
+        self.death_count = 0
+        self.jump_power_paused = False
+        self.jump_power_pause_timer = 0
+        self.jump_charge_ticks = 0  # 已蓄力的時間（以物理更新次數計，可以是小數）
+
+    def copy(self):
+        """複製狀態，方便從同一點分支模擬"""
+        state = PlayerState.__new__(PlayerState)
+        for name in PlayerState.__slots__:
+            setattr(state, name, getattr(self, name))
+        return state
+
+
+class PlayerInput:
+    """一次物理更新的按鍵輸入"""
+
+    __slots__ = ("charge_start", "charge_held", "jump_direction")
+
+    def __init__(self, charge_start=False, charge_held=False, jump_direction=None):
+        self.charge_start = charge_start  # 本次按下 SPACE
+        self.charge_held = charge_held  # SPACE 維持按住
+        self.jump_direction = jump_direction  # 放開 SPACE 時的方向，None 表示沒放開
+
+
+class CompiledLevel:
+    """
+    編譯後的關卡：載入時把平台與死亡區域的字典轉成不可變的 LevelRect，
+    並預先算好目標平台、關卡範圍與碰撞索引，每幀的熱路徑只讀這份資料
+    """
+
+    __slots__ = (
+        "number",
+        "platforms",
+        "death_zones",
+        "goal_y",
+        "goal_platforms",
+        "goal_platform_set",
+        "bounds",
+        "platform_grid",
+        "death_zone_index",
+        "platform_view_index",
+        "death_zone_view_index",
+    )
+
+    def __init__(self, level_data, number=None):
+        self.number = number
+        self.platforms = tuple(compile_rect(p) for p in level_data["platforms"])
+        self.death_zones = tuple(compile_rect(z) for z in level_data["death_zones"])
+        self.goal_y = level_data["goal_y"]
+        # 與目標判定相同的條件：頂部在 goal_y 以上的平台
+        self.goal_platforms = tuple(
+            platform for platform in self.platforms if platform.y <= self.goal_y
+        )
+        self.goal_platform_set = frozenset(self.goal_platforms)  # 繪製時查詢用
+        self.bounds = level_bounds(self.platforms + self.death_zones)
+        self.platform_grid = PlatformGrid(self.platforms)
+        self.death_zone_index = DeathZoneIndex(self.death_zones)
+        self.platform_view_index = RectRangeIndex(self.platforms)
+        self.death_zone_view_index = RectRangeIndex(self.death_zones)
+
+
+class StreamingLevel:
+    """
+    分段串流的無限關卡，介面與 CompiledLevel 相同
+    依畫面範圍按需生成上方的分段、移除遠在下方的分段，同時存在的分段數量固定，
+    記憶體與每幀的碰撞、繪製成本不會隨玩家爬升的高度增加
+    segment_source(分段編號) 回傳該分段的 (平台列表, 死亡區域列表)，
+    第 n 段位於 y = -n * segment_height 附近，同一段每次生成的結果必須相同
+    """
+
+    __slots__ = (
+        "number",
+        "platforms",
+        "death_zones",
+        "goal_y",
+        "goal_platforms",
+        "goal_platform_set",
+        "bounds",
+        "platform_grid",
+        "death_zone_index",
+        "platform_view_index",
+        "death_zone_view_index",
+        "segment_source",
+        "segment_height",
+        "generate_above",
+        "keep_below",
+        "base_platforms",
+        "base_death_zones",
+        "segments",
+        "segment_range",
+    )
+
+    def __init__(
+        self,
+        level_data,
+        segment_source,
+        segment_height,
+        generate_above,
+        keep_below,
+        number=None,
+    ):
+        self.number = number
+        self.segment_source = segment_source
+        self.segment_height = segment_height
+        self.generate_above = generate_above  # 畫面上方預先生成的距離（像素）
+        self.keep_below = keep_below  # 畫面下方保留的距離，更下方的分段會被移除
+
+        # 關卡資料本身的平台與死亡區域（起點、目標、底部深淵等）一直保留
+        self.base_platforms = tuple(compile_rect(p) for p in level_data["platforms"])
+        self.base_death_zones = tuple(
+            compile_rect(z) for z in level_data["death_zones"]
+        )
+        self.goal_y = level_data["goal_y"]
+        # 只有關卡本身的目標平台算目標，串流生成的分段平台不算
+        self.goal_platforms = tuple(
+            platform for platform in self.base_platforms if platform.y <= self.goal_y
+        )
+        self.goal_platform_set = frozenset(self.goal_platforms)  # 繪製時查詢用
+
+        self.segments = {}  # 分段編號 -> (平台, 死亡區域)
+        self.segment_range = None
+        start_y = level_data["start_pos"][1]
+        self.update_window(start_y, start_y)
+
+    def segments_for_view(self, view_top, view_bottom):
+        """畫面範圍需要的第一段與最後一段編號"""
+        height = self.segment_height
+        first = max(1, math.floor(-(view_bottom + self.keep_below) / height))
+        last = max(first, math.ceil(-(view_top - self.generate_above) / height))
+        return first, last
+
+    def update_window(self, view_top, view_bottom):
+        """
+        畫面移動後呼叫：生成進入範圍的分段、移除離開範圍的分段
+        範圍沒變時不做任何事，改變時才重建平台列表與碰撞索引，回傳是否重建
+        """
+        segment_range = self.segments_for_view(view_top, view_bottom)
+        if segment_range == self.segment_range:
+            return False
+        first, last = segment_range
+
+        segments = self.segments
+        for index in [index for index in segments if not first <= index <= last]:
+            del segments[index]
+        for index in range(first, last + 1):
+            if index not in segments:
+                platforms, death_zones = self.segment_source(index)
+                segments[index] = (
+                    tuple(compile_rect(p) for p in platforms),
+                    tuple(compile_rect(z) for z in death_zones),
+                )
+
+        platforms = list(self.base_platforms)
+        death_zones = list(self.base_death_zones)
+        for index in range(first, last + 1):
+            platforms.extend(segments[index][0])
+            death_zones.extend(segments[index][1])
+
+        self.segment_range = segment_range
+        self.platforms = tuple(platforms)
+        self.death_zones = tuple(death_zones)
+        self.bounds = level_bounds(self.platforms + self.death_zones)
+        self.platform_grid = PlatformGrid(self.platforms)
+        self.death_zone_index = DeathZoneIndex(self.death_zones)
+        self.platform_view_index = RectRangeIndex(self.platforms)
+        self.death_zone_view_index = RectRangeIndex(self.death_zones)
+        return True
+
+
+def reset_position(state):
+    """重置玩家位置到關卡起點"""
+    state.x = state.start_x
+    state.y = state.start_y
+    state.vel_x = 0
+    state.vel_y = 0
+    state.on_ground = True  # 確保重置後在地面上
+    state.jump_charging = False
+    state.jump_power = 0
+    state.death_count += 1
+
+    # 重置跳躍力量循環系統
+    state.jump_power_paused = False
+    state.jump_power_pause_timer = 0
+    state.jump_charge_ticks = 0
+
+
+def start_jump_charge(state):
+    """開始蓄力（允許任何時候開始，執行跳躍時才檢查是否在地面）"""
+    state.jump_charging = True
+    set_jump_charge(state, 0)
+
+
+def set_jump_charge(state, charge_ticks):
+    """
+    依已蓄力的時間（以物理更新次數計）設定跳躍力量：
+    蓄滿後暫停 jump_power_pause_duration 次更新的時間，再從最小值重新充能
+    力量只取決於蓄力時間，與經過了幾幀無關
+    """
+    state.jump_charge_ticks = charge_ticks
+    full_ticks = (MAX_JUMP_POWER - MIN_JUMP_POWER) / JUMP_CHARGE_RATE
+    cycle_ticks = full_ticks + state.jump_power_pause_duration
+    ticks = charge_ticks % cycle_ticks
+
+    if ticks < full_ticks:
+        # 正常充能狀態
+        state.jump_power = MIN_JUMP_POWER + JUMP_CHARGE_RATE * ticks
+        state.jump_power_paused = False
+        state.jump_power_pause_timer = 0
+    else:
+        # 達到最大值，暫停到這一輪結束
+        state.jump_power = MAX_JUMP_POWER
+        state.jump_power_paused = True
+        state.jump_power_pause_timer = cycle_ticks - ticks
+
+
+def update_jump_charge(state):
+    """固定步長的蓄力：多蓄一次物理更新的時間（無畫面模擬與工具使用）"""
+    if state.jump_charging:
+        set_jump_charge(state, state.jump_charge_ticks + 1)
+
+
+def charge_for_duration(state, seconds):
+    """依按下 SPACE 後實際經過的秒數設定蓄力，結果與幀率和卡頓無關"""
+    if state.jump_charging:
+        set_jump_charge(state, seconds * FPS)
+
+
+def execute_jump(state, direction):
+    """執行跳躍，真的跳起來時回傳 True"""
+    # 只有在地面上且蓄力時才能跳躍
+    if state.jump_charging and state.on_ground:
+        # 計算跳躍向量
+        angle = 0
+        if direction == "left":
+            angle = 120  # 左上 (調整角度)
+            state.facing_right = False
+        elif direction == "right":
+            angle = 60  # 右上 (調整角度)
+            state.facing_right = True
+        else:  # 直接向上
+            angle = 90
+
+        # 轉換為弧度
+        angle_rad = math.radians(angle)
+
+        # 應用跳躍力 (增強跳躍力)
+        jump_force = state.jump_power * 1.2  # 增加跳躍力
+        state.vel_x = math.cos(angle_rad) * jump_force
+        state.vel_y = math.sin(angle_rad) * -jump_force
+
+        # 重置跳躍狀態
+        state.jump_charging = False
+        state.jump_power = 0
+        state.on_ground = False
+        # 重置暫停狀態
+        state.jump_power_paused = False
+        state.jump_power_pause_timer = 0
+        state.jump_charge_ticks = 0
+        return True
+
+    # 即使無法跳躍也要重置蓄力狀態
+    if state.jump_charging:
+        state.jump_charging = False
+        state.jump_power = 0
+        # 重置暫停狀態
+        state.jump_power_paused = False
+        state.jump_power_pause_timer = 0
+        state.jump_charge_ticks = 0
+    return False
+
+
+def check_screen_boundaries(state):
+    """檢查屏幕邊界並處理反彈"""
+    wall_width = 10
+
+    # 左邊界（考慮牆壁寬度）
+    if state.x <= wall_width:
+        state.x = wall_width
+        if state.vel_x < 0:  # 只有當玩家向左移動時才反彈
+            state.vel_x = -state.vel_x * 0.7  # 反彈，保持較多速度
+
+    # 右邊界（考慮牆壁寬度）
+    if state.x + state.width >= SCREEN_WIDTH - wall_width:
+        state.x = SCREEN_WIDTH - wall_width - state.width
+        if state.vel_x > 0:  # 只有當玩家向右移動時才反彈
+            state.vel_x = -state.vel_x * 0.7  # 反彈，保持較多速度
+
+
+def sweep_axis(start, size, delta, platform_start, platform_end):
+    """計算單一軸上開始與結束重疊的時間（0 為本幀起點，1 為終點）"""
+    if delta > 0:
+        entry_time = (platform_start - (start + size)) / delta
+        exit_time = (platform_end - start) / delta
+        return entry_time, exit_time
+    if delta < 0:
+        entry_time = (platform_end - start) / delta
+        exit_time = (platform_start - (start + size)) / delta
+        return entry_time, exit_time
+    if start < platform_end and start + size > platform_start:
+        return float("-inf"), float("inf")
+    return None
+
+
+def query_swept_platforms(state, platforms, start_x, start_y, platform_grid=None):
+    """取得本幀掃過範圍附近的平台，連續碰撞與重疊檢查共用這份列表"""
+    if not platform_grid:
+        return platforms
+
+    # 多留 1 像素，涵蓋重疊檢查時座標取整造成的誤差
+    return platform_grid.query(
+        min(start_x, state.x) - 1,
+        min(start_y, state.y) - 1,
+        abs(state.x - start_x) + state.width + 2,
+        abs(state.y - start_y) + state.height + 2,
+    )
+
+
+def sweep_platform_collision(state, platforms, start_x, start_y, platform_grid=None):
+    """連續碰撞檢測：沿本幀位移找出最早落到的平台，避免高速下墜穿過薄平台"""
+    delta_x = state.x - start_x
+    delta_y = state.y - start_y
+    # 只處理往下落的情況；往上跳與側面碰撞維持一般碰撞的手感
+    # （一般碰撞允許從平台邊緣往上穿過平台，關卡設計依賴這個特性）
+    if delta_y <= 0:
+        return
+
+    # 本幀掃過的範圍
+    nearby_platforms = query_swept_platforms(
+        state, platforms, start_x, start_y, platform_grid
+    )
+
+    first_time = None
+    first_platform = None
+    for platform in nearby_platforms:
+        x_times = sweep_axis(start_x, state.width, delta_x, platform.x, platform.right)
+        y_times = sweep_axis(
+            start_y, state.height, delta_y, platform.y, platform.bottom
+        )
+        if x_times is None or y_times is None:
+            continue
+
+        entry_time = max(x_times[0], y_times[0])
+        exit_time = min(x_times[1], y_times[1])
+        # 起點已重疊或本幀碰不到的平台交給一般碰撞處理
+        if entry_time < 0 or entry_time > 1 or entry_time >= exit_time:
+            continue
+
+        # 從側面撞上交給一般碰撞處理（水平速度不足以穿過平台）
+        if x_times[0] > y_times[0]:
+            continue
+
+        if first_time is None or entry_time < first_time:
+            first_time = entry_time
+            first_platform = platform
+
+    if first_platform is None:
+        return
+
+    # 從上方落下：停在撞擊當下的位置（平台頂部），水平位移只算到撞擊為止，
+    # 確保玩家落在這個平台上，接著的一般碰撞會把它判定為地面
+    state.x = start_x + delta_x * first_time
+    state.y = first_platform.y - state.height
+    state.vel_y = 0
+
+
+def check_platform_collision(
+    state, platforms, platform_grid=None, nearby_platforms=None
+):
+    """
+    檢查平台碰撞並更新是否在地面上
+    nearby_platforms 可傳入已查好、涵蓋玩家目前位置的平台列表
+    """
+    # 與 pygame.Rect 相同，重疊判斷使用截斷成整數的玩家座標
+    rect_x = int(state.x)
+    rect_y = int(state.y)
+    width = state.width
+    height = state.height
+    ground_detected = False  # 先用標記而不是直接設置
+
+    # 有空間網格時只檢查玩家附近的平台
+    if nearby_platforms is None:
+        nearby_platforms = platforms
+        if platform_grid:
+            nearby_platforms = platform_grid.query(rect_x, rect_y, width, height)
+
+    for platform_x, platform_y, _, _, platform_right, platform_bottom in (
+        nearby_platforms
+    ):
+        if (
+            rect_x < platform_right
+            and rect_x + width > platform_x
+            and rect_y < platform_bottom
+            and rect_y + height > platform_y
+        ):
+            # 改善碰撞檢測 - 更精確的判斷
+            overlap_left = (state.x + width) - platform_x
+            overlap_right = platform_right - state.x
+            overlap_top = (state.y + height) - platform_y
+            overlap_bottom = platform_bottom - state.y
+
+            # 找出最小重疊方向
+            min_overlap = min(overlap_left, overlap_right, overlap_top, overlap_bottom)
+
+            if min_overlap == overlap_top and state.vel_y >= 0:
+                # 從上方落下
+                state.y = platform_y - height
+                state.vel_y = 0
+                ground_detected = True
+            elif min_overlap == overlap_bottom and state.vel_y <= 0:
+                # 從下方撞擊
+                state.y = platform_bottom
+                state.vel_y = 0
+            elif min_overlap == overlap_left and state.vel_x >= 0:
+                # 從左側撞擊平台 - 反彈
+                state.x = platform_x - width
+                state.vel_x = -state.vel_x * 0.6  # 反彈，保持更多速度
+            elif min_overlap == overlap_right and state.vel_x <= 0:
+                # 從右側撞擊平台 - 反彈
+                state.x = platform_right
+                state.vel_x = -state.vel_x * 0.6  # 反彈，保持更多速度
+
+    # 詳細地面檢測 - 檢查玩家底部是否接觸任何平台
+    if not ground_detected:
+        nearby_platforms = platforms
+        if platform_grid:
+            # 只需要頂部落在玩家腳底 ±3 像素內的平台
+            nearby_platforms = platform_grid.query(
+                state.x, state.y + height - 3, width, 6
+            )
+
+        for platform in nearby_platforms:
+            # 檢查水平重疊
+            if state.x < platform.right and state.x + width > platform.x:
+                # 檢查垂直接觸（允許小誤差）
+                platform_top = platform.y
+                player_bottom = state.y + height
+                if abs(player_bottom - platform_top) <= 3 and state.vel_y >= -0.5:
+                    ground_detected = True
+                    state.y = platform_top - height
+                    state.vel_y = 0
+                    break
+
+    # 只有確認不在地面時才設置為 False
+    state.on_ground = ground_detected
+
+
+def update_player(
+    state,
+    platforms,
+    death_zones=None,
+    level_num=None,
+    platform_grid=None,
+    death_zone_index=None,
+    rng=random,
+):
+    """推進一次物理更新，回傳 "death"、"fall_trap"、"infinite_mode" 或 None"""
+    # 處理重力
+    if not state.on_ground:
+        state.vel_y += GRAVITY
+        if state.vel_y > MAX_FALL_SPEED:
+            state.vel_y = MAX_FALL_SPEED
+
+    # 更新位置
+    start_x, start_y = state.x, state.y
+    state.x += state.vel_x
+    state.y += state.vel_y
+
+    # 檢查屏幕邊界並反彈
+    check_screen_boundaries(state)
+
+    # 特殊處理第11關的掉落機制
+    if level_num == 11 and state.y > 400:  # 當玩家在較高位置時
+        # 如果玩家墜落速度很快且在特定區域，有機率觸發直接掉落
+        if state.vel_y > 10:  # 高速墜落時
+            for min_x, max_x in FALL_TRAP_ZONES:
+                if min_x <= state.x + state.width / 2 <= max_x:
+                    if rng.random() < FALL_TRAP_CHANCE:
+                        # 直接掉到底部
+                        state.y = 500
+                        state.vel_y = 0
+                        reset_position(state)
+                        return "fall_trap"
+
+    # 本幀掃過範圍附近的平台
+    nearby_platforms = query_swept_platforms(
+        state, platforms, start_x, start_y, platform_grid
+    )
+
+    # 連續碰撞檢測：停在本幀最先撞到的平台上
+    # （在掉落陷阱之後，陷阱判斷的是撞擊前的墜落速度，與原本的順序相同）
+    if SWEPT_COLLISION:
+        sweep_platform_collision(state, nearby_platforms, start_x, start_y)
+
+    # 特殊處理第12關的無限模式：超過2000像素高度時回報，碰撞照常處理
+    result = None
+    if level_num == 12:
+        current_height = -state.y  # 轉換為正數高度
+        if current_height > 2000:
+            result = "infinite_mode"
+
+    # 檢查死亡區域（有索引時只檢查垂直範圍可能重疊的區域）
+    if death_zone_index is not None:
+        if death_zone_index.overlaps(state.x, state.y, state.width, state.height):
+            return "death"
+    elif death_zones:
+        for zone in death_zones:
+            if (
+                state.x < zone.right
+                and state.x + state.width > zone.x
+                and state.y < zone.bottom
+                and state.y + state.height > zone.y
+            ):
+                return "death"
+
+    # 檢查平台碰撞（連續碰撞只會把玩家停在掃過範圍內，附近平台列表仍然適用）
+    check_platform_collision(state, platforms, platform_grid, nearby_platforms)
+
+    # 減少水平速度（摩擦力）
+    if state.on_ground:
+        state.vel_x *= 0.8
+    else:
+        state.vel_x *= 0.95
+
+    return result
+
+
+def step(state, player_input, level, rng=random):
+    """
+    無畫面的單步模擬，順序與 Game 相同：
+    先處理按下/放開 SPACE，再更新蓄力，最後推進物理
+    """
+    if player_input.charge_start:
+        start_jump_charge(state)
+    if player_input.jump_direction:
+        execute_jump(state, player_input.jump_direction)
+    if player_input.charge_held:
+        update_jump_charge(state)
+
+    return update_player(
+        state,
+        level.platforms,
+        level.death_zones,
+        level.number,
+        level.platform_grid,
+        level.death_zone_index,
+        rng,
+    )
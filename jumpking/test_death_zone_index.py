@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+死亡區域索引測試
+確認使用排序索引的死亡判定與逐一檢查所有死亡區域完全相同
+"""
+
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from jumpking import LevelManager
+
+
+def overlaps_linear(death_zones, x, y, width, height):
+    """逐一檢查所有死亡區域"""
+    return any(
+        x < zone.right and x + width > zone.x and y < zone.bottom and y + height > zone.y
+        for zone in death_zones
+    )
+
+
+def test_death_zone_index_matches_linear_scan():
+    """隨機擺放玩家（包含貼齊區域邊緣的位置），比較索引與線性掃描的結果"""
+    print("=== 死亡區域索引測試 ===")
+
+    rng = random.Random(0)
+    level_manager = LevelManager()
+
+    for level_num in level_manager.levels:
+        level = level_manager.get_compiled_level(level_num)
+        death_zones = level.death_zones
+        if not death_zones:
+            continue
+        index = level.death_zone_index
+
+        min_y = min(zone.y for zone in death_zones) - 100
+        max_y = max(zone.bottom for zone in death_zones) + 100
+
+        hits = 0
+        for _ in range(2000):
+            x = rng.uniform(-50, 1220)
+            y = rng.uniform(min_y, max_y)
+            if rng.random() < 0.3:
+                # 剛好碰到或剛好沒碰到區域邊緣
+                zone = rng.choice(death_zones)
+                y = rng.choice([zone.y - 40, zone.bottom, zone.y - 39.5])
+            expected = overlaps_linear(death_zones, x, y, 30, 40)
+            assert index.overlaps(x, y, 30, 40) == expected, (level_num, x, y)
+            hits += expected
+
+        print(f"第{level_num}關: {len(death_zones)} 個死亡區域，{hits} 次碰到 ✅")
+
+
+if __name__ == "__main__":
+    test_death_zone_index_matches_linear_scan()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+全屏畫布測試
+確認全屏時每幀沿用同一個虛擬畫布並直接縮放進螢幕，不再配置新的 Surface，
+三種縮放方式的畫面位置與黑邊正確
+"""
+
+import sys
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pygame
+import jumpking
+from jumpking import Game, SCREEN_WIDTH, SCREEN_HEIGHT, MENU, PLAYING
+
+
+def enter_fullscreen(game, width, height):
+    """模擬 toggle_fullscreen 在指定解析度的螢幕上進入全屏"""
+    game.fullscreen = True
+    game.screen_width = width
+    game.screen_height = height
+    game.screen = pygame.display.set_mode((width, height))
+    game.ui_scale = min(width / SCREEN_WIDTH, height / SCREEN_HEIGHT)
+    game.build_fullscreen_canvas()
+
+
+def count_surfaces(draw):
+    """呼叫 draw，回傳期間建立的 Surface 數量"""
+    created = []
+    surface_class = pygame.Surface
+
+    class CountingSurface(surface_class):
+        def __init__(self, *args, **kwargs):
+            created.append(args)
+            super().__init__(*args, **kwargs)
+
+    pygame.Surface = CountingSurface
+    try:
+        draw()
+    finally:
+        pygame.Surface = surface_class
+    return len(created)
+
+
+def test_canvas_reused_every_frame():
+    print("=== 全屏畫布重複使用測試 ===")
+
+    game = Game()
+    enter_fullscreen(game, 1920, 1080)
+    canvas = game.virtual_screen
+    target = game.scaled_screen
+
+    for state in (MENU, PLAYING):
+        if state == PLAYING:
+            game.start_level(1)
+        game.state = state
+        assert count_surfaces(game.draw) == 0
+        assert game.virtual_screen is canvas and game.scaled_screen is target
+    print("選單與遊戲畫面每幀都不配置新的 Surface ✅")
+
+
+def test_scale_modes():
+    print("=== 全屏縮放方式測試 ===")
+
+    original_mode = jumpking.FULLSCREEN_SCALE_MODE
+    try:
+        for mode, screen_size, expected_scale in [
+            ("nearest", (1920, 1080), 1.2),
+            ("smooth", (1920, 1080), 1.2),
+            ("integer", (1920, 1080), 1),
+            ("integer", (2560, 1920), 2),
+            ("integer", (800, 600), 600 / SCREEN_HEIGHT),  # 螢幕比畫布小時仍然縮小
+        ]:
+            jumpking.FULLSCREEN_SCALE_MODE = mode
+            game = Game()
+            enter_fullscreen(game, *screen_size)
+            assert game.ui_scale == expected_scale, (mode, game.ui_scale)
+
+            target_rect = pygame.Rect(
+                game.scaled_screen.get_abs_offset(), game.scaled_screen.get_size()
+            )
+            assert target_rect.size == (
+                int(SCREEN_WIDTH * expected_scale),
+                int(SCREEN_HEIGHT * expected_scale),
+            )
+            assert target_rect.center in (
+                game.screen.get_rect().center,
+                (game.screen.get_rect().centerx - 1, game.screen.get_rect().centery),
+            )
+
+            # 畫布左上角與右下角的顏色出現在縮放區域的角落，四周是黑邊
+            game.screen.fill((255, 255, 255))
+            game.virtual_screen.fill((0, 0, 255))
+            game.virtual_screen.fill((255, 0, 0), (0, 0, 100, 100))
+            game.scale_and_blit_virtual_screen()
+            assert game.screen.get_at(target_rect.topleft)[:3] == (255, 0, 0)
+            assert game.screen.get_at(
+                (target_rect.right - 1, target_rect.bottom - 1)
+            )[:3] == (0, 0, 255)
+            for rect in game.letterbox_rects:
+                assert game.screen.get_at(rect.topleft)[:3] == (0, 0, 0)
+            print(f"{mode} {screen_size}: 縮放 {game.ui_scale:g} 倍，區域 {target_rect} ✅")
+    finally:
+        jumpking.FULLSCREEN_SCALE_MODE = original_mode
+
+
+if __name__ == "__main__":
+    test_canvas_reused_every_frame()
+    test_scale_modes()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+字形圖集測試
+確認逐字貼上的 HUD 文字與直接 font.render 的結果幾乎相同，
+暖身後數值怎麼變都不再光柵化任何字形，且每幀成本不隨數值變化增加
+"""
+
+import sys
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pygame
+from jumpking import Game, GlyphAtlas, PLAYING, WHITE, YELLOW
+
+BACKGROUND = (25, 25, 112)
+
+
+def ink_bounds(surface):
+    """與背景色不同的像素範圍"""
+    mask = pygame.mask.from_threshold(surface, BACKGROUND, (1, 1, 1, 255))
+    mask.invert()
+    return mask.get_bounding_rects()[0].unionall(mask.get_bounding_rects())
+
+
+def test_glyphs_match_font_render():
+    print("=== 字形圖集畫面比對 ===")
+    pygame.init()  # 其他測試結束時可能已經 pygame.quit()
+    pygame.display.set_mode((100, 100))
+    font = pygame.font.Font(None, 24)
+    atlas = GlyphAtlas()
+
+    for text in ["死亡次數: 17", "高度: 1234m", "蓄力: 12.5", "音效: 開啟 (70%)"]:
+        expected = pygame.Surface((300, 40))
+        expected.fill(BACKGROUND)
+        rendered = font.render(text, True, WHITE)
+        expected.blit(rendered, (5, 5))
+
+        actual = pygame.Surface((300, 40))
+        actual.fill(BACKGROUND)
+        rect = atlas.draw(actual, font, text, True, WHITE, (5, 5))
+
+        # 沒有字距微調，寬度最多差幾個像素
+        assert rect.topleft == (5, 5)
+        assert rect.height == font.get_height()
+        assert abs(rect.width - rendered.get_width()) <= 4, (text, rect.width)
+        expected_ink = ink_bounds(expected)
+        actual_ink = ink_bounds(actual)
+        assert actual_ink.y == expected_ink.y and actual_ink.h == expected_ink.h
+        assert abs(actual_ink.x - expected_ink.x) <= 1, text
+        assert abs(actual_ink.right - expected_ink.right) <= 4, text
+    print("逐字貼上的文字位置與寬度與 font.render 相符 ✅")
+
+    # 不同顏色分開快取，相同字元只光柵化一次
+    misses = atlas.misses
+    atlas.draw(actual, font, "1234", True, WHITE, (0, 0))
+    assert atlas.misses == misses
+    atlas.draw(actual, font, "1234", True, YELLOW, (0, 0))
+    assert atlas.misses == misses + 4
+    print("相同字體與顏色的字元只光柵化一次 ✅")
+
+
+def test_changing_numbers_not_rasterized():
+    print("=== HUD 數值變化測試 ===")
+    pygame.init()
+    game = Game()
+    game.start_level(1)
+    game.state = PLAYING
+    player = game.player
+
+    # 暖身：畫過每個數字與小數點
+    player.jump_charging = True
+    for value in range(10):
+        player.death_count = value
+        player.jump_power = value + 0.5
+        player.y = -value * 11 * 10
+        game.draw()
+    glyph_misses = game.glyph_atlas.misses
+    text_misses = game.text_cache.stats()[1]
+
+    frames = 300
+    start_time = time.perf_counter()
+    for frame in range(frames):
+        player.death_count = frame
+        player.jump_power = frame / 7
+        player.y = -frame * 37
+        game.draw()
+    elapsed = (time.perf_counter() - start_time) / frames * 1000
+
+    assert game.glyph_atlas.misses == glyph_misses
+    assert game.text_cache.stats()[1] == text_misses
+    print(f"{frames} 幀數值都不同，沒有任何文字重新光柵化（{elapsed:.2f} ms/幀）✅")
+
+
+if __name__ == "__main__":
+    test_glyphs_match_font_render()
+    test_changing_numbers_not_rasterized()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+無限之塔串流測試
+確認第12關的分段隨畫面生成與移除，同時存在的平台數量不隨高度增加，
+以及分段只由（世界種子, 段數）決定，平行烘焙與逐段生成的結果相同
+"""
+
+import sys
+import os
+import json
+import random
+import tempfile
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import physics
+import tower
+from jumpking import LevelManager, Player, SCREEN_HEIGHT
+
+
+def test_tower_streams_segments():
+    """一路往上爬再回到起點，分段數量維持固定且同一段每次生成都相同"""
+    print("=== 無限之塔串流測試 ===")
+
+    level_manager = LevelManager()
+    tower = level_manager.get_compiled_level(12)
+    tower.update_window(0, SCREEN_HEIGHT)
+    first_window = tower.platforms
+
+    max_platforms = 0
+    for camera_y in range(0, -50000, -50):
+        tower.update_window(camera_y, camera_y + SCREEN_HEIGHT)
+        max_platforms = max(max_platforms, len(tower.platforms))
+        assert len(tower.segments) == tower.segment_range[1] - tower.segment_range[0] + 1
+        # 畫面中的每一段都已生成
+        assert tower.bounds.y <= camera_y
+
+    print(f"爬到 50000 像素高: 最多同時 {max_platforms} 個平台 ✅")
+    assert max_platforms < 90
+
+    tower.update_window(0, SCREEN_HEIGHT)
+    assert tower.platforms == first_window
+    print("回到起點後分段與第一次生成的相同 ✅")
+
+
+def test_collision_above_infinite_height():
+    """超過無限模式高度後仍然可以站在平台上"""
+    print("=== 無限模式碰撞測試 ===")
+
+    level_manager = LevelManager()
+    tower = level_manager.get_compiled_level(12)
+    tower.update_window(-5000, -5000 + SCREEN_HEIGHT)
+
+    platform = min(
+        (p for p in tower.platforms if -5000 < p.y < -4200), key=lambda p: p.y
+    )
+    player = Player(platform.x + platform.width / 2 - 15, platform.y - 100)
+    player.on_ground = False
+
+    results = set()
+    for _ in range(60):
+        results.add(
+            player.update(
+                tower.platforms,
+                tower.death_zones,
+                12,
+                tower.platform_grid,
+                tower.death_zone_index,
+            )
+        )
+        if player.on_ground:
+            break
+
+    print(f"玩家位置: ({player.x:.1f}, {player.y:.1f}) 在地面: {player.on_ground}")
+    assert "infinite_mode" in results
+    assert player.on_ground
+    # 落在途中的某個平台頂部
+    assert any(player.y + player.height == p.y for p in tower.platforms)
+
+
+def test_segments_are_seed_addressable():
+    """任意順序生成的分段都相同，且不會改變全域亂數狀態"""
+    print("=== 分段種子定址測試 ===")
+
+    random.seed(42)
+    state = random.getstate()
+
+    forward = [tower.generate_segment(7, n) for n in range(1, 200)]
+    backward = [tower.generate_segment(7, n) for n in range(199, 0, -1)]
+    assert forward == backward[::-1]
+    assert random.getstate() == state
+    print("倒序生成與順序生成相同，全域亂數未被改動 ✅")
+
+    assert tower.generate_segment(7, 5) != tower.generate_segment(8, 5)
+    level_manager = LevelManager(tower_seed=7, tower_file=None)
+    assert level_manager.generate_tower_segment(5) == forward[4]
+
+
+def test_bake_matches_serial_generation():
+    """用行程池烘焙的塔檔案，讀回後與逐段生成完全相同"""
+    print("=== 塔烘焙測試 ===")
+
+    baked = tower.bake_tower(3, 600, workers=2)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "tower.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(baked.to_dict(), f)
+
+        level_manager = LevelManager(tower_file=path)
+        # 塔檔案在第一次生成分段時才讀取
+        first_segment = level_manager.generate_tower_segment(1)
+
+    assert level_manager.tower_seed == 3
+    assert first_segment == tower.generate_segment(3, 1)
+    for segment_num in range(2, 610):
+        assert level_manager.generate_tower_segment(segment_num) == (
+            tower.generate_segment(3, segment_num)
+        ), segment_num
+    print(f"烘焙 600 段並讀回，與逐段生成一致 ✅ {tower.tower_stats(baked)}")
+
+
+if __name__ == "__main__":
+    test_tower_streams_segments()
+    test_collision_above_infinite_height()
+    test_segments_are_seed_addressable()
+    test_bake_matches_serial_generation()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+蓄力計時測試
+確認跳躍力量只取決於按住 SPACE 的時間：不同幀率、卡頓都得到相同的跳躍
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import physics
+from jumpking import Player
+
+
+def charge_and_jump(hold_seconds, frame_times):
+    """
+    以指定的每幀時間模擬按住 SPACE，放開時跳躍
+    回傳跳起時的 (vel_x, vel_y)
+    """
+    player = Player(100, 100)
+    now = 1000.0
+    player.start_jump_charge(now)
+
+    release_time = now + hold_seconds
+    for frame_time in frame_times:
+        if now + frame_time >= release_time:
+            break
+        now += frame_time
+        player.update_jump_charge(now)
+
+    player.execute_jump("right", release_time)
+    return player.vel_x, player.vel_y
+
+
+def test_charge_is_frame_rate_independent():
+    """30、60、144 FPS 以及中途卡頓時，相同按住時間得到相同的跳躍"""
+    print("=== 蓄力與幀率無關測試 ===")
+
+    # 包含一般蓄力、剛好蓄滿、暫停中、暫停後重新充能
+    for hold_seconds in (0.1, 0.5, 50 / physics.FPS, 1.0, 1.5):
+        results = []
+        for fps in (30, 60, 144):
+            results.append(charge_and_jump(hold_seconds, [1 / fps] * 1000))
+        hitch = [1 / 60] * 5 + [0.3] + [1 / 60] * 1000
+        results.append(charge_and_jump(hold_seconds, hitch))
+
+        print(f"按住 {hold_seconds:.3f} 秒: 速度 {results[0]}")
+        assert all(result == results[0] for result in results), results
+
+
+def test_charge_matches_fixed_step():
+    """按住整數個物理更新的時間，與固定步長逐次蓄力的結果相同（包含暫停循環）"""
+    print("=== 蓄力時間與固定步長一致性測試 ===")
+
+    for ticks in range(0, 200):
+        fixed = physics.PlayerState(100, 100)
+        physics.start_jump_charge(fixed)
+        for _ in range(ticks):
+            physics.update_jump_charge(fixed)
+
+        timed = physics.PlayerState(100, 100)
+        physics.start_jump_charge(timed)
+        physics.charge_for_duration(timed, ticks / physics.FPS)
+
+        assert abs(fixed.jump_power - timed.jump_power) < 1e-9, ticks
+        assert fixed.jump_power_paused == timed.jump_power_paused, ticks
+
+    print("0～199 次更新的蓄力結果一致 ✅")
+
+
+if __name__ == "__main__":
+    test_charge_is_frame_rate_independent()
+    test_charge_matches_fixed_step()
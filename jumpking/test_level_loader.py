@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+關卡檔案快取測試
+確認第二次讀取不再解析檔案、只被 touch 的檔案不重新解析、
+修改過的關卡會重新解析，以及快取損毀時仍能正確讀取；
+LevelManager 第一次使用時才讀取關卡，背景預先建立的關卡不會重複建立，
+熱重載只重建修改過的關卡
+"""
+
+import sys
+import os
+import shutil
+import time
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import level_loader
+from jumpking import LevelManager
+
+
+def load_counting_parses(levels_dir):
+    """讀取關卡並回傳 (關卡, 解析的檔案數量)"""
+    parse_level = level_loader.parse_level
+    parsed = []
+
+    def counting_parse(raw):
+        parsed.append(raw)
+        return parse_level(raw)
+
+    level_loader.parse_level = counting_parse
+    try:
+        return level_loader.load_levels(levels_dir), len(parsed)
+    finally:
+        level_loader.parse_level = parse_level
+
+
+def test_level_cache():
+    print("=== 關卡檔案快取測試 ===")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        levels_dir = os.path.join(tmp_dir, "levels")
+        shutil.copytree(
+            level_loader.LEVELS_DIR,
+            levels_dir,
+            ignore=shutil.ignore_patterns(level_loader.LEVEL_CACHE_NAME),
+        )
+        level_count = len(level_loader.level_files(levels_dir))
+
+        cold, parsed = load_counting_parses(levels_dir)
+        assert parsed == level_count
+        assert all(isinstance(level["start_pos"], tuple) for level in cold.values())
+        assert all("note" not in p for level in cold.values() for p in level["platforms"])
+
+        warm, parsed = load_counting_parses(levels_dir)
+        assert parsed == 0 and warm == cold
+        print(f"冷啟動解析 {level_count} 個關卡，熱啟動解析 0 個 ✅")
+
+        # 只改修改時間，內容雜湊相同
+        level_path = os.path.join(levels_dir, "level_01.json")
+        stat = os.stat(level_path)
+        os.utime(level_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        touched, parsed = load_counting_parses(levels_dir)
+        assert parsed == 0 and touched == cold
+        print("只被 touch 的關卡不重新解析 ✅")
+
+        # 修改內容
+        with open(level_path, "r", encoding="utf-8") as f:
+            text = f.read()
+        with open(level_path, "w", encoding="utf-8") as f:
+            f.write(text.replace('"target_deaths": 5', '"target_deaths": 6'))
+        edited, parsed = load_counting_parses(levels_dir)
+        assert parsed == 1
+        assert edited[1]["target_deaths"] == 6
+        assert all(edited[n] == cold[n] for n in cold if n != 1)
+        print("修改過的關卡重新解析 ✅")
+
+        # 快取損毀
+        cache_file = os.path.join(levels_dir, level_loader.LEVEL_CACHE_NAME)
+        with open(cache_file, "wb") as f:
+            f.write(b"not a pickle")
+        recovered, parsed = load_counting_parses(levels_dir)
+        assert parsed == level_count and recovered == edited
+        print("快取損毀時重新解析 ✅")
+
+
+def test_lazy_levels_and_preload():
+    print("=== 關卡延遲讀取與預先建立測試 ===")
+
+    level_manager = LevelManager(tower_file=None)
+    assert level_manager._levels is None
+    assert level_manager.get_level(1)["name"]
+    assert level_manager.compiled_levels == {}
+    print("建立 LevelManager 時不讀取關卡，也不編譯任何關卡 ✅")
+
+    level_manager.preload_level(12)
+    # 預先建立中同時進入關卡，得到同一個關卡
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(level_manager.get_compiled_level(12))
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(level is results[0] for level in results)
+    assert level_manager.get_compiled_level(12) is results[0]
+    assert list(level_manager.compiled_levels) == [12]
+
+    # 已建立或不存在的關卡不再啟動背景執行緒
+    level_manager.preload_level(12)
+    level_manager.preload_level(99)
+    print("背景預先建立的關卡與進入關卡時取得的是同一個 ✅")
+
+
+def test_hot_reload_rebuilds_only_changed_level():
+    print("=== 關卡熱重載測試 ===")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        levels_dir = os.path.join(tmp_dir, "levels")
+        shutil.copytree(level_loader.LEVELS_DIR, levels_dir)
+
+        level_manager = LevelManager(tower_file=None, levels_dir=levels_dir)
+        level_1 = level_manager.get_compiled_level(1)
+        level_3 = level_manager.get_compiled_level(3)
+        assert level_manager.reload_changed_levels() == []
+
+        # 只被 touch 的檔案不算修改
+        level_path = os.path.join(levels_dir, "level_03.json")
+        stat = os.stat(level_path)
+        os.utime(level_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert level_manager.reload_changed_levels() == []
+        assert level_manager.get_compiled_level(3) is level_3
+
+        # 編輯到一半的檔案保留原本的關卡
+        with open(level_path, "r", encoding="utf-8") as f:
+            text = f.read()
+        with open(level_path, "w", encoding="utf-8") as f:
+            f.write(text[: len(text) // 2])
+        assert level_manager.reload_changed_levels() == []
+        assert level_manager.get_compiled_level(3) is level_3
+
+        # 移動第一個平台
+        first_platform = level_3.platforms[0]
+        with open(level_path, "w", encoding="utf-8") as f:
+            f.write(text.replace('"x": 0,', '"x": 5,', 1))
+        start_time = time.perf_counter()
+        changed = level_manager.reload_changed_levels()
+        reloaded = level_manager.get_compiled_level(3)
+        elapsed = (time.perf_counter() - start_time) * 1000
+
+        assert changed == [3]
+        assert reloaded is not level_3
+        assert reloaded.platforms[0].x == first_platform.x + 5
+        assert reloaded.platform_grid.platforms == reloaded.platforms
+        assert level_manager.get_compiled_level(1) is level_1
+        print(f"只重建修改過的第3關（{elapsed:.1f} ms）✅")
+
+
+if __name__ == "__main__":
+    test_level_cache()
+    test_lazy_levels_and_preload()
+    test_hot_reload_rebuilds_only_changed_level()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+關卡包測試
+確認 mmap 關卡包以二分搜尋查到的畫面範圍矩形，與掃描全部矩形的結果相同，
+並且 LevelManager 會以關卡包取代同編號的關卡，熱重載時只重新開啟有修改的關卡包
+"""
+
+import sys
+import os
+import random
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import level_loader
+import tower
+from level_pack import LevelPack, PackedLevel, write_level_pack
+from physics import compile_rect
+from jumpking import LevelManager, SCREEN_HEIGHT
+
+
+def rects_in_linear(rects, top, bottom):
+    """逐一檢查所有矩形"""
+    return sorted(rect for rect in rects if rect.y <= bottom and rect.bottom >= top)
+
+
+def build_tall_tower(segment_count):
+    """第12關加上 segment_count 段塔，回傳 (關卡資料, 關卡本身的目標平台)"""
+    level_data = level_loader.load_levels()[12]
+    goal_platforms = [p for p in level_data["platforms"] if p["y"] <= level_data["goal_y"]]
+    level_data = dict(
+        level_data,
+        platforms=list(level_data["platforms"]),
+        death_zones=list(level_data["death_zones"]),
+    )
+    for platforms, death_zones in tower.generate_segments(0, 1, segment_count):
+        level_data["platforms"].extend(platforms)
+        level_data["death_zones"].extend(death_zones)
+    return level_data, goal_platforms
+
+
+def test_pack_queries_match_linear_scan():
+    print("=== 關卡包查詢測試 ===")
+
+    level_data, goal_platforms = build_tall_tower(3000)
+    platforms = [compile_rect(p) for p in level_data["platforms"]]
+    death_zones = [compile_rect(z) for z in level_data["death_zones"]]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "level_12.jkpack")
+        write_level_pack(path, level_data, goal_platforms)
+        level_pack = LevelPack(path)
+
+        rng = random.Random(0)
+        for _ in range(300):
+            top = rng.randint(-610000, 800)
+            bottom = top + rng.choice([0, 1, SCREEN_HEIGHT, 5000])
+            assert sorted(level_pack.platforms_in(top, bottom)) == rects_in_linear(
+                platforms, top, bottom
+            ), (top, bottom)
+            assert sorted(level_pack.death_zones_in(top, bottom)) == rects_in_linear(
+                death_zones, top, bottom
+            ), (top, bottom)
+
+        assert level_pack.level_data()["start_pos"] == level_data["start_pos"]
+        print(f"{len(platforms)} 個平台中 300 次隨機查詢與線性掃描一致 ✅")
+        level_pack.close()
+
+
+def test_level_manager_opens_pack():
+    print("=== LevelManager 關卡包測試 ===")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        levels_dir = os.path.join(tmp_dir, "levels")
+        shutil.copytree(
+            level_loader.LEVELS_DIR,
+            levels_dir,
+            ignore=shutil.ignore_patterns(level_loader.LEVEL_CACHE_NAME),
+        )
+        level_data, goal_platforms = build_tall_tower(500)
+        write_level_pack(
+            os.path.join(levels_dir, "level_12.jkpack"), level_data, goal_platforms
+        )
+
+        level_manager = LevelManager(tower_file=None, levels_dir=levels_dir)
+        assert "platforms" not in level_manager.get_level(12)
+        assert level_manager.get_level(12)["name"] == level_data["name"]
+
+        level = level_manager.get_compiled_level(12)
+        assert isinstance(level, PackedLevel)
+        platforms = [compile_rect(p) for p in level_data["platforms"]]
+
+        max_platforms = 0
+        for camera_y in range(0, -100000, -100):
+            level.update_window(camera_y, camera_y + SCREEN_HEIGHT)
+            max_platforms = max(max_platforms, len(level.platforms))
+            # 畫面內的平台都已載入
+            visible = rects_in_linear(platforms, camera_y, camera_y + SCREEN_HEIGHT)
+            assert set(visible) <= set(level.platforms), camera_y
+
+        print(f"爬到 100000 像素高: 最多同時 {max_platforms} 個平台 ✅")
+        assert max_platforms < 90
+        # 塔的分段平台不算目標
+        assert level.goal_platforms == tuple(compile_rect(p) for p in goal_platforms)
+        level.pack.close()
+
+
+def test_hot_reload_reopens_only_changed_packs():
+    print("=== 關卡包熱重載測試 ===")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        levels_dir = os.path.join(tmp_dir, "levels")
+        shutil.copytree(
+            level_loader.LEVELS_DIR,
+            levels_dir,
+            ignore=shutil.ignore_patterns(level_loader.LEVEL_CACHE_NAME),
+        )
+        level_data, goal_platforms = build_tall_tower(50)
+        for level_num in (11, 12):
+            write_level_pack(
+                os.path.join(levels_dir, f"level_{level_num}.jkpack"),
+                level_data,
+                goal_platforms,
+            )
+
+        level_manager = LevelManager(tower_file=None, levels_dir=levels_dir)
+        level_manager.levels
+        pack_11 = level_manager.level_packs[11]
+        pack_12 = level_manager.level_packs[12]
+
+        # 修改其他關卡時，關卡包沿用原本的 mmap
+        level_path = os.path.join(levels_dir, "level_01.json")
+        stat = os.stat(level_path)
+        os.utime(level_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert level_manager.reload_changed_levels() == []
+        assert level_manager.level_packs[11] is pack_11
+        assert level_manager.level_packs[12] is pack_12
+        assert not pack_11.buffer.closed and not pack_12.buffer.closed
+        print("沒有修改的關卡包不重新開啟 ✅")
+
+        # 重新建置第12關的關卡包：只重新開啟它，並關閉舊的 mmap
+        level_manager.get_compiled_level(11)
+        level_manager.get_compiled_level(12)
+        level_data["name"] = "重新建置"
+        pack_path = os.path.join(levels_dir, "level_12.jkpack")
+        stat = os.stat(pack_path)
+        write_level_pack(pack_path, level_data, goal_platforms)
+        os.utime(pack_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert level_manager.reload_changed_levels() == [12]
+        assert level_manager.level_packs[11] is pack_11
+        assert level_manager.level_packs[12] is not pack_12
+        assert pack_12.buffer.closed and not pack_11.buffer.closed
+        assert 11 in level_manager.compiled_levels
+        assert level_manager.get_level(12)["name"] == "重新建置"
+        print("只重新開啟修改過的關卡包，舊的 mmap 已關閉 ✅")
+
+        for level_pack in level_manager.level_packs.values():
+            level_pack.close()
+
+
+if __name__ == "__main__":
+    test_pack_queries_match_linear_scan()
+    test_level_manager_opens_pack()
+    test_hot_reload_reopens_only_changed_packs()
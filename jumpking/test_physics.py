@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+物理核心測試
+確認不依賴 pygame 的 step() 與遊戲中的 Player 逐幀結果完全相同，
+且與拆出物理核心之前（baseline 版本）的 Player 物理逐位元相同
+"""
+
+import sys
+import os
+import math
+import random
+import subprocess
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pygame
+import physics
+from jumpking import LevelManager, Player
+
+
+class BaselinePlayer:
+    """
+    baseline 版本（a23452b）jumpking.py 中 Player 的物理，原封不動複製保存
+    用來確認 physics.py 沒有偏離原本的手感，不要修改這個類別
+    """
+
+    width = 30
+    height = 40
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.vel_x = 0
+        self.vel_y = 0
+        self.on_ground = True
+        self.jump_charging = False
+        self.jump_power = 0
+        self.facing_right = True
+        self.start_x = x
+        self.start_y = y
+        self.death_count = 0
+
+    def reset_position(self):
+        """重置玩家位置到關卡起點"""
+        self.x = self.start_x
+        self.y = self.start_y
+        self.vel_x = 0
+        self.vel_y = 0
+        self.on_ground = True  # 確保重置後在地面上
+        self.jump_charging = False
+        self.jump_power = 0
+        self.death_count += 1
+
+    def update(self, platforms, death_zones=None, level_num=None):
+        # 處理重力
+        if not self.on_ground:
+            self.vel_y += 0.5
+            if self.vel_y > 15:
+                self.vel_y = 15
+
+        # 更新位置
+        self.x += self.vel_x
+        self.y += self.vel_y
+
+        # 檢查屏幕邊界並反彈
+        self.check_screen_boundaries()
+
+        # 特殊處理第11關的掉落機制
+        if level_num == 11 and self.y > 400:  # 當玩家在較高位置時
+            # 如果玩家墜落速度很快且在特定區域，有機率觸發直接掉落
+            if self.vel_y > 10:  # 高速墜落時
+                # 在特定x座標範圍內，有15%機率直接掉到底部
+                danger_zones = [
+                    (90, 160),  # 第一個危險區域
+                    (240, 310),  # 第二個危險區域
+                    (490, 560),  # 第三個危險區域
+                    (740, 810),  # 第四個危險區域
+                ]
+
+                for min_x, max_x in danger_zones:
+                    if min_x <= self.x + self.width / 2 <= max_x:
+                        if random.random() < 0.15:  # 15%機率
+                            # 直接掉到底部
+                            self.y = 500
+                            self.vel_y = 0
+                            self.reset_position()
+                            return "fall_trap"
+
+        # 檢查死亡區域
+        if death_zones:
+            for zone in death_zones:
+                if (
+                    self.x < zone["x"] + zone["width"]
+                    and self.x + self.width > zone["x"]
+                    and self.y < zone["y"] + zone["height"]
+                    and self.y + self.height > zone["y"]
+                ):
+                    return "death"
+
+        # 檢查平台碰撞
+        self.check_platform_collision(platforms)
+
+        # 減少水平速度（摩擦力）
+        if self.on_ground:
+            self.vel_x *= 0.8
+        else:
+            self.vel_x *= 0.95
+
+        return None
+
+    def check_screen_boundaries(self):
+        """檢查屏幕邊界並處理反彈"""
+        wall_width = 10
+
+        # 左邊界（考慮牆壁寬度）
+        if self.x <= wall_width:
+            self.x = wall_width
+            if self.vel_x < 0:  # 只有當玩家向左移動時才反彈
+                self.vel_x = -self.vel_x * 0.7  # 反彈，保持較多速度
+
+        # 右邊界（考慮牆壁寬度）
+        if self.x + self.width >= 1200 - wall_width:
+            self.x = 1200 - wall_width - self.width
+            if self.vel_x > 0:  # 只有當玩家向右移動時才反彈
+                self.vel_x = -self.vel_x * 0.7  # 反彈，保持較多速度
+
+    def check_platform_collision(self, platforms):
+        player_rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        ground_detected = False  # 先用標記而不是直接設置
+
+        for platform in platforms:
+            platform_rect = pygame.Rect(
+                platform["x"], platform["y"], platform["width"], platform["height"]
+            )
+
+            if player_rect.colliderect(platform_rect):
+                # 改善碰撞檢測 - 更精確的判斷
+                overlap_left = (self.x + self.width) - platform["x"]
+                overlap_right = (platform["x"] + platform["width"]) - self.x
+                overlap_top = (self.y + self.height) - platform["y"]
+                overlap_bottom = (platform["y"] + platform["height"]) - self.y
+
+                # 找出最小重疊方向
+                min_overlap = min(
+                    overlap_left, overlap_right, overlap_top, overlap_bottom
+                )
+
+                if min_overlap == overlap_top and self.vel_y >= 0:
+                    # 從上方落下
+                    self.y = platform["y"] - self.height
+                    self.vel_y = 0
+                    ground_detected = True
+                elif min_overlap == overlap_bottom and self.vel_y <= 0:
+                    # 從下方撞擊
+                    self.y = platform["y"] + platform["height"]
+                    self.vel_y = 0
+                elif min_overlap == overlap_left and self.vel_x >= 0:
+                    # 從左側撞擊平台 - 反彈
+                    self.x = platform["x"] - self.width
+                    self.vel_x = -self.vel_x * 0.6  # 反彈，保持更多速度
+                elif min_overlap == overlap_right and self.vel_x <= 0:
+                    # 從右側撞擊平台 - 反彈
+                    self.x = platform["x"] + platform["width"]
+                    self.vel_x = -self.vel_x * 0.6  # 反彈，保持更多速度
+
+        # 詳細地面檢測 - 檢查玩家底部是否接觸任何平台
+        if not ground_detected:
+            for platform in platforms:
+                # 檢查水平重疊
+                if (
+                    self.x < platform["x"] + platform["width"]
+                    and self.x + self.width > platform["x"]
+                ):
+                    # 檢查垂直接觸（允許小誤差）
+                    platform_top = platform["y"]
+                    player_bottom = self.y + self.height
+                    if abs(player_bottom - platform_top) <= 3 and self.vel_y >= -0.5:
+                        ground_detected = True
+                        self.y = platform_top - self.height
+                        self.vel_y = 0
+                        break
+
+        # 只有確認不在地面時才設置為 False
+        self.on_ground = ground_detected
+
+    def execute_jump(self, direction):
+        # 只有在地面上且蓄力時才能跳躍
+        if self.jump_charging and self.on_ground:
+            # 計算跳躍向量
+            angle = 0
+            if direction == "left":
+                angle = 120  # 左上 (調整角度)
+                self.facing_right = False
+            elif direction == "right":
+                angle = 60  # 右上 (調整角度)
+                self.facing_right = True
+            else:  # 直接向上
+                angle = 90
+
+            # 轉換為弧度
+            angle_rad = math.radians(angle)
+
+            # 應用跳躍力 (增強跳躍力)
+            jump_force = self.jump_power * 1.2  # 增加跳躍力
+            self.vel_x = math.cos(angle_rad) * jump_force
+            self.vel_y = math.sin(angle_rad) * -jump_force
+
+            # 重置跳躍狀態
+            self.jump_charging = False
+            self.jump_power = 0
+            self.on_ground = False
+        elif self.jump_charging:
+            # 即使無法跳躍也要重置蓄力狀態
+            self.jump_charging = False
+            self.jump_power = 0
+
+
+def test_physics_imports_without_pygame():
+    """物理核心可以在沒有 pygame 的環境載入"""
+    print("=== 物理核心獨立載入測試 ===")
+
+    code = (
+        "import sys; import physics; "
+        "assert 'pygame' not in sys.modules, '物理核心不應載入 pygame'"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code], cwd=os.path.dirname(__file__), check=True
+    )
+    print("物理核心未載入 pygame ✅")
+
+
+def test_step_matches_player():
+    """
+    用相同的隨機按鍵操作同時推進 Player 與 PlayerState，每幀比較狀態
+    （確認 Player 的包裝與按鍵處理順序；物理本身與 baseline 的比較見下一個測試）
+    """
+    print("=== 物理核心一致性測試 ===")
+
+    level_manager = LevelManager()
+
+    for level_num, level_data in level_manager.levels.items():
+        level = level_manager.get_compiled_level(level_num)
+        start_x, start_y = level_data["start_pos"]
+        player = Player(start_x, start_y)
+        state = physics.PlayerState(start_x, start_y)
+
+        input_rng = random.Random(level_num)
+        player_rng = random.Random(1000 + level_num)
+        state_rng = random.Random(1000 + level_num)
+        hold_frames = 0
+
+        for frame in range(1500):
+            player_input = physics.PlayerInput()
+            if hold_frames == 0 and player.on_ground and input_rng.random() < 0.2:
+                player_input.charge_start = True
+                hold_frames = input_rng.randint(1, 60)
+            elif hold_frames > 0:
+                hold_frames -= 1
+                if hold_frames == 0:
+                    player_input.jump_direction = input_rng.choice(
+                        ["left", "right", "up"]
+                    )
+            player_input.charge_held = hold_frames > 0
+
+            # 與 Game 相同的順序操作 Player
+            if player_input.charge_start:
+                player.start_jump_charge()
+            if player_input.jump_direction:
+                player.execute_jump(player_input.jump_direction)
+            if player_input.charge_held:
+                player.update_jump_charge()
+            random.seed(player_rng.random())
+            player_result = player.update(
+                level.platforms, level.death_zones, level_num, level.platform_grid
+            )
+
+            state_result = physics.step(
+                state, player_input, level, random.Random(state_rng.random())
+            )
+
+            assert player_result == state_result, (level_num, frame)
+            for name in physics.PlayerState.__slots__:
+                assert getattr(player, name) == getattr(state, name), (
+                    level_num,
+                    frame,
+                    name,
+                )
+
+            if player_result == "death":
+                player.reset_position()
+                physics.reset_position(state)
+            if player_result == "infinite_mode":
+                break
+
+        print(f"第{level_num}關: 逐幀結果一致 ✅")
+
+
+def test_step_matches_baseline_player():
+    """
+    用相同的隨機跳躍同時推進 baseline 的 Player 與 physics.step，每幀比較狀態
+    蓄力方式（user-010）與連續碰撞（user-002）是刻意的改變，
+    所以直接指定跳躍力量並關閉連續碰撞；第12關的塔改成串流生成，不在比較範圍內
+    """
+    print("=== 物理核心與 baseline 一致性測試 ===")
+
+    level_manager = LevelManager(tower_file=None)
+    original_swept_collision = physics.SWEPT_COLLISION
+    physics.SWEPT_COLLISION = False
+    try:
+        for level_num in range(1, 12):
+            level_data = level_manager.get_level(level_num)
+            level = level_manager.get_compiled_level(level_num)
+            start_x, start_y = level_data["start_pos"]
+            baseline = BaselinePlayer(start_x, start_y)
+            state = physics.PlayerState(start_x, start_y)
+
+            input_rng = random.Random(level_num)
+            trap_rng = random.Random(2000 + level_num)
+            jumps = 0
+            for frame in range(3000):
+                player_input = physics.PlayerInput()
+                if baseline.on_ground and input_rng.random() < 0.1:
+                    jump_power = input_rng.uniform(
+                        physics.MIN_JUMP_POWER, physics.MAX_JUMP_POWER
+                    )
+                    direction = input_rng.choice(["left", "right", "up"])
+                    baseline.jump_charging = state.jump_charging = True
+                    baseline.jump_power = state.jump_power = jump_power
+                    baseline.execute_jump(direction)
+                    player_input.jump_direction = direction
+                    jumps += 1
+
+                # baseline 使用全域 random 擲掉落陷阱的骰子
+                trap_seed = trap_rng.random()
+                random.seed(trap_seed)
+                baseline_result = baseline.update(
+                    level_data["platforms"], level_data["death_zones"], level_num
+                )
+                state_result = physics.step(
+                    state, player_input, level, random.Random(trap_seed)
+                )
+
+                assert baseline_result == state_result, (level_num, frame)
+                for name in (
+                    "x",
+                    "y",
+                    "vel_x",
+                    "vel_y",
+                    "on_ground",
+                    "jump_charging",
+                    "jump_power",
+                    "facing_right",
+                    "death_count",
+                ):
+                    assert getattr(baseline, name) == getattr(state, name), (
+                        level_num,
+                        frame,
+                        name,
+                        getattr(baseline, name),
+                        getattr(state, name),
+                    )
+
+                if baseline_result == "death":
+                    baseline.reset_position()
+                    physics.reset_position(state)
+
+            print(f"第{level_num}關: {jumps} 次跳躍，逐幀與 baseline 相同 ✅")
+    finally:
+        physics.SWEPT_COLLISION = original_swept_collision
+
+
+if __name__ == "__main__":
+    test_physics_imports_without_pygame()
+    test_step_matches_player()
+    test_step_matches_baseline_player()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+平台空間網格測試
+確認使用網格的碰撞結果與逐一檢查所有平台完全相同
+"""
+
+import sys
+import os
+import copy
+import random
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from jumpking import LevelManager, Player
+
+
+def test_platform_grid_matches_linear_scan():
+    """隨機擺放玩家，比較網格與線性掃描的碰撞結果"""
+    print("=== 平台空間網格測試 ===")
+
+    rng = random.Random(0)
+    level_manager = LevelManager()
+
+    for level_num in level_manager.levels:
+        level = level_manager.get_compiled_level(level_num)
+        platforms = level.platforms
+        grid = level.platform_grid
+
+        min_y = min(platform.y for platform in platforms) - 100
+        max_y = max(platform.y for platform in platforms) + 100
+
+        for _ in range(500):
+            player = Player(rng.uniform(0, 1170), rng.uniform(min_y, max_y))
+            player.vel_x = rng.uniform(-10, 10)
+            player.vel_y = rng.uniform(-15, 15)
+            grid_player = copy.copy(player)
+
+            player.check_platform_collision(platforms)
+            grid_player.check_platform_collision(platforms, grid)
+
+            assert (player.x, player.y, player.vel_x, player.vel_y) == (
+                grid_player.x,
+                grid_player.y,
+                grid_player.vel_x,
+                grid_player.vel_y,
+            )
+            assert player.on_ground == grid_player.on_ground
+
+        print(f"第{level_num}關: {len(platforms)} 個平台，結果一致 ✅")
+
+
+if __name__ == "__main__":
+    test_platform_grid_matches_linear_scan()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+繪製用矩形索引測試
+確認二分搜尋取出的平台與死亡區域和逐一篩選畫面範圍的結果（含順序）完全相同，
+且很高的關卡每幀取出的物件數量與第1關相當
+"""
+
+import sys
+import os
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from physics import CompiledLevel, RectRangeIndex, compile_rect
+from jumpking import LevelManager, SCREEN_HEIGHT
+
+
+def visible_linear(rects, top, bottom):
+    """逐一篩選與 y 範圍重疊的矩形"""
+    return [rect for rect in rects if rect.bottom > top and rect.y < bottom]
+
+
+def test_query_matches_linear_scan():
+    print("=== 繪製用矩形索引測試 ===")
+
+    rng = random.Random(0)
+    level_manager = LevelManager(tower_file=None)
+    for level_num in range(1, 12):
+        level = level_manager.get_compiled_level(level_num)
+        bounds = level.bounds
+        for _ in range(500):
+            top = rng.uniform(bounds.y - SCREEN_HEIGHT, bounds.bottom)
+            if rng.random() < 0.3:
+                # 畫面邊緣剛好貼齊矩形邊緣
+                rect = rng.choice(level.platforms + level.death_zones)
+                top = rng.choice([rect.bottom, rect.y - SCREEN_HEIGHT, rect.y])
+            bottom = top + SCREEN_HEIGHT
+            assert level.platform_view_index.query(top, bottom) == visible_linear(
+                level.platforms, top, bottom
+            ), (level_num, top)
+            assert level.death_zone_view_index.query(top, bottom) == visible_linear(
+                level.death_zones, top, bottom
+            ), (level_num, top)
+    print("第1～11關的平台與死亡區域都與逐一篩選相同 ✅")
+
+    # 很高的矩形（邊界牆）不影響其他矩形的搜尋範圍
+    rects = [compile_rect({"x": 0, "y": -5000, "width": 10, "height": 10000})] + [
+        compile_rect({"x": 100, "y": y, "width": 50, "height": 20})
+        for y in range(-5000, 5000, 100)
+    ]
+    index = RectRangeIndex(rects)
+    assert index.max_height == 20
+    assert index.query(0, 200) == visible_linear(rects, 0, 200)
+    print("很高的矩形另外檢查 ✅")
+
+
+def test_tall_level_query_cost():
+    print("=== 很高的關卡繪製篩選測試 ===")
+
+    level_1 = LevelManager(tower_file=None).get_compiled_level(1)
+    rng = random.Random(1)
+    # 1000 個畫面高、每個畫面的平台數量與第1關相同
+    platforms = [
+        {
+            "x": rng.randint(10, 1000),
+            "y": screen * SCREEN_HEIGHT + rng.randint(0, SCREEN_HEIGHT),
+            "width": 100,
+            "height": 20,
+        }
+        for screen in range(-1000, 0)
+        for _ in range(len(level_1.platforms))
+    ]
+    tall_level = CompiledLevel(
+        {"platforms": platforms, "death_zones": [], "goal_y": 0, "start_pos": (0, 0)}
+    )
+
+    def frame_cost(level):
+        bounds = level.bounds
+        cameras = [
+            bounds.y + (bounds.height - SCREEN_HEIGHT) * i / 999 for i in range(1000)
+        ]
+        start_time = time.perf_counter()
+        drawn = 0
+        for camera_y in cameras:
+            view_bottom = camera_y + SCREEN_HEIGHT
+            drawn += len(level.platform_view_index.query(camera_y, view_bottom))
+        elapsed = time.perf_counter() - start_time
+        return elapsed / len(cameras) * 1e6, drawn / len(cameras)
+
+    level_1_time, level_1_drawn = frame_cost(level_1)
+    tall_time, tall_drawn = frame_cost(tall_level)
+    print(
+        f"第1關: {level_1_drawn:.1f} 個平台 {level_1_time:.1f} µs/幀；"
+        f"{len(platforms)} 個平台的高塔: {tall_drawn:.1f} 個 {tall_time:.1f} µs/幀"
+    )
+    assert tall_drawn <= level_1_drawn * 2
+    assert tall_time < level_1_time * 5
+    print("很高的關卡每幀只取出畫面內的平台 ✅")
+
+
+if __name__ == "__main__":
+    test_query_matches_linear_scan()
+    test_tall_level_query_cost()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+靜態關卡圖層測試
+確認預先畫好的圖塊貼上後，與每幀逐一繪製牆壁、平台與死亡區域的畫面逐像素相同，
+無限關卡重建範圍後圖塊跟著重畫，且每幀的繪製時間不隨平台數量增加
+"""
+
+import sys
+import os
+import time
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pygame
+from physics import CompiledLevel
+from jumpking import (
+    LevelManager,
+    StaticLevelLayer,
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    DARK_BLUE,
+    GRAY,
+    YELLOW,
+    BROWN,
+    RED,
+)
+
+BLACK_MARKER = (1, 2, 3)  # 沒有被圖塊蓋到的地方會留下這個顏色
+
+
+def draw_rects(screen, level, camera_y):
+    """原本每幀逐一繪製的方式"""
+    screen.fill(DARK_BLUE)
+    wall_width = 10
+    pygame.draw.rect(screen, GRAY, (0, 0, wall_width, SCREEN_HEIGHT))
+    pygame.draw.rect(
+        screen, GRAY, (SCREEN_WIDTH - wall_width, 0, wall_width, SCREEN_HEIGHT)
+    )
+    for platform in level.platforms:
+        x, y, width, height, _, _ = platform
+        goal = y <= level.goal_y and platform in level.goal_platforms
+        color = YELLOW if goal else BROWN
+        pygame.draw.rect(screen, color, (x, y - camera_y, width, height))
+    for x, y, width, height, _, _ in level.death_zones:
+        pygame.draw.rect(screen, RED, (x, y - camera_y, width, height))
+
+
+def assert_same_frame(level, layer, camera_y):
+    expected = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    actual = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    draw_rects(expected, level, camera_y)
+    actual.fill(BLACK_MARKER)
+    layer.draw(actual, camera_y)
+    assert pygame.image.tobytes(actual, "RGB") == pygame.image.tobytes(
+        expected, "RGB"
+    ), f"camera_y={camera_y}"
+
+
+def test_layer_matches_rect_drawing():
+    print("=== 靜態關卡圖層逐像素比對 ===")
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    level_manager = LevelManager(tower_file=None)
+    for level_num in range(1, 12):
+        level = level_manager.get_compiled_level(level_num)
+        layer = StaticLevelLayer(level)
+        prerendered = dict(layer.tiles)
+        assert prerendered
+        bounds = level.bounds
+        for camera_y in range(bounds.y - SCREEN_HEIGHT, bounds.bottom, 97):
+            assert_same_frame(level, layer, camera_y)
+        # 進入關卡時畫好的圖塊一直沿用，不會重畫
+        assert all(layer.tiles[i] is tile for i, tile in prerendered.items())
+    print("第1～11關在各個相機位置都與逐一繪製相同 ✅")
+
+
+def test_layer_follows_streaming_window():
+    print("=== 無限關卡圖層重建測試 ===")
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    level = LevelManager(tower_file=None).get_compiled_level(12)
+    layer = StaticLevelLayer(level)
+    rebuilt = 0
+    for camera_y in range(0, -20000, -173):
+        if level.update_window(camera_y, camera_y + SCREEN_HEIGHT):
+            rebuilt += 1
+        assert_same_frame(level, layer, camera_y)
+        assert len(layer.tiles) <= layer.max_tiles
+    print(f"範圍重建 {rebuilt} 次後畫面仍與逐一繪製相同，圖塊數量有上限 ✅")
+
+
+def test_draw_cost_independent_of_platform_count():
+    print("=== 繪製時間測試 ===")
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    rng = random.Random(0)
+    platforms = [
+        {
+            "x": rng.randint(10, SCREEN_WIDTH - 110),
+            "y": rng.randint(0, SCREEN_HEIGHT * 2),
+            "width": rng.randint(20, 100),
+            "height": 20,
+        }
+        for _ in range(3000)
+    ]
+    level = CompiledLevel(
+        {"platforms": platforms, "death_zones": [], "goal_y": 0, "start_pos": (600, 0)}
+    )
+    layer = StaticLevelLayer(level)
+
+    frames = 50
+    start_time = time.perf_counter()
+    for frame in range(frames):
+        draw_rects(screen, level, frame)
+    rect_time = (time.perf_counter() - start_time) / frames * 1000
+
+    start_time = time.perf_counter()
+    for frame in range(frames):
+        layer.draw(screen, frame)
+    layer_time = (time.perf_counter() - start_time) / frames * 1000
+
+    print(f"3000 個平台: 逐一繪製 {rect_time:.2f} ms/幀，圖層 {layer_time:.2f} ms/幀")
+    assert layer_time < rect_time
+    print("圖層每幀只貼上一兩個圖塊 ✅")
+
+
+if __name__ == "__main__":
+    test_layer_matches_rect_drawing()
+    test_layer_follows_streaming_window()
+    test_draw_cost_independent_of_platform_count()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+連續碰撞檢測測試
+確認高速墜落時不會穿過第12關那種 3 像素厚的薄平台，
+斜向落地時停在撞擊當下的水平位置，且第11關的掉落陷阱仍會在高速落地的那一幀觸發
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import physics
+from jumpking import Player
+
+THIN_PLATFORM = [physics.compile_rect({"x": 400, "y": 300, "width": 8, "height": 3})]
+
+
+def fall_onto_thin_platform(start_x, start_bottom, fall_speed):
+    """讓玩家以指定速度落向薄平台，回傳最後的玩家"""
+    player = Player(start_x, start_bottom - 40)
+    player.on_ground = False
+    player.vel_y = fall_speed - physics.GRAVITY
+
+    grid = physics.PlatformGrid(THIN_PLATFORM)
+    for _ in range(30):
+        player.update(THIN_PLATFORM, [], 12, grid)
+    return player
+
+
+def test_thin_platform_at_max_fall_speed():
+    """最大墜落速度時，平台只蓋住玩家邊緣也要能站上去"""
+    print("=== 最大墜落速度測試 ===")
+    player = fall_onto_thin_platform(380, 296, physics.MAX_FALL_SPEED)
+    print(f"玩家位置: ({player.x:.1f}, {player.y:.1f}) 在地面: {player.on_ground}")
+    assert player.on_ground
+    assert player.y + player.height == THIN_PLATFORM[0].y
+
+
+def test_thin_platform_with_raised_fall_speed():
+    """即使調高墜落速度上限，也不會直接穿過平台"""
+    print("=== 調高墜落速度測試 ===")
+    original_max_fall_speed = physics.MAX_FALL_SPEED
+    physics.MAX_FALL_SPEED = 60
+    try:
+        player = fall_onto_thin_platform(395, 150, 60)
+    finally:
+        physics.MAX_FALL_SPEED = original_max_fall_speed
+    print(f"玩家位置: ({player.x:.1f}, {player.y:.1f}) 在地面: {player.on_ground}")
+    assert player.on_ground
+    assert player.y + player.height == THIN_PLATFORM[0].y
+
+
+def test_diagonal_landing_stays_on_platform():
+    """水平速度很快時，整幀的水平位移會越過平台，落地位置要取撞擊當下的 x"""
+    print("=== 斜向落地測試 ===")
+    platforms = [physics.compile_rect({"x": 400, "y": 300, "width": 20, "height": 3})]
+    player = Player(380, 256)
+    player.on_ground = False
+    player.vel_x = 45
+    player.vel_y = 20 - physics.GRAVITY
+
+    player.update(platforms, [], 12, physics.PlatformGrid(platforms))
+    print(f"玩家位置: ({player.x:.1f}, {player.y:.1f}) 在地面: {player.on_ground}")
+    assert player.on_ground
+    assert player.y + player.height == platforms[0].y
+    assert player.x < platforms[0].right and player.x + player.width > platforms[0].x
+
+
+class AlwaysTrap:
+    """每次擲骰都觸發掉落陷阱"""
+
+    def random(self):
+        return 0.0
+
+
+def test_fall_trap_on_landing_frame():
+    """掉落陷阱判斷撞擊前的墜落速度，高速落地的那一幀也會觸發"""
+    print("=== 第11關落地幀掉落陷阱測試 ===")
+    platforms = [physics.compile_rect({"x": 100, "y": 500, "width": 60, "height": 20})]
+    state = physics.PlayerState(110, 450)  # 本幀腳底從 490 落到 508，越過平台頂部
+    state.on_ground = False
+    state.vel_y = 18 - physics.GRAVITY
+
+    result = physics.update_player(
+        state, platforms, [], 11, physics.PlatformGrid(platforms), rng=AlwaysTrap()
+    )
+    print(f"結果: {result}")
+    assert result == "fall_trap"
+
+
+if __name__ == "__main__":
+    test_thin_platform_at_max_fall_speed()
+    test_thin_platform_with_raised_fall_speed()
+    test_diagonal_landing_stays_on_platform()
+    test_fall_trap_on_landing_frame()
+    print("🎉 連續碰撞檢測測試通過！")
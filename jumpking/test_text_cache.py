@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+文字快取測試
+確認固定文字只光柵化一次、之後每幀命中快取，畫面與直接 font.render 逐像素相同，
+超過上限時移除最久沒用到的文字
+"""
+
+import sys
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pygame
+from jumpking import Game, TextCache, MENU, LEVEL_SELECT, PLAYING, VICTORY, WHITE
+
+
+def test_lru_eviction():
+    print("=== 文字快取 LRU 測試 ===")
+    pygame.init()  # 其他測試結束時可能已經 pygame.quit()
+    pygame.display.set_mode((100, 100))
+    font = pygame.font.Font(None, 24)
+    cache = TextCache(max_size=2)
+
+    first = cache.render(font, "a", True, WHITE)
+    assert cache.render(font, "a", True, WHITE) is first
+    assert cache.stats() == (1, 1, 1)
+
+    # 顏色、反鋸齒或字體不同都是不同的文字
+    assert cache.render(font, "a", False, WHITE) is not first
+    cache.render(font, "a", True, WHITE)  # "a" 變成最近用過的
+    cache.render(font, "b", True, WHITE)
+    assert cache.render(font, "a", True, WHITE) is first
+    assert (font, "a", False, WHITE, None) not in cache.surfaces
+    assert len(cache.surfaces) == 2
+
+    rendered = cache.render(font, "中文", True, WHITE)
+    expected = font.render("中文", True, WHITE)
+    assert pygame.image.tobytes(rendered, "RGBA") == pygame.image.tobytes(
+        expected, "RGBA"
+    )
+    print("命中、未命中與淘汰順序正確，快取的文字與直接繪製相同 ✅")
+
+
+def test_static_text_rendered_once():
+    print("=== 每幀文字光柵化次數測試 ===")
+    pygame.init()
+    game = Game()
+    game.start_level(1)
+
+    for state in (MENU, LEVEL_SELECT, PLAYING, VICTORY):
+        game.state = state
+        game.draw()
+        hits, misses, _ = game.text_cache.stats()
+        for _ in range(10):
+            game.draw()
+        new_hits, new_misses, _ = game.text_cache.stats()
+        # 畫面沒有變化時，之後的每一幀都不再光柵化任何文字
+        assert new_misses == misses, (state, new_misses - misses)
+        assert new_hits > hits
+        print(f"狀態 {state}: 每幀 {(new_hits - hits) // 10} 段文字全部命中快取 ✅")
+
+    # 重新載入字體時清空快取
+    game.load_fonts()
+    assert game.text_cache.stats()[2] == 0
+    print("重新載入字體後快取清空 ✅")
+
+
+if __name__ == "__main__":
+    test_lru_eviction()
+    test_static_text_rendered_once()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Jump King 無限之塔生成
+每一段的平台與死亡區域只由（世界種子, 段數）決定，使用各自的亂數產生器，
+不會動到全域的 random，可以任意順序、平行生成
+不依賴 pygame，可以直接當成命令列工具預先烘焙很高的塔：
+
+    python tower.py bake --seed 7 --segments 5000 --output tower_7.json
+    python tower.py stats tower_7.json tower_8.json
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+TOWER_SEGMENT_HEIGHT = 200  # 每個分段的高度間隔
+DEFAULT_TOWER_SEED = 0  # 預設的世界種子，與原本用 random.seed(段數) 生成的塔相同
+WORLD_SEED_STRIDE = 1 << 32  # 不同世界種子的亂數種子間隔，避免互相重疊
+DEATH_ZONE_SEED_OFFSET = 1000  # 死亡區域使用不同的種子，避免和平台重疊
+
+TOWER_FILE_VERSION = 1
+BAKE_CHUNK_SIZE = 256  # 每個工作行程一次生成的分段數量
+
+
+def segment_rng(world_seed, segment_num, offset=0):
+    """第 segment_num 段專用的亂數產生器"""
+    return random.Random(world_seed * WORLD_SEED_STRIDE + segment_num + offset)
+
+
+def generate_platforms_segment(world_seed, segment_num):
+    """生成一個階段的平台"""
+    rng = segment_rng(world_seed, segment_num)
+    base_y = -segment_num * TOWER_SEGMENT_HEIGHT
+
+    platforms = []
+    platform_spacing = TOWER_SEGMENT_HEIGHT  # 每個段落的高度間隔
+
+    # 根據段數調整難度
+    difficulty = min(segment_num, 10)  # 最大難度為10
+    platform_size = max(8, 20 - difficulty)  # 平台大小隨難度減小
+    platform_height = max(3, 8 - difficulty // 2)  # 平台高度隨難度減小
+
+    # 每個段落生成6-8個平台
+    num_platforms = rng.randint(6, 8)
+
+    for i in range(num_platforms):
+        # 計算平台位置
+        x = rng.randint(50, 750)
+        y = base_y + i * (platform_spacing // num_platforms)
+
+        # 添加一些隨機偏移讓路線更有趣
+        x_offset = rng.randint(-50, 50)
+        y_offset = rng.randint(-20, 20)
+
+        x = max(50, min(750, x + x_offset))
+        y = y + y_offset
+
+        platforms.append(
+            {"x": x, "y": y, "width": platform_size, "height": platform_height}
+        )
+
+    return platforms
+
+
+def generate_death_zones_segment(world_seed, segment_num):
+    """生成一個階段的死亡區域"""
+    rng = segment_rng(world_seed, segment_num, DEATH_ZONE_SEED_OFFSET)
+    base_y = -segment_num * TOWER_SEGMENT_HEIGHT
+
+    death_zones = []
+
+    # 根據段數調整陷阱密度
+    difficulty = min(segment_num, 10)
+    num_traps = difficulty + 2  # 陷阱數量隨難度增加
+
+    for i in range(num_traps):
+        # 隨機放置陷阱
+        x = rng.randint(100, 700)
+        y = base_y + rng.randint(-100, 100)
+        width = rng.randint(5, 15)
+        height = rng.randint(50, 150)
+
+        death_zones.append({"x": x, "y": y, "width": width, "height": height})
+
+    return death_zones
+
+
+def generate_segment(world_seed, segment_num):
+    """第 segment_num 段的 (平台列表, 死亡區域列表)"""
+    return (
+        generate_platforms_segment(world_seed, segment_num),
+        generate_death_zones_segment(world_seed, segment_num),
+    )
+
+
+def generate_segments(world_seed, first_segment, count):
+    """生成連續的多段（烘焙時每個工作行程的工作單位）"""
+    return [
+        generate_segment(world_seed, segment_num)
+        for segment_num in range(first_segment, first_segment + count)
+    ]
+
+
+class TowerFile:
+    """預先烘焙的塔：第 1 段起連續的分段，超出檔案範圍的分段依同一個種子即時生成"""
+
+    def __init__(self, seed, segments):
+        self.seed = seed
+        self.segments = segments
+
+    def segment(self, segment_num):
+        """第 segment_num 段的 (平台列表, 死亡區域列表)"""
+        if 1 <= segment_num <= len(self.segments):
+            return self.segments[segment_num - 1]
+        return generate_segment(self.seed, segment_num)
+
+    def to_dict(self):
+        # 矩形存成 [x, y, width, height]，檔案小很多
+        return {
+            "version": TOWER_FILE_VERSION,
+            "seed": self.seed,
+            "segment_height": TOWER_SEGMENT_HEIGHT,
+            "segments": [
+                [
+                    [[r["x"], r["y"], r["width"], r["height"]] for r in platforms],
+                    [[r["x"], r["y"], r["width"], r["height"]] for r in death_zones],
+                ]
+                for platforms, death_zones in self.segments
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data["version"] != TOWER_FILE_VERSION:
+            raise ValueError(f"不支援的塔檔案版本: {data['version']}")
+        if data["segment_height"] != TOWER_SEGMENT_HEIGHT:
+            raise ValueError(f"分段高度不符: {data['segment_height']}")
+
+        def rects(values):
+            return [
+                {"x": x, "y": y, "width": width, "height": height}
+                for x, y, width, height in values
+            ]
+
+        return cls(
+            data["seed"],
+            [(rects(platforms), rects(zones)) for platforms, zones in data["segments"]],
+        )
+
+
+def load_tower_file(path):
+    """讀取烘焙好的塔檔案"""
+    with open(path, "r", encoding="utf-8") as f:
+        return TowerFile.from_dict(json.load(f))
+
+
+def bake_tower(world_seed, segment_count, workers=None):
+    """用行程池平行生成第 1 段到第 segment_count 段"""
+    chunks = [
+        (first, min(BAKE_CHUNK_SIZE, segment_count - first + 1))
+        for first in range(1, segment_count + 1, BAKE_CHUNK_SIZE)
+    ]
+    segments = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(generate_segments, world_seed, first, count)
+            for first, count in chunks
+        ]
+        for future in futures:
+            segments.extend(future.result())
+    return TowerFile(world_seed, segments)
+
+
+def tower_stats(tower_file):
+    """整理塔的統計資料，方便比較不同種子"""
+    segments = tower_file.segments
+    platforms = [p for segment_platforms, _ in segments for p in segment_platforms]
+    death_zones = [z for _, segment_zones in segments for z in segment_zones]
+
+    # 相鄰平台之間最大的垂直落差（越大越難往上跳）
+    tops = sorted(p["y"] for p in platforms)
+    max_gap = max((b - a for a, b in zip(tops, tops[1:])), default=0)
+
+    return {
+        "seed": tower_file.seed,
+        "segments": len(segments),
+        "height": len(segments) * TOWER_SEGMENT_HEIGHT,
+        "platforms": len(platforms),
+        "death_zones": len(death_zones),
+        "max_vertical_gap": max_gap,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="無限之塔烘焙工具")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    bake = commands.add_parser("bake", help="平行生成分段並寫入塔檔案")
+    bake.add_argument("--seed", type=int, default=DEFAULT_TOWER_SEED, help="世界種子")
+    bake.add_argument("--segments", type=int, default=1000, help="分段數量")
+    bake.add_argument("--workers", type=int, default=None, help="工作行程數量")
+    bake.add_argument("--output", required=True, help="輸出的塔檔案")
+
+    stats = commands.add_parser("stats", help="比較塔檔案的統計資料")
+    stats.add_argument("files", nargs="+", help="塔檔案")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "bake":
+        start_time = time.perf_counter()
+        tower_file = bake_tower(args.seed, args.segments, args.workers)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(tower_file.to_dict(), f, separators=(",", ":"))
+        elapsed = time.perf_counter() - start_time
+        size = os.path.getsize(args.output) / 1024
+        print(
+            f"已烘焙種子 {args.seed} 的 {args.segments} 段 → {args.output}"
+            f"（{size:.0f} KB，{elapsed:.2f} 秒）"
+        )
+    else:
+        print(f"{'種子':>8} {'分段':>7} {'高度':>9} {'平台':>7} {'死亡區域':>7} {'最大落差':>7}")
+        for path in args.files:
+            info = tower_stats(load_tower_file(path))
+            print(
+                f"{info['seed']:>8} {info['segments']:>7} {info['height']:>9}"
+                f" {info['platforms']:>7} {info['death_zones']:>7}"
+                f" {info['max_vertical_gap']:>7}"
+            )
+
+
+if __name__ == "__main__":
+    sys.exit(main())